@@ -9,3 +9,5 @@ from dotenv import load_dotenv
 __version__ = "0.6.0"
 load_dotenv()  # Load environment variables from .env file (if exists)
 SHOW_LOCALS = os.getenv("REFLEKT_SHOW_LOCALS") == "true"
+# How Project() finds reflekt_project.yml: 'scan' (whole Git repo) or 'walk' (parents)
+PROJECT_DISCOVERY = os.getenv("REFLEKT_PROJECT_DISCOVERY", "scan")
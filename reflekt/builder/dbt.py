@@ -15,10 +15,10 @@ import yaml
 from inflection import titleize, underscore
 from loguru import logger
 
+from reflekt.catalog import SchemaCatalog
 from reflekt.dumper import ReflektYamlDumper
 from reflekt.flatson import Flatson
 from reflekt.profile import Profile
-from reflekt.project import Project
 from reflekt.warehouse import Warehouse
 
 
@@ -35,6 +35,7 @@ class DbtBuilder:
         sdk_arg: str,
         source_arg: str,
         profile: Profile,
+        catalog: Optional[SchemaCatalog] = None,
     ) -> None:
         """Initialize dbt builder class.
 
@@ -44,9 +45,12 @@ class DbtBuilder:
             sdk_arg (str): The --sdk argument passed to Reflekt CLI.
             source_arg (str): The --source argument passed to Reflekt CLI.
             profile (Profile): Reflekt Profile object.
+            catalog (Optional[SchemaCatalog]): Catalog used to load schemas. If
+                None, a new catalog is created for the profile's project.
         """
         self.profile = profile
-        self.project = Project()
+        self.project = profile.project
+        self.catalog = catalog if catalog is not None else SchemaCatalog(self.project)
         self.pkg_name = underscore(self.project.name)
         self.pkg_dir = self.project.dir / "artifacts" / "dbt" / self.pkg_name
         self.tmp_pkg_dir = (
@@ -542,12 +546,9 @@ class DbtBuilder:
         self._filter = models_config.get("filter", None)
 
         # Iterate through all schemas to build artifacts
-        for schema_path in self.schema_paths:
+        for schema_path, schema_json in self.catalog.iter_load(self.schema_paths):
             logger.info(f"Building dbt artifacts for schema: {schema_path}")
 
-            with schema_path.open("r") as f:
-                schema_json = json.load(f)
-
             schema_id = schema_json["$id"]
             event_name = schema_json["self"]["name"]
             event_desc = schema_json["description"]
@@ -567,7 +568,7 @@ class DbtBuilder:
                     "name": underscore(field.name.replace(".", "_")),
                     "description": field.schema["description"],
                 }
-                for field in Flatson.from_schemafile(schema_path).fields
+                for field in Flatson(schema_json).fields
             ]
             columns_to_search = common_columns + schema_columns
             columns, warehouse_error = self.warehouse.find_columns(
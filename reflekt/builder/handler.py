@@ -4,15 +4,15 @@
 
 from __future__ import annotations
 
-import os
 from pathlib import Path
+from typing import Optional
 
 from loguru import logger
 
 from reflekt.builder.dbt import DbtBuilder
+from reflekt.catalog import SchemaCatalog
 from reflekt.errors import SelectArgError
 from reflekt.profile import Profile
-from reflekt.project import Project
 
 
 class BuilderHandler:
@@ -28,6 +28,7 @@ class BuilderHandler:
         sdk_arg: str,
         source_arg: str,
         profile: Profile,
+        catalog: Optional[SchemaCatalog] = None,
     ) -> None:
         """Initialize BuilderHandler class.
 
@@ -37,13 +38,18 @@ class BuilderHandler:
             sdk_arg (str): The --sdk argument passed to Reflekt CLI.
             source_arg (str): The --source argument passed to Reflekt CLI.
             profile (Profile): Reflekt Profile object.
+            catalog (Optional[SchemaCatalog]): Catalog of the project's schemas. If
+                None, a new catalog is created for the profile's project.
         """
+        self.profile = profile
+        self.catalog = (
+            catalog if catalog is not None else SchemaCatalog(profile.project)
+        )
         self.select_arg = select_arg
         self.artifact_arg = self._parse_artifact(artifact_arg)
         self.schema_paths = self._parse_select(select_arg)
         self.sdk_arg = sdk_arg
         self.source_arg = source_arg
-        self.profile = profile
 
     def _parse_artifact(self, artifact: str) -> None:
         """Parse the artifact argument.
@@ -74,26 +80,15 @@ class BuilderHandler:
         Returns:
             list[Path]: list of schemas to build.
         """
-        schema_paths = []  # list of schema paths to pull
-        project = Project()
-        select_path = project.dir / "schemas" / select
-        logger.info(f"Searching for JSON schemas in: {str(select_path)}")
+        schema_paths = self.catalog.select(select)
 
-        if not select_path.exists():
+        if not schema_paths:
             raise SelectArgError(
-                f"--select arg '{select_path}' does not point to a valid schema or "
-                f"directory of schemas.",
+                f"--select arg '{self.catalog.schemas_dir / select}' does not point to "
+                f"a valid schema or directory of schemas.",
                 select,
             )
 
-        if select_path.is_dir():  # Get all schemas in directory
-            for root, _, files in os.walk(select_path):
-                for file in files:
-                    if file.endswith(".json"):
-                        schema_paths.append(Path(root) / file)
-        else:  # Get single schema file
-            schema_paths.append(select_path)
-
         logger.info(f"Found {len(schema_paths)} schemas to build")
 
         return schema_paths
@@ -109,6 +104,7 @@ class BuilderHandler:
             builder = DbtBuilder(
                 select_arg=self.select_arg,
                 schema_paths=self.schema_paths,
+                catalog=self.catalog,
                 sdk_arg=self.sdk_arg,
                 source_arg=self.source_arg,
                 profile=self.profile,
@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: 2022 Gregory Clunies <greg@reflekt-ci.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import json
+import os
+import secrets
+import stat
+from pathlib import Path
+from typing import Optional
+
+CACHE_DIR_NAME = ".reflekt_cache"
+_O_BINARY = getattr(os, "O_BINARY", 0)  # No newline translation on Windows
+
+
+def get_cache_dir(root: Path) -> Path:
+    """Get the .reflekt_cache directory for a project (or repo) root.
+
+    Args:
+        root (Path): Directory containing the .reflekt_cache directory.
+
+    Returns:
+        Path: Path to the .reflekt_cache directory.
+    """
+    return root / CACHE_DIR_NAME
+
+
+def read_json(path: Path) -> Optional[dict]:
+    """Read a JSON cache file.
+
+    A missing, unreadable, or corrupt cache file is treated as a cache miss.
+
+    Args:
+        path (Path): Path to the cache file.
+
+    Returns:
+        Optional[dict]: Cached data, or None if the cache could not be read.
+    """
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    return data if isinstance(data, dict) else None
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Atomically write bytes to a file (temp file + rename).
+
+    Readers never see a partially written file, and a failed write leaves the
+    previous file in place. The file keeps its permissions, or gets the default
+    permissions for new files.
+
+    Args:
+        path (Path): Path to the file.
+        data (bytes): Data to write.
+
+    Raises:
+        OSError: The file could not be written.
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    while True:
+        tmp_path = path.parent / f".{path.name}.{secrets.token_hex(4)}"
+
+        try:  # Like open(), the kernel applies the umask to new files
+            fd = os.open(
+                tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | _O_BINARY, 0o666
+            )
+            break
+        except FileExistsError:
+            continue
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def write_bytes(path: Path, data: bytes) -> None:
+    """Atomically write bytes to a cache file (temp file + rename).
+
+    Readers never see a partially written file. Errors are ignored since the cache
+    is an optimization and Reflekt must still work on read-only file systems.
+
+    Args:
+        path (Path): Path to the cache file.
+        data (bytes): Data to write.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, data)
+    except OSError:
+        pass
+
+
+def write_json(path: Path, data: dict) -> None:
+    """Atomically write a JSON cache file.
+
+    Args:
+        path (Path): Path to the cache file.
+        data (dict): Data to write.
+    """
+    write_bytes(path, json.dumps(data, separators=(",", ":")).encode("utf-8"))
@@ -2,23 +2,42 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+from __future__ import annotations
+
+import functools
+import re
+from typing import Callable, Iterable, Optional
+
 from inflection import camelize, titleize, underscore
 
-from reflekt.project import Project
+from reflekt.project import Project, get_project
 
+# Strings that fully match these patterns are unchanged by _convert_case(), so they
+# can be accepted without running the (slower) inflection conversions
+CASE_PATTERNS = {
+    "snake": re.compile(r"[a-z0-9]+(?:_[a-z0-9]+)*"),
+    "camel": re.compile(r"[a-z][a-zA-Z0-9]*"),
+    "pascal": re.compile(r"[A-Z][a-zA-Z0-9]*"),
+    "title": re.compile(r"[A-Z][a-z]*(?: [A-Z][a-z]*)*"),
+    "any": re.compile(r".*", re.DOTALL),
+}
+DIGITS = re.compile(r"\d")
+DEFAULT_CASE_CACHE_SIZE = 4096  # Names per converter, least recently used dropped
 
-def event_case(string: str) -> str:
-    """Convert event name to case specified in reflekt_project.yml.
+
+def _convert_case(string: str, convention: dict) -> str:
+    """Convert string to the casing in a naming convention from reflekt_project.yml.
 
     Args:
         string (str): String to be converted.
+        convention (dict): The 'event' or 'property' naming convention.
 
     Returns:
         str: Converted string.
     """
-    project = Project()
-    case = project.conventions["event"]["casing"]
-    numbers = project.conventions["event"]["numbers"]
+    case = convention["casing"]
+    numbers = convention["numbers"]
+
     if case == "snake":
         fmt_string = underscore(string).replace(" ", "_")
     elif case == "camel":
@@ -31,35 +50,150 @@ def event_case(string: str) -> str:
         fmt_string = string
 
     if numbers:
-        fmt_string = "".join(char for char in fmt_string if not char.isdigit())
+        fmt_string = DIGITS.sub("", fmt_string)
 
     return fmt_string
 
 
-def property_case(string: str) -> str:
+class CaseConverter:
+    """Converts names to the casing in a naming convention, memoizing results.
+
+    The inflection conversions are regex heavy, and the same event and property
+    names are converted many times (property names repeat across hundreds of
+    events). Results are kept in a bounded LRU cache.
+    """
+
+    def __init__(
+        self, convention: dict, maxsize: Optional[int] = DEFAULT_CASE_CACHE_SIZE
+    ) -> None:
+        """Initialize CaseConverter.
+
+        Args:
+            convention (dict): The 'event' or 'property' naming convention.
+            maxsize (Optional[int]): Maximum number of names memoized. Defaults to
+                DEFAULT_CASE_CACHE_SIZE. None for no limit.
+        """
+        self.casing = convention["casing"]
+        self.numbers = convention["numbers"]
+        self._pattern = CASE_PATTERNS[self.casing]
+        self.convert: Callable[[str], str] = functools.lru_cache(maxsize=maxsize)(
+            functools.partial(
+                _convert_case,
+                convention={"casing": self.casing, "numbers": self.numbers},
+            )
+        )
+
+    def convert_many(self, strings: Iterable[str]) -> list[str]:
+        """Convert a batch of strings, converting each distinct string once.
+
+        Args:
+            strings (Iterable[str]): Strings to be converted.
+
+        Returns:
+            list[str]: Converted strings, in the same order.
+        """
+        converted: dict[str, str] = {}
+        convert = self.convert
+
+        return [
+            converted[string]
+            if string in converted
+            else converted.setdefault(string, convert(string))
+            for string in strings
+        ]
+
+    def is_case(self, string: str) -> bool:
+        """Check that a string already follows the naming convention.
+
+        Gives the same result as `string == self.convert(string)`, but accepts
+        conforming strings with a precompiled regex. Only strings that do not match
+        the regex fall back to the (memoized) conversion.
+
+        Args:
+            string (str): String to check.
+
+        Returns:
+            bool: True if the string is in case.
+        """
+        if self._pattern.fullmatch(string) and not (
+            self.numbers and DIGITS.search(string)
+        ):
+            return True
+
+        return string == self.convert(string)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_case_converter(casing: str, numbers: bool) -> CaseConverter:
+    """Get the shared converter for a casing and numbers setting.
+
+    Args:
+        casing (str): Casing from a naming convention.
+        numbers (bool): Numbers setting from a naming convention.
+
+    Returns:
+        CaseConverter: Converter shared by the current process.
+    """
+    return CaseConverter({"casing": casing, "numbers": numbers})
+
+
+def get_case_converter(convention: dict) -> CaseConverter:
+    """Get the converter for a naming convention, shared by the current process.
+
+    Converters are keyed on the convention's settings, not the dict, so edits to
+    project.conventions are picked up.
+
+    Args:
+        convention (dict): The 'event' or 'property' naming convention.
+
+    Returns:
+        CaseConverter: Converter with a memo shared across calls.
+    """
+    return _get_case_converter(convention["casing"], convention["numbers"])
+
+
+def event_case(string: str, project: Optional[Project] = None) -> str:
+    """Convert event name to case specified in reflekt_project.yml.
+
+    Args:
+        string (str): String to be converted.
+        project (Optional[Project]): Reflekt project with the naming conventions.
+            Defaults to the project shared by the current process.
+
+    Returns:
+        str: Converted string.
+    """
+    project = project if project is not None else get_project()
+
+    return get_case_converter(project.conventions["event"]).convert(string)
+
+
+def property_case(string: str, project: Optional[Project] = None) -> str:
     """Convert property name to case specified in reflekt_project.yml.
 
     Args:
         string (str): String to be converted.
+        project (Optional[Project]): Reflekt project with the naming conventions.
+            Defaults to the project shared by the current process.
 
     Returns:
         str: Converted string.
     """
-    project = Project()
-    case = project.conventions["property"]["casing"]
-    numbers = project.conventions["property"]["numbers"]
-    if case == "snake":
-        fmt_string = underscore(string).replace(" ", "_")
-    elif case == "camel":
-        fmt_string = camelize(string, uppercase_first_letter=False).replace(" ", "")
-    elif case == "pascal":
-        fmt_string = camelize(string, uppercase_first_letter=True).replace(" ", "")
-    elif case == "title":
-        fmt_string = titleize(string)
-    elif case == "any":
-        fmt_string = string
+    project = project if project is not None else get_project()
 
-    if numbers:
-        fmt_string = "".join(char for char in fmt_string if not char.isdigit())
+    return get_case_converter(project.conventions["property"]).convert(string)
 
-    return fmt_string
+
+def compile_case_check(convention: dict) -> Callable[[str], bool]:
+    """Compile a check that a string already follows a naming convention.
+
+    The check gives the same result as `string == _convert_case(string, convention)`
+    (see CaseConverter.is_case).
+
+    Args:
+        convention (dict): The 'event' or 'property' naming convention.
+
+    Returns:
+        Callable[[str], bool]: Function returning True if a string is in case.
+    """
+    return get_case_converter(convention).is_case
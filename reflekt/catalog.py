@@ -0,0 +1,509 @@
+# SPDX-FileCopyrightText: 2022 Gregory Clunies <greg@reflekt-ci.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import bisect
+import collections
+import hashlib
+import json
+import marshal
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional
+
+from loguru import logger
+
+from reflekt import __version__
+from reflekt.cache import get_cache_dir, write_bytes
+from reflekt.errors import ChangedSinceArgError
+from reflekt.project import Project
+
+PARSE_CACHE_FORMAT = 1  # Bump when the layout of the parse cache changes
+DEFAULT_LOAD_THREADS = min(8, (os.cpu_count() or 1) + 4)
+
+
+class SchemaCatalog:
+    """Reflekt schema catalog class.
+
+    In-memory index of the JSON schemas in a Reflekt project's schemas/ directory.
+    The directory is scanned once and each schema file is parsed at most once, no
+    matter how many times (or by how many commands) it is selected or loaded.
+
+    Parsed schemas are also kept in a persistent cache (.reflekt_cache/schemas.bin)
+    so unchanged files skip JSON decoding in later runs. A cached schema is reused
+    if the file's mtime and size are unchanged, or, if they changed, its content
+    hash is unchanged. The whole cache is discarded when the reflekt version, the
+    Python version, or the conventions in reflekt_project.yml change.
+
+    Schemas are read and parsed by a bounded thread pool, so file I/O overlaps with
+    the work done on schemas that are already loaded.
+
+    If changed_since is set, select() only returns schemas that changed since that
+    Git ref. All selected schemas count as changed if reflekt_project.yml or the
+    Reflekt meta-schema (schemas/.reflekt/) changed.
+    """
+
+    def __init__(
+        self,
+        project: Project,
+        use_cache: bool = True,
+        threads: Optional[int] = None,
+        changed_since: Optional[str] = None,
+    ) -> None:
+        """Initialize Reflekt schema catalog.
+
+        Args:
+            project (Project): Reflekt project object.
+            use_cache (bool): Whether to use the persistent parse cache in
+                .reflekt_cache/. Defaults to True.
+            threads (Optional[int]): Number of threads used to load schemas. 1 loads
+                schemas sequentially. Defaults to DEFAULT_LOAD_THREADS.
+            changed_since (Optional[str]): Git ref. If set, only schemas changed
+                since this ref are selected. Defaults to None (all schemas).
+        """
+        self.project = project
+        self.schemas_dir: Path = project.dir / "schemas"
+        self._prefix = os.path.join(str(self.schemas_dir), "")  # With trailing sep
+        self.use_cache = use_cache
+        self.threads = max(1, threads if threads is not None else DEFAULT_LOAD_THREADS)
+        self.changed_since = changed_since
+        self._changed_keys: Optional[set[str]] = None
+        self._keys: Optional[list[str]] = None  # Sorted schema paths, rel. to schemas/
+        self._schemas: dict[str, dict] = {}  # Parsed schemas by key
+        self._digests: dict[str, str] = {}  # Content hash (sha256) by key
+        self._index: Optional[dict[str, dict[str, list[str]]]] = None
+        self._cache_path: Path = get_cache_dir(project.dir) / "schemas.bin"
+        self._cache: Optional[dict[str, tuple]] = None  # (mtime, size, hash, schema)
+        self._cache_dirty = False
+
+    @property
+    def keys(self) -> list[str]:
+        """Sorted schema paths (relative to schemas/) found in the project.
+
+        Returns:
+            list[str]: Schema keys, e.g. 'jaffle_shop/Cart_Viewed/1-0.json'.
+        """
+        if self._keys is None:
+            self._keys = self._scan()
+
+        return self._keys
+
+    def _scan(self) -> list[str]:
+        """Find all JSON schemas in schemas/, skipping hidden dirs like .reflekt/.
+
+        Returns:
+            list[str]: Sorted schema keys.
+        """
+        keys = []
+
+        # Plain string paths, pathlib is too slow for thousands of schemas
+        for root, dirs, files in os.walk(self.schemas_dir):
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            rel_root = root[len(self._prefix) :].replace(os.sep, "/")
+
+            for file in files:
+                if file.endswith(".json"):
+                    keys.append(f"{rel_root}/{file}" if rel_root else file)
+
+        return sorted(keys)
+
+    def key(self, schema_path: Path) -> str:
+        """Get the catalog key for a schema path.
+
+        Args:
+            schema_path (Path): Absolute path to a schema file.
+
+        Returns:
+            str: Schema key, relative to schemas/.
+        """
+        path = os.fspath(schema_path)
+
+        if path.startswith(self._prefix):  # Fast path, avoids Path.relative_to()
+            return path[len(self._prefix) :].replace(os.sep, "/")
+
+        return Path(schema_path).relative_to(self.schemas_dir).as_posix()
+
+    def path(self, key: str) -> Path:
+        """Get the absolute path for a schema key.
+
+        Args:
+            key (str): Schema key, relative to schemas/.
+
+        Returns:
+            Path: Absolute path to the schema file.
+        """
+        return self.schemas_dir / key
+
+    def select(self, select: str) -> list[Path]:
+        """Resolve a --select argument to schema paths using the catalog index.
+
+        Args:
+            select (str): The --select argument (cleaned, without 'schemas/').
+
+        Returns:
+            list[Path]: Sorted paths of the selected schemas.
+        """
+        select = select.strip().strip("/")
+
+        if select.endswith(".json"):
+            select = select[: -len(".json")]
+
+        logger.info(f"Searching for JSON schemas in: {str(self.schemas_dir / select)}")
+        keys = self.keys
+
+        if select == "":  # All schemas
+            selected = keys
+        else:
+            file_key = f"{select}.json"
+            i = bisect.bisect_left(keys, file_key)
+
+            if i < len(keys) and keys[i] == file_key:  # Single schema
+                selected = [file_key]
+            else:  # All schemas in a directory
+                prefix = f"{select}/"
+                start = bisect.bisect_left(keys, prefix)
+                end = start
+
+                while end < len(keys) and keys[end].startswith(prefix):
+                    end += 1
+
+                selected = keys[start:end]
+
+        if self.changed_since is not None:
+            changed_keys = self.changed_keys()
+            selected = [key for key in selected if key in changed_keys]
+            logger.info(
+                f"Selected {len(selected)} schema(s) changed since "
+                f"'{self.changed_since}'"
+            )
+
+        return [self.path(key) for key in selected]
+
+    def changed_keys(self) -> set[str]:
+        """Get the schemas changed since the changed_since Git ref (once per catalog).
+
+        Changes are committed, staged, and unstaged changes since the merge base of
+        changed_since and HEAD, plus untracked files (like a PR diff).
+
+        Raises:
+            ChangedSinceArgError: The ref could not be resolved, or the project is
+                not in a Git repository.
+
+        Returns:
+            set[str]: Keys of changed schemas. All keys if reflekt_project.yml or the
+                meta-schema changed.
+        """
+        if self._changed_keys is None:
+            # GitPython is slow to import and only needed for --changed-since
+            from git import Repo
+            from git.exc import GitError
+
+            try:
+                repo = Repo(self.project.dir, search_parent_directories=True)
+                changed = repo.git.diff(
+                    "--name-only", "--no-renames", "--merge-base", self.changed_since
+                ).splitlines()
+                changed += repo.untracked_files
+            except GitError as e:
+                raise ChangedSinceArgError(
+                    message=(
+                        f"Could not get schemas changed since '{self.changed_since}'. "
+                        f"--changed-since must be a Git ref (branch, tag, or commit) "
+                        f"in the repo containing the Reflekt project.\n\n{e}"
+                    ),
+                    changed_since=self.changed_since,
+                )
+
+            repo_dir = Path(repo.working_tree_dir).resolve()
+            schemas_dir = self.schemas_dir.resolve()
+            changed_paths = {repo_dir / path for path in changed}
+
+            if self.project.path.resolve() in changed_paths or any(
+                schemas_dir / ".reflekt" in path.parents for path in changed_paths
+            ):
+                logger.info(
+                    f"Reflekt project config or meta-schema changed since "
+                    f"'{self.changed_since}', treating all schemas as changed"
+                )
+                self._changed_keys = set(self.keys)
+            else:
+                self._changed_keys = {
+                    path.relative_to(schemas_dir).as_posix()
+                    for path in changed_paths
+                    if path.suffix == ".json" and schemas_dir in path.parents
+                }
+
+        return self._changed_keys
+
+    def _cache_key(self) -> str:
+        """Get the key that invalidates the whole parse cache when it changes.
+
+        Returns:
+            str: Hex digest of reflekt version, Python version, and conventions.
+        """
+        conventions = json.dumps(self.project.conventions, sort_keys=True)
+        key = (
+            f"{PARSE_CACHE_FORMAT}|{__version__}|{sys.version_info[0]}."
+            f"{sys.version_info[1]}|{conventions}"
+        )
+
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _read_cache(self) -> dict[str, tuple]:
+        """Read the persistent parse cache (once per catalog).
+
+        Returns:
+            dict[str, tuple]: Cache entries by schema key.
+        """
+        if self._cache is None:
+            self._cache = {}
+
+            if self.use_cache:
+                try:
+                    data = marshal.loads(self._cache_path.read_bytes())
+                except (OSError, EOFError, ValueError, TypeError):
+                    data = None  # Missing or corrupt cache
+
+                if isinstance(data, dict) and data.get("key") == self._cache_key():
+                    self._cache = data["entries"]
+
+        return self._cache
+
+    def save(self) -> None:
+        """Write the persistent parse cache if schemas were parsed since last save.
+
+        Entries for schema files that no longer exist are dropped.
+        """
+        if not self.use_cache or not self._cache_dirty:
+            return
+
+        keys = set(self.keys)
+        entries = {k: v for k, v in self._read_cache().items() if k in keys}
+        write_bytes(
+            self._cache_path,
+            marshal.dumps({"key": self._cache_key(), "entries": entries}),
+        )
+        self._cache_dirty = False
+
+    def _parse(self, key: str) -> tuple[dict, str]:
+        """Parse a schema file, reusing the persistent cache if it is unchanged.
+
+        Args:
+            key (str): Schema key, relative to schemas/.
+
+        Returns:
+            tuple[dict, str]: The parsed JSON schema and its content hash.
+        """
+        path = self._prefix + key
+        stat = os.stat(path)
+        cached = self._read_cache().get(key) if self.use_cache else None
+
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[3], cached[2]  # Unchanged file, skip read and decode
+
+        with open(path, "rb") as f:
+            content = f.read()
+
+        digest = hashlib.sha256(content).hexdigest()
+
+        if cached is not None and cached[2] == digest:  # Touched, but same content
+            schema = cached[3]
+        else:
+            schema = json.loads(content)
+
+        if self.use_cache:
+            self._cache[key] = (stat.st_mtime_ns, stat.st_size, digest, schema)
+            self._cache_dirty = True
+
+        return schema, digest
+
+    def load(self, schema_path: Path) -> dict:
+        """Load a schema, parsing the file only the first time it is requested.
+
+        Each call returns a new copy, so callers can change it without changing
+        the schema kept in memory or written to the persistent parse cache.
+
+        Args:
+            schema_path (Path): Path to the schema file.
+
+        Returns:
+            dict: The parsed JSON schema.
+        """
+        key = self.key(schema_path)
+        schema = self._schemas.get(key)
+
+        if schema is None:
+            schema, self._digests[key] = self._parse(key)
+            self._schemas[key] = schema
+
+        # A marshal round trip is a deep copy of JSON data, ~4x faster than deepcopy
+        return marshal.loads(marshal.dumps(schema))
+
+    def iter_load(self, schema_paths: list[Path]) -> Iterator[tuple[Path, dict]]:
+        """Load schemas in a thread pool, yielding them in the order given.
+
+        At most 2x threads schemas are loaded ahead of the caller, which bounds
+        memory use while the caller works on the schemas already yielded. The
+        persistent parse cache is saved once all schemas have been yielded.
+
+        Args:
+            schema_paths (list[Path]): Paths to the schema files.
+
+        Yields:
+            tuple[Path, dict]: Schema path and the parsed JSON schema.
+        """
+        if self.threads == 1 or len(schema_paths) <= 1:
+            for schema_path in schema_paths:
+                yield schema_path, self.load(schema_path)
+        else:
+            self._read_cache()  # Read once, before worker threads use it
+            paths = iter(schema_paths)
+            pending: collections.deque = collections.deque()
+
+            with ThreadPoolExecutor(
+                max_workers=self.threads, thread_name_prefix="reflekt-load"
+            ) as executor:
+                for schema_path in paths:
+                    pending.append(
+                        (schema_path, executor.submit(self.load, schema_path))
+                    )
+
+                    if len(pending) >= 2 * self.threads:
+                        break
+
+                while pending:
+                    schema_path, future = pending.popleft()
+                    next_path = next(paths, None)
+
+                    if next_path is not None:
+                        pending.append(
+                            (next_path, executor.submit(self.load, next_path))
+                        )
+
+                    yield schema_path, future.result()
+
+        self.save()
+
+    def load_many(self, schema_paths: list[Path]) -> list[dict]:
+        """Load several schemas, preserving their order.
+
+        The persistent parse cache is saved afterwards.
+
+        Args:
+            schema_paths (list[Path]): Paths to the schema files.
+
+        Returns:
+            list[dict]: The parsed JSON schemas.
+        """
+        return [schema for _, schema in self.iter_load(schema_paths)]
+
+    def digest(self, schema_path: Path) -> str:
+        """Get the content hash (sha256) of a schema file, without parsing it.
+
+        The hash in the parse cache is reused if the file's mtime and size are
+        unchanged. Otherwise the file is read and hashed, but not decoded.
+
+        Args:
+            schema_path (Path): Path to the schema file.
+
+        Returns:
+            str: Hex digest of the file content.
+        """
+        key = self.key(schema_path)
+        digest = self._digests.get(key)
+
+        if digest is None:
+            path = self._prefix + key
+            stat = os.stat(path)
+            cached = self._read_cache().get(key) if self.use_cache else None
+
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                digest = cached[2]
+            else:
+                with open(path, "rb") as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+
+            self._digests[key] = digest
+
+        return digest
+
+    def _build_index(self) -> dict[str, dict[str, list[str]]]:
+        """Index every schema by $id, event name, version, vendor and metadata keys.
+
+        Returns:
+            dict[str, dict[str, list[str]]]: Schema keys by field, then by value.
+        """
+        index: dict[str, dict[str, list[str]]] = {
+            "id": {},
+            "name": {},
+            "version": {},
+            "vendor": {},
+            "metadata": {},
+        }
+
+        for key, schema in zip(
+            self.keys, self.load_many([self.path(key) for key in self.keys])
+        ):
+            schema_self = schema.get("self", {})
+            values = {
+                "id": [schema.get("$id")],
+                "name": [schema_self.get("name")],
+                "version": [schema_self.get("version")],
+                "vendor": [schema_self.get("vendor")],
+                "metadata": list(schema_self.get("metadata") or {}),
+            }
+
+            for field, field_values in values.items():
+                for value in field_values:
+                    if value is not None:
+                        index[field].setdefault(value, []).append(key)
+
+        return index
+
+    def find(
+        self,
+        id: Optional[str] = None,
+        name: Optional[str] = None,
+        version: Optional[str] = None,
+        vendor: Optional[str] = None,
+        metadata_key: Optional[str] = None,
+    ) -> list[Path]:
+        """Find schemas matching all of the given fields.
+
+        The index is built (parsing every schema) the first time this is called.
+
+        Args:
+            id (Optional[str]): Schema $id.
+            name (Optional[str]): Event name in 'self.name'.
+            version (Optional[str]): Schema version in 'self.version'.
+            vendor (Optional[str]): Schema vendor in 'self.vendor'.
+            metadata_key (Optional[str]): Key that must exist in 'self.metadata'.
+
+        Returns:
+            list[Path]: Sorted paths of the matching schemas.
+        """
+        if self._index is None:
+            self._index = self._build_index()
+
+        criteria = {
+            "id": id,
+            "name": name,
+            "version": version,
+            "vendor": vendor,
+            "metadata": metadata_key,
+        }
+        matches: Optional[set[str]] = None
+
+        for field, value in criteria.items():
+            if value is not None:
+                keys = set(self._index[field].get(value, []))
+                matches = keys if matches is None else matches & keys
+
+        if matches is None:  # No criteria, match everything
+            matches = set(self.keys)
+
+        return [self.path(key) for key in sorted(matches)]
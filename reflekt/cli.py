@@ -6,14 +6,13 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import os
 import shutil
+import time
 from pathlib import Path
 from typing import Optional, Union
 
 import click
-import pkg_resources
 import typer
 from jsonschema import ValidationError
 from loguru import logger
@@ -25,22 +24,28 @@ from rich.traceback import install
 from typing_extensions import Annotated
 
 from reflekt import SHOW_LOCALS, __version__
-from reflekt.builder.handler import BuilderHandler
+from reflekt.catalog import DEFAULT_LOAD_THREADS, SchemaCatalog
 from reflekt.constants import (
     REGISTRY,
     WAREHOUSE,
     ArtifactEnum,
+    LintFormatEnum,
     RegistryEnum,
     SdkEnum,
 )
-from reflekt.errors import RegistryArgError, SelectArgError
+from reflekt.errors import ChangedSinceArgError, RegistryArgError, SelectArgError
+from reflekt.lint_format import get_lint_writer
+from reflekt.lint_profile import LintProfile
 from reflekt.linter import Linter
 from reflekt.profile import Profile, ProfileError
-from reflekt.project import Project, ProjectError
-from reflekt.registry.handler import RegistryHandler
+from reflekt.project import Project, ProjectError, set_project
 from reflekt.reporter.reporter import Reporter
 from reflekt.tracking import ReflektUser, track_event
 
+# NOTE: Builders, registries, and data warehouse drivers (sqlalchemy, snowflake,
+# redshift, requests) are slow to import. They are imported inside the commands that
+# use them so `reflekt --version`, `lint`, and `report` start quickly.
+
 # Prettify traceback messages
 app = typer.Typer(pretty_exceptions_show_locals=SHOW_LOCALS)  # Typer app
 install(show_locals=SHOW_LOCALS)  # Other uncaught exceptions
@@ -85,6 +90,7 @@ def main(
     except ProjectError:  # No Reflekt project (i.e., before `reflekt init`)
         project = Project(use_defaults=True)  # Make a placeholder project
 
+    set_project(project)  # Share project with casing, linter, builders, registries
     configure_logging(verbose=False, project=project)
     logger.info(f"Running with reflekt={__version__}")
 
@@ -124,29 +130,25 @@ def clean_select(select: str) -> str:
     return str(select_cleaned)
 
 
-def get_schema_paths(select: str, project: Project) -> list[Path]:
-    select_path = project.dir / "schemas" / select
-    logger.info(f"Searching for JSON schemas in: {str(select_path)}")
-    schema_paths = []  # List of schema IDs (Paths) to pull
+def log_rate_limit(schema_registry) -> None:
+    """Log the wait time of the schema registry's rate limiter, if one is set.
 
-    if select_path.is_dir():  # Get all schemas in directory
-        for root, _, files in os.walk(select_path):
-            for file in files:
-                if file.endswith(".json"):
-                    schema_paths.append(Path(root) / file)
-    else:  # Get single schema file
-        select_path = select_path.with_suffix(".json")
-        if select_path.exists():
-            schema_paths.append(select_path)
+    Args:
+        schema_registry (SegmentRegistry | AvoRegistry): Registry used by the
+            command.
+    """
+    rate_limiter = schema_registry.transport.rate_limiter
 
-    return schema_paths
+    if rate_limiter is not None:
+        logger.info(f"Rate limit: {rate_limiter}")
 
 
 def configure_logging(verbose: bool, project: Project):
     LEVEL = "DEBUG" if verbose else "INFO"
     logger.remove()  # Remove default loguru logger
-    logger.add(  # Add loguru logger with rich formatting
+    logger.add(  # Add loguru logger with rich formatting, stdout is left for output
         RichHandler(
+            console=Console(stderr=True),
             rich_tracebacks=True,
             markup=True,
             show_path=False,
@@ -308,6 +310,8 @@ def init(
         profile.source.append(source_credentials)
 
     # Create project directory, reflekt_project.yml, reflekt_profiles.yml, and README
+    import pkg_resources
+
     project_folders = pkg_resources.resource_filename(  # Get template folder
         "reflekt", "_templates/reflekt_project/"
     )
@@ -427,7 +431,17 @@ def pull(
         "--select",
         "-s",
         help=(
-            "Schema(s) to pull from schema registry. If registry uses tracking plans, starting with the plan name."
+            "Schema(s) to pull from schema registry. If registry uses tracking plans, starting with the plan name. "
+            "For Segment, list several plans separated by commas or use a glob (e.g., 'ecommerce_*')."
+        ),
+    ),
+    prune: bool = typer.Option(
+        False,
+        "--prune",
+        help=(
+            "Delete schema(s) removed from the schema registry since an earlier "
+            "pull, unless edited locally. Only for tracking plans (Segment) or "
+            "branches (Avo) pulled in full."
         ),
     ),
     profile_name: str = typer.Option(
@@ -444,6 +458,7 @@ def pull(
     ),
 ):
     """Pull schema(s) from a schema registry."""
+    from reflekt.registry.handler import RegistryHandler
 
     logger.debug(verbose)
     configure_logging(verbose=verbose, project=project)
@@ -455,7 +470,8 @@ def pull(
     schema_registry = RegistryHandler(
         registry=registry, select=select, profile=profile
     ).get_registry()
-    count_schemas = schema_registry.pull(select=select)
+    count_schemas = schema_registry.pull(select=select, prune=prune)
+    log_rate_limit(schema_registry)
 
     if user.id is not None:
         track_event(
@@ -486,7 +502,8 @@ def push(
         "-s",
         help=(
             "Schema(s) to push to schema registry. Starting with 'schemas/' is "
-            "optional."
+            "optional. For Segment, list several plans separated by commas or use "
+            "a glob (e.g., 'ecommerce_*')."
         ),
     ),
     delete: bool = typer.Option(
@@ -501,12 +518,35 @@ def push(
         "-F",
         help="Force command to run without confirmation.",
     ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help=(
+            "Show the schema(s) that would be added, changed, or deleted in the "
+            "schema registry without sending any changes."
+        ),
+    ),
     profile_name: str = typer.Option(
         "",
         "--profile",
         "-p",
         help=("Profile in reflekt_profiles.yml to use for schema registry connection."),
     ),
+    changed_since: Optional[str] = typer.Option(
+        None,
+        "--changed-since",
+        help=(
+            "Only include schemas changed since this Git ref (e.g., origin/main). "
+            "All schemas are included if reflekt_project.yml or the meta-schema "
+            "changed."
+        ),
+    ),
+    threads: int = typer.Option(
+        DEFAULT_LOAD_THREADS,
+        "--threads",
+        min=1,
+        help="Number of threads used to read and parse schemas.",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -515,9 +555,11 @@ def push(
     ),
 ):
     """Push schema(s) to a schema registry."""
+    from reflekt.registry.handler import RegistryHandler
 
     configure_logging(verbose=verbose, project=project)
     select = clean_select(select)
+    catalog = SchemaCatalog(project, threads=threads, changed_since=changed_since)
     profile = (
         Profile(project=project)
         if profile_name == ""
@@ -538,17 +580,29 @@ def push(
             registry=registry.type,
         )
 
-    if delete and not force:
+    if delete and changed_since is not None:
+        raise ChangedSinceArgError(
+            message="--changed-since cannot be used with --delete.",
+            changed_since=changed_since,
+        )
+
+    if delete and not force and not dry_run:
         delete_confirmed = typer.confirm(
             f"Are you sure you want to delete the schema(s) selected by:\n"
             f"   --select {select}\n",
         )
         if delete_confirmed:
-            count_schemas = schema_registry.push(select=select, delete=delete)
+            count_schemas = schema_registry.push(
+                select=select, delete=delete, catalog=catalog
+            )
     else:
-        count_schemas = schema_registry.push(select=select, delete=delete)
+        count_schemas = schema_registry.push(
+            select=select, delete=delete, catalog=catalog, dry_run=dry_run
+        )
 
-    if user.id is not None:
+    log_rate_limit(schema_registry)
+
+    if user.id is not None and not dry_run:
         track_event(
             user_id=user.id,
             event_name="Schemas Pushed",
@@ -571,6 +625,54 @@ def lint(
         "-s",
         help=("Schema(s) to lint. Starting with 'schemas/' is optional."),
     ),
+    changed_since: Optional[str] = typer.Option(
+        None,
+        "--changed-since",
+        help=(
+            "Only include schemas changed since this Git ref (e.g., origin/main). "
+            "All schemas are included if reflekt_project.yml or the meta-schema "
+            "changed."
+        ),
+    ),
+    threads: int = typer.Option(
+        DEFAULT_LOAD_THREADS,
+        "--threads",
+        min=1,
+        help="Number of threads used to read and parse schemas.",
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=1,
+        help=(
+            "Number of processes used to lint schemas. Output is the same as with "
+            "1 process."
+        ),
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help=(
+            "Lint and parse every schema, ignoring cached results in .reflekt_cache/."
+        ),
+    ),
+    timings: bool = typer.Option(
+        False,
+        "--timings",
+        help=(
+            "Time each lint rule and list the slowest schemas. Also written as JSON "
+            "to .logs/. Use with --no-cache to time every schema."
+        ),
+    ),
+    format: LintFormatEnum = typer.Option(
+        LintFormatEnum.text,
+        "--format",
+        help=(
+            "Format of lint errors written to stdout. 'jsonl' and 'sarif' are "
+            "machine-readable, logs are written to stderr."
+        ),
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -583,26 +685,57 @@ def lint(
     configure_logging(verbose=verbose, project=project)
     profile = Profile(project=project)
     cleaned_select = clean_select(select)
-    schema_paths = get_schema_paths(select=cleaned_select, project=project)
-    errors = []  # TODO: Linter should have its own errors attribute
+    catalog = SchemaCatalog(
+        project,
+        use_cache=not no_cache,
+        threads=threads,
+        changed_since=changed_since,
+    )
+    schema_paths = catalog.select(cleaned_select)
     logger.info(f"Found {len(schema_paths)} schema(s) to lint")
-    linter = Linter(project=project)
-
-    for i, schema_path in enumerate(schema_paths, start=1):  # Get all Reflekt schemas
+    lint_profile = LintProfile() if timings else None
+    linter = Linter(project=project, use_cache=not no_cache, profile=lint_profile)
+    writer = get_lint_writer(format, base_dir=project.dir)
+    writer.start()
+
+    # Errors are written as they are found, in schema order, whether linted
+    # serially or in processes
+    for i, (schema_path, violations) in enumerate(
+        linter.iter_lint(schema_paths, catalog=catalog, jobs=jobs), start=1
+    ):
         logger.info(
             f"{i} of {len(schema_paths)} Linting [magenta]{schema_path}[magenta/]"
         )
 
-        with schema_path.open("r") as f:
-            r_schema = json.load(f)
+        for violation in violations:
+            if violation.level == "error":
+                writer.write(schema_path, violation)
+            else:
+                logger.info(str(violation))
 
-        linter.lint_schema(r_schema, errors)  # If errors
+    # Cross-schema rules need the whole selection, so they run after the loop
+    logger.info(f"Checking property consistency across {len(schema_paths)} schema(s)")
 
-    if errors:
-        logger.error(f"[red]Linting failed with {len(errors)} error(s):[/red]")
+    for schema_path, violation in linter.check_consistency(schema_paths, catalog):
+        writer.write(schema_path, violation)
 
-        for error in errors:
-            logger.error(error)
+    writer.finish()
+
+    if lint_profile is not None:
+        console = Console(stderr=True)  # Keep stdout for lint output
+        console.print(lint_profile.rules_table())
+        console.print(lint_profile.schemas_table())
+        timings_path = lint_profile.write(
+            project.dir
+            / ".logs"
+            / f"lint_timings_{time.strftime('%Y-%m-%d_%H-%M-%S')}.json"
+        )
+
+        if timings_path is not None:
+            logger.info(f"Lint timings written to [magenta]{timings_path}[magenta/]")
+
+    if writer.count_errors:
+        logger.error(f"[red]Linting failed with {writer.count_errors} error(s)[/red]")
         raise typer.Exit(code=1)
     else:
         logger.info("[green]Completed successfully[green/]")
@@ -615,7 +748,7 @@ def lint(
                 "project_id": hashlib.md5(project.name.encode("utf-8")).hexdigest(),
                 "profile_id": hashlib.md5(profile.name.encode("utf-8")).hexdigest(),
                 "count_schemas": len(schema_paths),
-                "count_errors": len(errors),
+                "count_errors": writer.count_errors,
                 "ci": os.getenv("CI") if os.getenv("CI") is True else False,
             },
             context=default_context,
@@ -639,6 +772,21 @@ def report(
         "-f",
         help="Write report(s) to file instead of terminal.",
     ),
+    changed_since: Optional[str] = typer.Option(
+        None,
+        "--changed-since",
+        help=(
+            "Only include schemas changed since this Git ref (e.g., origin/main). "
+            "All schemas are included if reflekt_project.yml or the meta-schema "
+            "changed."
+        ),
+    ),
+    threads: int = typer.Option(
+        DEFAULT_LOAD_THREADS,
+        "--threads",
+        min=1,
+        help="Number of threads used to read and parse schemas.",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -650,13 +798,20 @@ def report(
 
     configure_logging(verbose=verbose, project=project)
     cleaned_select = clean_select(select)
-    schema_paths = get_schema_paths(select=cleaned_select, project=project)
+    catalog = SchemaCatalog(project, threads=threads, changed_since=changed_since)
+    schema_paths = catalog.select(cleaned_select)
     reporter = Reporter()
 
+    if changed_since is not None and not schema_paths:
+        logger.info("No changed schemas to report on")
+        return
+
     if not to_file:
         if len(schema_paths) == 1:
             logger.info(f"Generating Markdown report for schema: {len(schema_paths)}")
-            md_str = reporter.build_md(schema_paths[0])
+            md_str = reporter.build_md(
+                schema_paths[0], schema=catalog.load(schema_paths[0])
+            )
             print()
             print(md_str)
 
@@ -672,9 +827,9 @@ def report(
             )
 
     else:
-        for schema_path in schema_paths:
-            md_str = reporter.build_md(schema_path)
-            report_path = Path(schema_path._str.replace(".json", ".md"))
+        for schema_path, schema in catalog.iter_load(schema_paths):
+            md_str = reporter.build_md(schema_path, schema=schema)
+            report_path = schema_path.with_suffix(".md")
 
             with report_path.open("w") as f:
                 f.write(md_str)
@@ -720,6 +875,12 @@ def build(
             "reflekt_project.yml"
         ),
     ),
+    threads: int = typer.Option(
+        DEFAULT_LOAD_THREADS,
+        "--threads",
+        min=1,
+        help="Number of threads used to read and parse schemas.",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -728,6 +889,7 @@ def build(
     ),
 ):
     """Build data artifacts based on schemas."""
+    from reflekt.builder.handler import BuilderHandler
 
     configure_logging(verbose=verbose, project=project)
     select = clean_select(select)
@@ -736,13 +898,17 @@ def build(
         if profile_name == ""
         else Profile(project=project, profile_name=profile_name)
     )
-    builder = BuilderHandler(
+    catalog = SchemaCatalog(project, threads=threads)
+    builder_handler = BuilderHandler(
         artifact_arg=artifact,
         select_arg=select,
         sdk_arg=sdk,
         source_arg=source,
         profile=profile,
-    ).get_builder()
+        catalog=catalog,
+    )
+
+    builder = builder_handler.get_builder()
     builder.build()
 
     if user.id is not None:
@@ -58,6 +58,14 @@ class ArtifactEnum(str, Enum):
     # malloy = "malloy"
 
 
+class LintFormatEnum(str, Enum):
+    """Enum of supported output formats for lint results."""
+
+    text = "text"
+    jsonl = "jsonl"
+    sarif = "sarif"
+
+
 class SdkEnum(str, Enum):
     """Enum of supported SDKs that generate event data."""
 
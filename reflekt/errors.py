@@ -2,11 +2,16 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from requests import Response
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from reflekt.constants import RegistryEnum
 from reflekt.profile import Profile
 
+if TYPE_CHECKING:  # requests is slow to import and only needed for registries
+    from requests import Response
+
 
 class SelectArgError(Exception):
     """Raised when an invalid --select argument is provided."""
@@ -38,6 +43,21 @@ class SourceArgError(Exception):
         super().__init__(self.message)
 
 
+class ChangedSinceArgError(Exception):
+    """Raised when an invalid --changed-since argument is provided."""
+
+    def __init__(self, message: str, changed_since: str) -> None:
+        """Initialize ChangedSinceArgError class.
+
+        Args:
+            message (str): Error message.
+            changed_since (str): The invalid --changed-since argument.
+        """
+        self.message = message
+        self.changed_since = changed_since
+        super().__init__(self.message)
+
+
 class RegistryArgError(Exception):
     """Raised when an invalid --registry argument is provided."""
 
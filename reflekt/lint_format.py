@@ -0,0 +1,192 @@
+# SPDX-FileCopyrightText: 2022 Gregory Clunies <greg@reflekt-ci.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import Optional, TextIO
+
+from loguru import logger
+
+from reflekt import __version__
+from reflekt.constants import LintFormatEnum
+from reflekt.linter import RULES, LintViolation
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+
+class LintWriter:
+    """Base class for lint output writers.
+
+    Writers consume the stream of lint errors from Linter.iter_lint(), writing each
+    error as soon as it is produced instead of collecting them until the end.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        """Initialize LintWriter.
+
+        Args:
+            stream (Optional[TextIO]): Stream to write to. Defaults to sys.stdout.
+        """
+        self.stream = stream if stream is not None else sys.stdout
+        self.count_errors = 0
+
+    def start(self) -> None:
+        """Write anything needed before the first error."""
+
+    def write(self, schema_path: Path, violation: LintViolation) -> None:
+        """Write a lint error.
+
+        Args:
+            schema_path (Path): Path to the schema with the error.
+            violation (LintViolation): The lint error.
+        """
+        self.count_errors += 1
+
+    def finish(self) -> None:
+        """Write anything needed after the last error."""
+        self.stream.flush()
+
+
+class TextLintWriter(LintWriter):
+    """Human-readable lint output, logged with the Reflekt CLI logger."""
+
+    def write(self, schema_path: Path, violation: LintViolation) -> None:
+        """Log a lint error.
+
+        Args:
+            schema_path (Path): Path to the schema with the error.
+            violation (LintViolation): The lint error.
+        """
+        super().write(schema_path, violation)
+        logger.error(str(violation))
+
+
+class JsonlLintWriter(LintWriter):
+    """JSON Lines lint output, one JSON object per error."""
+
+    def write(self, schema_path: Path, violation: LintViolation) -> None:
+        """Write a lint error as a line of JSON.
+
+        Args:
+            schema_path (Path): Path to the schema with the error.
+            violation (LintViolation): The lint error.
+        """
+        super().write(schema_path, violation)
+        record = violation.to_dict()
+        record["path"] = str(schema_path)
+        self.stream.write(json.dumps(record) + "\n")
+
+
+class SarifLintWriter(LintWriter):
+    """SARIF 2.1.0 lint output (e.g., for GitHub code scanning).
+
+    Results are streamed as they are produced. The tool description, which lists
+    the rules that reported errors, is written after the results.
+    """
+
+    def __init__(
+        self, stream: Optional[TextIO] = None, base_dir: Optional[Path] = None
+    ) -> None:
+        """Initialize SarifLintWriter.
+
+        Args:
+            stream (Optional[TextIO]): Stream to write to. Defaults to sys.stdout.
+            base_dir (Optional[Path]): Directory that schema paths are made
+                relative to (e.g., the repo root). Defaults to None (absolute paths).
+        """
+        super().__init__(stream=stream)
+        self.base_dir = base_dir
+        self._rule_ids: dict[str, int] = {}  # Rule index in tool.driver.rules
+
+    def start(self) -> None:
+        """Write the start of the SARIF log, up to the results array."""
+        self.stream.write(
+            f'{{"$schema": "{SARIF_SCHEMA}", "version": "2.1.0", '
+            f'"runs": [{{"results": ['
+        )
+
+    def write(self, schema_path: Path, violation: LintViolation) -> None:
+        """Write a lint error as a SARIF result.
+
+        Args:
+            schema_path (Path): Path to the schema with the error.
+            violation (LintViolation): The lint error.
+        """
+        rule_index = self._rule_ids.setdefault(violation.rule, len(self._rule_ids))
+
+        if self.base_dir is not None and self.base_dir in schema_path.parents:
+            uri = schema_path.relative_to(self.base_dir).as_posix()
+        else:
+            uri = schema_path.as_uri()
+
+        result = {
+            "ruleId": violation.rule,
+            "ruleIndex": rule_index,
+            "level": "error",
+            "message": {"text": violation.message},
+            "locations": [
+                {
+                    "physicalLocation": {"artifactLocation": {"uri": uri}},
+                    "logicalLocations": [
+                        {
+                            "fullyQualifiedName": violation.pointer or "/",
+                            "kind": "member",
+                        }
+                    ],
+                }
+            ],
+        }
+        separator = ", " if self.count_errors else ""
+        self.stream.write(separator + json.dumps(result))
+        super().write(schema_path, violation)
+
+    def finish(self) -> None:
+        """Write the tool description and the end of the SARIF log."""
+        descriptions = {rule.name: rule.check.__doc__ for rule in RULES}
+        rules = [
+            {
+                "id": rule_id,
+                "shortDescription": {
+                    "text": (descriptions.get(rule_id) or rule_id).strip()
+                },
+            }
+            for rule_id in self._rule_ids
+        ]
+        tool = {
+            "driver": {
+                "name": "reflekt",
+                "version": __version__,
+                "informationUri": "https://github.com/GClunies/Reflekt",
+                "rules": rules,
+            }
+        }
+        self.stream.write(f'], "tool": {json.dumps(tool)}}}]}}\n')
+        super().finish()
+
+
+def get_lint_writer(
+    format: LintFormatEnum,
+    stream: Optional[TextIO] = None,
+    base_dir: Optional[Path] = None,
+) -> LintWriter:
+    """Get the lint writer for an output format.
+
+    Args:
+        format (LintFormatEnum): The --format argument passed to Reflekt CLI.
+        stream (Optional[TextIO]): Stream to write to. Defaults to sys.stdout.
+        base_dir (Optional[Path]): Directory that SARIF schema paths are made
+            relative to. Defaults to None.
+
+    Returns:
+        LintWriter: Writer for the format.
+    """
+    if format == LintFormatEnum.jsonl:
+        return JsonlLintWriter(stream=stream)
+    elif format == LintFormatEnum.sarif:
+        return SarifLintWriter(stream=stream, base_dir=base_dir)
+    else:
+        return TextLintWriter(stream=stream)
@@ -0,0 +1,223 @@
+# SPDX-FileCopyrightText: 2022 Gregory Clunies <greg@reflekt-ci.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import heapq
+import json
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from rich.table import Table
+
+COUNT_SLOWEST_SCHEMAS = 10
+
+
+class LintProfile:
+    """Timers and counters for `reflekt lint --timings`.
+
+    Rules are wrapped once, when the Linter is built, so linting without --timings
+    has no timing overhead. Only the slowest schemas are kept (in a bounded heap),
+    so memory does not grow with the number of schemas linted.
+    """
+
+    def __init__(self, count_slowest: int = COUNT_SLOWEST_SCHEMAS) -> None:
+        """Initialize LintProfile.
+
+        Args:
+            count_slowest (int): Number of slowest schemas to keep. Defaults to
+                COUNT_SLOWEST_SCHEMAS.
+        """
+        self.count_slowest = count_slowest
+        self.rules: dict[str, list] = {}  # name -> [calls, seconds, violations]
+        self.count_schemas = 0
+        self.count_cached = 0  # Schemas with cached results, not linted or timed
+        self._slowest: list[tuple[float, str]] = []  # Min-heap of (seconds, path)
+
+    def record(self, name: str, seconds: float, count_violations: int = 0) -> None:
+        """Record a call of a rule.
+
+        Args:
+            name (str): Rule name.
+            seconds (float): Time spent in the rule.
+            count_violations (int): Number of lint records returned. Defaults to 0.
+        """
+        stats = self.rules.get(name)
+
+        if stats is None:
+            self.rules[name] = [1, seconds, count_violations]
+        else:
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] += count_violations
+
+    def record_schema(self, schema_path: str, seconds: float) -> None:
+        """Record the total time spent linting a schema.
+
+        Args:
+            schema_path (str): Path to the schema file.
+            seconds (float): Time spent linting the schema.
+        """
+        self.count_schemas += 1
+
+        if len(self._slowest) < self.count_slowest:
+            heapq.heappush(self._slowest, (seconds, schema_path))
+        elif seconds > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, (seconds, schema_path))
+
+    def wrap(self, name: str, check: Callable) -> Callable:
+        """Wrap a rule (or the meta-schema validation) with a timer and counters.
+
+        Rules are generators, so the wrapper consumes them to time all their work
+        and returns a list of their results.
+
+        Args:
+            name (str): Rule name.
+            check (Callable): Rule function.
+
+        Returns:
+            Callable: Timed function with the same arguments as check.
+        """
+        perf_counter = time.perf_counter
+        record = self.record
+
+        def timed_check(*args) -> list:
+            start = perf_counter()
+            results = list(check(*args))
+            record(name, perf_counter() - start, len(results))
+
+            return results
+
+        return timed_check
+
+    def slowest_schemas(self) -> list[tuple[float, str]]:
+        """Get the slowest schemas linted.
+
+        Returns:
+            list[tuple[float, str]]: Seconds and schema path, slowest first.
+        """
+        return sorted(self._slowest, reverse=True)
+
+    def to_dict(self) -> dict:
+        """Get the profile as a dict, e.g. to write as JSON or merge from workers.
+
+        Returns:
+            dict: Rules (sorted by total time), slowest schemas, and schema counts.
+        """
+        return {
+            "count_schemas": self.count_schemas,
+            "count_cached": self.count_cached,
+            "rules": [
+                {
+                    "rule": name,
+                    "calls": calls,
+                    "seconds": seconds,
+                    "violations": violations,
+                }
+                for name, (calls, seconds, violations) in sorted(
+                    self.rules.items(), key=lambda item: item[1][1], reverse=True
+                )
+            ],
+            "slowest_schemas": [
+                {"schema_path": schema_path, "seconds": seconds}
+                for seconds, schema_path in self.slowest_schemas()
+            ],
+        }
+
+    def merge(self, data: dict) -> None:
+        """Add a profile from to_dict() (e.g., from a lint worker process).
+
+        Args:
+            data (dict): Profile from LintProfile.to_dict().
+        """
+        for stats in data["rules"]:
+            existing = self.rules.setdefault(stats["rule"], [0, 0.0, 0])
+            existing[0] += stats["calls"]
+            existing[1] += stats["seconds"]
+            existing[2] += stats["violations"]
+
+        self.count_cached += data["count_cached"]
+        count_schemas = self.count_schemas + data["count_schemas"]
+
+        for schema in data["slowest_schemas"]:
+            self.record_schema(schema["schema_path"], schema["seconds"])
+
+        self.count_schemas = count_schemas  # Not just the slowest schemas merged
+
+    def reset(self) -> None:
+        """Clear all timers and counters."""
+        self.rules = {}
+        self.count_schemas = 0
+        self.count_cached = 0
+        self._slowest = []
+
+    def rules_table(self) -> Table:
+        """Build a table of rule timings, sorted by total time.
+
+        Returns:
+            Table: Rich table.
+        """
+        table = Table(
+            title=(
+                f"Lint timings: {self.count_schemas} schema(s) linted, "
+                f"{self.count_cached} cached"
+            ),
+            show_header=True,
+            header_style="bold light_sea_green",
+        )
+        table.add_column("Rule", no_wrap=True)
+        table.add_column("Calls", justify="right")
+        table.add_column("Total (ms)", justify="right")
+        table.add_column("Mean (µs)", justify="right")
+        table.add_column("Records", justify="right")
+
+        for stats in self.to_dict()["rules"]:
+            table.add_row(
+                stats["rule"],
+                str(stats["calls"]),
+                f"{stats['seconds'] * 1000:.1f}",
+                f"{stats['seconds'] / stats['calls'] * 1e6:.1f}",
+                str(stats["violations"]),
+            )
+
+        return table
+
+    def schemas_table(self) -> Table:
+        """Build a table of the slowest schemas to lint.
+
+        Returns:
+            Table: Rich table.
+        """
+        table = Table(
+            title="Slowest schemas",
+            show_header=True,
+            header_style="bold light_sea_green",
+        )
+        table.add_column("Schema", no_wrap=True)
+        table.add_column("Time (ms)", justify="right", no_wrap=True)
+
+        for seconds, schema_path in self.slowest_schemas():
+            table.add_row(schema_path, f"{seconds * 1000:.1f}")
+
+        return table
+
+    def write(self, path: Path) -> Optional[Path]:
+        """Write the profile as JSON (e.g., to .logs/ to compare CI runs).
+
+        Args:
+            path (Path): Path to the JSON file.
+
+        Returns:
+            Optional[Path]: Path written, or None if the file could not be written.
+        """
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            with path.open("w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, indent=4)
+        except OSError:
+            return None
+
+        return path
@@ -4,352 +4,1022 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterator, Optional
 
 from jsonschema import Draft7Validator
 from loguru import logger
 
-from reflekt.casing import event_case, property_case
+from reflekt import __version__
+from reflekt.cache import get_cache_dir, read_json, write_json
+from reflekt.casing import compile_case_check
+from reflekt.catalog import SchemaCatalog
+from reflekt.lint_profile import LintProfile
 from reflekt.project import Project
 
+LINT_CACHE_FORMAT = 2  # Bump when LintViolation fields change
 
-class Linter:
-    """Reflekt linter class.
 
-    Lints event schemas for naming conventions, required metadata, and other issues.
+class Conventions:
+    """Naming conventions from reflekt_project.yml, compiled once for linting.
+
+    Reserved names and data types are frozensets, and casing checks are precompiled
+    (see reflekt.casing.compile_case_check), so rules do not re-read or re-scan the
+    project config for every event and property.
     """
 
     def __init__(self, project: Project) -> None:
-        """Initialize Reflekt linter.
+        """Initialize Conventions.
 
         Args:
             project (Project): Reflekt project object.
         """
-        self._project = project
-        self._meta_path = self._project.dir / "schemas/.reflekt/meta/1-0.json"
+        conventions = project.conventions
+        self.project_path: Path = project.path
+        self.event: dict = conventions["event"]
+        self.property: dict = conventions["property"]
+        self.data_types: list = conventions["data_types"]
+        self.event_reserved: frozenset = frozenset(self.event["reserved"])
+        self.property_reserved: frozenset = frozenset(self.property["reserved"])
+        self.data_types_set: frozenset = frozenset(self.data_types)
+        self.is_event_case: Callable[[str], bool] = compile_case_check(self.event)
+        self.is_property_case: Callable[[str], bool] = compile_case_check(self.property)
+
+
+class Rule:
+    """A lint rule registered with the Linter's rule engine.
+
+    Rules target one of:
+        'schema'   - Run once per schema, even if the schema sets 'lint: false'.
+                     Called as check(conventions, abs_path, schema_id, r_schema).
+        'event'    - Run once per schema, unless the schema sets 'lint: false'.
+                     Called as check(conventions, abs_path, schema_id, r_schema).
+        'property' - Run once per property, unless the property sets 'lint: false'.
+                     Called as check(conventions, abs_path, prop_name, prop_dict).
 
-        with self._meta_path.open() as f:
-            self._meta_schema = json.load(f)
+    A check yields an error message for each problem it finds.
+    """
 
-    def lint_no_space_in_schema_id(self, schema_id: str, errors: list):
-        """Check that there are no spaces in the schema ID.
+    def __init__(
+        self,
+        name: str,
+        target: str,
+        check: Callable[..., Iterator[str]],
+    ) -> None:
+        """Initialize Rule.
 
         Args:
-            schema_id (str): Reflekt schema ID.
-            errors (list): A list of linting errors.
+            name (str): Rule name.
+            target (str): What the rule checks, 'schema', 'event' or 'property'.
+            check (Callable[..., Iterator[str]]): Function yielding error messages.
         """
-        abs_path = self._project.dir / "schemas" / schema_id
+        self.name = name
+        self.target = target
+        self.check = check
+
+
+RULES: list[Rule] = []  # Registered once, at import
+
+
+def register_rule(name: str, target: str) -> Callable:
+    """Decorator that registers a check function as a lint rule.
+
+    Args:
+        name (str): Rule name.
+        target (str): What the rule checks, 'schema', 'event' or 'property'.
+
+    Returns:
+        Callable: Decorator returning the check function unchanged.
+    """
+    if target not in ("schema", "event", "property"):
+        raise ValueError(f"Invalid lint rule target '{target}' for rule '{name}'")
+
+    def decorator(check: Callable[..., Iterator[str]]) -> Callable:
+        RULES.append(Rule(name=name, target=target, check=check))
+        return check
+
+    return decorator
+
+
+@register_rule("no_space_in_schema_id", "schema")
+def lint_no_space_in_schema_id(
+    c: Conventions, abs_path: Path, schema_id: str, r_schema: dict
+) -> Iterator[str]:
+    """Check that there are no spaces in the schema ID."""
+    if " " in schema_id:
+        yield f"Schema ID '{schema_id}' contains space (' ') in {abs_path}"
+
+
+@register_rule("event_name_matches_id", "event")
+def lint_event_name_matches_id(
+    c: Conventions, abs_path: Path, schema_id: str, r_schema: dict
+) -> Iterator[str]:
+    """Check that the schema event name matches the schema ID."""
+    schema_event_name = r_schema["self"]["name"]
+    # NOTE - reflekt converts space in event name to be underscore in the file path
+    name_from_id = schema_id.split("/")[-2]
+
+    if schema_event_name.replace(" ", "_") != name_from_id:
+        yield (
+            f"Event name '{schema_event_name}' does not match schema ID "
+            f"'{schema_id}'in {abs_path}.\n\n"
+            f"NOTE: Space (' ') in event names are converted to underscore when "
+            f"setting schema ID"
+        )
+
+
+@register_rule("event_version_matches_id", "event")
+def lint_event_version_matches_id(
+    c: Conventions, abs_path: Path, schema_id: str, r_schema: dict
+) -> Iterator[str]:
+    """Check that the schema event version matches the schema ID."""
+    schema_event_version = r_schema["self"]["version"]
+    version_from_id = schema_id.split("/")[-1].replace(".json", "")
+
+    if schema_event_version != version_from_id:
+        yield (
+            f"Event version '{schema_event_version}' does not match schema ID "
+            f"'{schema_id}' in {abs_path}"
+        )
+
+
+@register_rule("event_casing", "event")
+def lint_event_casing(
+    c: Conventions, abs_path: Path, schema_id: str, r_schema: dict
+) -> Iterator[str]:
+    """Check that the event name is in the correct casing."""
+    event_name = r_schema["self"]["name"]
+
+    if not c.is_event_case(event_name):
+        yield (
+            f"Event '{event_name}' in {abs_path} does not match naming convention "
+            f"'casing: {c.event['casing']}' in {c.project_path}. "
+        )
+
+
+@register_rule("event_numbers", "event")
+def lint_event_numbers(
+    c: Conventions, abs_path: Path, schema_id: str, r_schema: dict
+) -> Iterator[str]:
+    """Check that the event name does not contain numbers."""
+    event_name = r_schema["self"]["name"]
+
+    if any(char.isdigit() for char in event_name):
+        yield (
+            f"Event '{event_name}' in {abs_path} does not match naming convention "
+            f"'numbers: {c.event['numbers']}' in {c.project_path}. "
+        )
 
-        if " " in schema_id:
-            err_msg = f"Schema ID '{schema_id}' contains space (' ') in {abs_path}"
-            logger.error(err_msg)
-            errors.append(err_msg)
 
-    def lint_event_name_matches_id(
-        self, schema_event_name: str, schema_id: str, errors: list
-    ):
-        """Check that the schema event name matches the schema ID.
+@register_rule("event_reserved", "event")
+def lint_event_reserved(
+    c: Conventions, abs_path: Path, schema_id: str, r_schema: dict
+) -> Iterator[str]:
+    """Check that the event name is not a reserved name."""
+    event_name = r_schema["self"]["name"]
+
+    if event_name in c.event_reserved:
+        yield (
+            f"Event '{event_name}' in {abs_path} is a reserved name in convention "
+            f"in {c.project_path}. Reserved event names are:\n"
+            f"    'reserved: {c.event['reserved']}'"
+        )
+
+
+@register_rule("property_casing", "property")
+def lint_property_casing(
+    c: Conventions, abs_path: Path, prop_name: str, prop_dict: dict
+) -> Iterator[str]:
+    """Check that the property name is in the correct casing."""
+    if not c.is_property_case(prop_name):
+        yield (
+            f"Property '{prop_name}' in {abs_path} does not match naming "
+            f"convention 'casing: {c.property['casing']}' in {c.project_path}."
+        )
+
+
+@register_rule("property_numbers", "property")
+def lint_property_numbers(
+    c: Conventions, abs_path: Path, prop_name: str, prop_dict: dict
+) -> Iterator[str]:
+    """Check that the property name does not contain numbers."""
+    if any(char.isdigit() for char in prop_name):
+        yield (
+            f"Property '{prop_name}' in {abs_path} does not match naming "
+            f"convention 'numbers: {c.property['numbers']}' in {c.project_path}."
+        )
+
+
+@register_rule("property_reserved", "property")
+def lint_property_reserved(
+    c: Conventions, abs_path: Path, prop_name: str, prop_dict: dict
+) -> Iterator[str]:
+    """Check that the property name is not a reserved name."""
+    if prop_name in c.property_reserved:
+        yield (
+            f"Property '{prop_name}' in {abs_path} is a reserved name in "
+            f"{c.project_path}. Reserved property names are:\n"
+            f"    'reserved: {c.property['reserved']}'"
+        )
+
+
+@register_rule("property_description", "property")
+def lint_property_description(
+    c: Conventions, abs_path: Path, prop_name: str, prop_dict: dict
+) -> Iterator[str]:
+    """Check that the property description is not empty."""
+    if not prop_dict.get("description"):
+        yield f"Property '{prop_name}' in {abs_path} does not have a description."
+
+
+@register_rule("property_has_type", "property")
+def lint_property_has_type(
+    c: Conventions, abs_path: Path, prop_name: str, prop_dict: dict
+) -> Iterator[str]:
+    """Check that the property has a type."""
+    if "type" not in prop_dict:
+        yield (
+            f"Property '{prop_name}' in {abs_path} does not have a type. "
+            f"Please add a type to the property."
+        )
+
+
+@register_rule("property_type", "property")
+def lint_property_type(
+    c: Conventions, abs_path: Path, prop_name: str, prop_dict: dict
+) -> Iterator[str]:
+    """Check that the property data type(s) are allowed."""
+    prop_type = prop_dict.get("type", [])
+    prop_type_list = [prop_type] if isinstance(prop_type, str) else prop_type
+
+    for prop_type in prop_type_list:
+        if prop_type not in c.data_types_set:
+            yield (
+                f"Property '{prop_name}' in schema '{abs_path}' has type "
+                f"'{prop_type}' which is not allowed per the config in "
+                f"reflekt_project.yml:\n "
+                f"    'data_types: {c.data_types}'"
+            )
+
+
+class LintViolation:
+    """Structured lint result for a schema, returned by Linter.check_schema().
+
+    Records are plain data so they can be returned from worker processes and logged
+    by the parent in schema order.
+    """
+
+    def __init__(
+        self,
+        schema_id: str,
+        rule: str,
+        message: str,
+        level: str = "error",
+        pointer: str = "",
+    ) -> None:
+        """Initialize LintViolation.
 
         Args:
-            schema_event_name (str): The event name from the schema.
             schema_id (str): Reflekt schema ID.
-            errors (list): A list of linting errors.
+            rule (str): Name of the rule that produced the record, or
+                'meta_schema' for meta-schema validation errors.
+            message (str): Message to log.
+            level (str): 'error' for lint errors, 'info' for notices like
+                skipped linting. Defaults to 'error'.
+            pointer (str): JSON pointer to the part of the schema the record is
+                about (e.g., '/properties/products/items/properties/sku'). Defaults
+                to '' (the whole schema).
         """
-        abs_path = self._project.dir / "schemas" / schema_id
-        # NOTE - reflekt converts space in event name to be underscore in the file path
-        name_from_id = schema_id.split("/")[-2]
-        event_name_space_to_underscore = schema_event_name.replace(" ", "_")
-
-        if event_name_space_to_underscore != name_from_id:
-            err_msg = (
-                f"Event name '{schema_event_name}' does not match schema ID "
-                f"'{schema_id}'in {abs_path}.\n\n"
-                f"NOTE: Space (' ') in event names are converted to underscore when "
-                f"setting schema ID"
+        self.schema_id = schema_id
+        self.rule = rule
+        self.message = message
+        self.level = level
+        self.pointer = pointer
+
+    def __str__(self) -> str:
+        if self.pointer and self.level == "error":
+            return f"{self.message} (at '{self.pointer}')"
+
+        return self.message
+
+    def __repr__(self) -> str:
+        return (
+            f"LintViolation(schema_id={self.schema_id!r}, rule={self.rule!r}, "
+            f"level={self.level!r}, pointer={self.pointer!r}, "
+            f"message={self.message!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LintViolation):
+            return NotImplemented
+
+        return self.to_list() == other.to_list()
+
+    def to_dict(self) -> dict:
+        """Get the record as a dict for machine-readable output.
+
+        Returns:
+            dict: Record with schema_id, rule, pointer, level, and message.
+        """
+        return {
+            "schema_id": self.schema_id,
+            "rule": self.rule,
+            "pointer": self.pointer,
+            "level": self.level,
+            "message": self.message,
+        }
+
+    def to_list(self) -> list:
+        """Serialize the record (e.g., for the lint cache).
+
+        Returns:
+            list: [schema_id, rule, message, level, pointer].
+        """
+        return [self.schema_id, self.rule, self.message, self.level, self.pointer]
+
+
+def json_pointer(path: Optional[tuple]) -> str:
+    """Build a JSON pointer (RFC 6901) from a linked schema path.
+
+    Paths are linked tuples, (parent_path, key), with None for the document root.
+    Extending a path is O(1), so walking a schema stays linear in its size. The
+    O(depth) pointer string is only built when a lint record needs it.
+
+    Args:
+        path (Optional[tuple]): Linked path, e.g. ((None, 'properties'), 'cart_id').
+
+    Returns:
+        str: JSON pointer, e.g. '/properties/cart_id'.
+    """
+    keys = []
+
+    while path is not None:
+        path, key = path
+        keys.append(str(key).replace("~", "~0").replace("/", "~1"))
+
+    return "".join(f"/{key}" for key in reversed(keys))
+
+
+def iter_child_properties(
+    path: Optional[tuple], node: dict
+) -> Iterator[tuple[tuple, str, dict]]:
+    """Get the named properties directly nested in a schema node.
+
+    Includes the node's own 'properties', and the 'properties' of its array
+    'items' (at any depth of nested arrays), which have no name of their own.
+
+    Args:
+        path (Optional[tuple]): Linked path to the node (see json_pointer).
+        node (dict): The schema node, e.g. an object or array property.
+
+    Yields:
+        tuple[tuple, str, dict]: Linked path, name, and schema of each property.
+    """
+    containers = [(path, node)]
+
+    for container_path, container in containers:  # Grows with nested items
+        properties = container.get("properties")
+
+        if isinstance(properties, dict):
+            properties_path = (container_path, "properties")
+
+            for prop_key, prop_dict in properties.items():
+                if isinstance(prop_dict, dict):
+                    yield (properties_path, prop_key), prop_key, prop_dict
+
+        items = container.get("items")
+        items_path = (container_path, "items")
+
+        if isinstance(items, dict):
+            containers.append((items_path, items))
+        elif isinstance(items, list):  # Tuple validation
+            containers.extend(
+                ((items_path, i), item)
+                for i, item in enumerate(items)
+                if isinstance(item, dict)
             )
-            logger.error(err_msg)
-            errors.append(err_msg)
 
-    def lint_event_version_matches_id(
-        self, schema_event_version: str, schema_id: str, errors: list
-    ):
-        """Check that the schema event version matches the schema ID.
+
+def property_signature(prop_dict: dict) -> tuple:
+    """Get the parts of a property definition that must agree across schemas.
+
+    Type lists are order-insensitive. Enums are not compared, since events often
+    allow a subset of a property's values (e.g., a registry that only supports
+    some of them). Descriptions are not compared either: they are free text that
+    often describes the property in the context of its event, and they do not
+    change the column a property is loaded into downstream.
+
+    Args:
+        prop_dict (dict): The property schema.
+
+    Returns:
+        tuple: Hashable (type, format) signature.
+    """
+    prop_type = prop_dict.get("type")
+
+    return (
+        tuple(sorted(prop_type)) if isinstance(prop_type, list) else prop_type,
+        prop_dict.get("format"),
+    )
+
+
+def describe_signature(signature: tuple) -> str:
+    """Describe a property signature for lint messages.
+
+    Args:
+        signature (tuple): Signature from property_signature().
+
+    Returns:
+        str: E.g. "type 'string', format 'date-time'".
+    """
+    prop_type, prop_format = signature
+    if isinstance(prop_type, tuple):
+        description = f"type {json.dumps(list(prop_type))}"
+    elif prop_type is not None:
+        description = f"type '{prop_type}'"
+    else:
+        description = "no type"
+
+    if prop_format is not None:
+        description += f", format '{prop_format}'"
+
+    return description
+
+
+class PropertyIndex:
+    """Index of property name -> definitions across schemas, to find conflicts.
+
+    The same property name (e.g., 'product_id') declared with a different type or
+    format in different schemas breaks models that union events
+    downstream. Schemas are added one at a time and every (nested) property is
+    indexed once, so finding conflicts is linear in the total number of properties.
+    """
+
+    def __init__(self) -> None:
+        """Initialize PropertyIndex."""
+        self._schemas: list[tuple[Path, str]] = []  # (schema_path, schema_id)
+        # name -> signature -> [(position in self._schemas, linked path)]
+        self._index: dict[str, dict[tuple, list[tuple[int, tuple]]]] = {}
+
+    def add(self, schema_path: Path, r_schema: dict) -> None:
+        """Index the properties of a schema.
+
+        Schemas and properties with 'lint: false' are skipped.
 
         Args:
-            schema_event_version (str): The event version from the schema.
-            schema_id (str): Reflekt schema ID.
-            errors (list): A list of linting errors.
+            schema_path (Path): Path to the schema file.
+            r_schema (dict): The schema.
         """
-        abs_path = self._project.dir / "schemas" / schema_id
-        version_from_id = schema_id.split("/")[-1].replace(".json", "")
+        if not r_schema.get("self", {}).get("lint", True):
+            return
 
-        if schema_event_version != version_from_id:
-            err_msg = (
-                f"Event version '{schema_event_version}' does not match schema ID "
-                f"'{schema_id}' in {abs_path}"
-            )
-            logger.error(err_msg)
-            errors.append(err_msg)
+        schema_i = len(self._schemas)
+        self._schemas.append((schema_path, r_schema.get("$id", "")))
+        stack = list(iter_child_properties(None, r_schema))
+        stack.reverse()
+
+        while stack:
+            path, prop_key, prop_dict = stack.pop()
+
+            if not prop_dict.get("lint", True):
+                continue
+
+            self._index.setdefault(prop_key, {}).setdefault(
+                property_signature(prop_dict), []
+            ).append((schema_i, path))
+
+            if "properties" in prop_dict or "items" in prop_dict:
+                children = list(iter_child_properties(path, prop_dict))
+                children.reverse()
+                stack.extend(children)
+
+    def conflicts(self) -> Iterator[tuple[Path, LintViolation]]:
+        """Find properties defined differently from the rest of the schemas.
+
+        For each property name, the definition used by the most properties (the
+        first one found on ties) is taken as the expected one, and every other
+        definition is an error.
+
+        Yields:
+            tuple[Path, LintViolation]: Schema path and lint error, in the order
+                the schemas were added.
+        """
+        results = []
+
+        for prop_key, signatures in self._index.items():
+            if len(signatures) == 1:
+                continue
+
+            expected = max(signatures, key=lambda sig: len(signatures[sig]))
+            count_expected = len(signatures[expected])
+            _, example_id = self._schemas[signatures[expected][0][0]]
 
-    def lint_event_casing(self, event_name: str, schema_id: str, errors: list):
-        """Check that the event name is in the correct casing.
+            for signature, occurrences in signatures.items():
+                if signature == expected:
+                    continue
+
+                for schema_i, path in occurrences:
+                    schema_path, schema_id = self._schemas[schema_i]
+                    results.append(
+                        (
+                            schema_i,
+                            schema_path,
+                            LintViolation(
+                                schema_id,
+                                "property_consistency",
+                                f"Property '{prop_key}' in {schema_path} has "
+                                f"{describe_signature(signature)}, but is defined "
+                                f"with {describe_signature(expected)} in "
+                                f"{count_expected} other place(s) (e.g., "
+                                f"'{example_id}').",
+                                pointer=json_pointer(path),
+                            ),
+                        )
+                    )
+
+        # Sort is stable, so errors within a schema stay grouped by property
+        results.sort(key=lambda result: result[0])
+
+        for _, schema_path, violation in results:
+            yield schema_path, violation
+
+
+class Linter:
+    """Reflekt linter class.
+
+    Lints event schemas for naming conventions, required metadata, and other issues.
+    Each schema and property is visited once, running all rules in RULES.
+    """
+
+    def __init__(
+        self,
+        project: Project,
+        meta_schema: Optional[dict] = None,
+        use_cache: bool = True,
+        profile: Optional[LintProfile] = None,
+    ) -> None:
+        """Initialize Reflekt linter.
 
         Args:
-            event_name (str): The event name.
-            schema_id (str): Reflekt schema ID.
-            errors (list): A list of linting errors.
+            project (Project): Reflekt project object.
+            meta_schema (Optional[dict]): Reflekt meta-schema. Defaults to None
+                (read from schemas/.reflekt/meta/1-0.json).
+            use_cache (bool): Whether iter_lint() reuses and stores lint results in
+                .reflekt_cache/lint/. Defaults to True.
+            profile (Optional[LintProfile]): Profile that records rule timings and
+                counters. Defaults to None (no timing).
+
+        Raises:
+            SchemaError: The Reflekt meta-schema is not a valid JSON schema.
         """
-        abs_path = self._project.dir / "schemas" / schema_id
-        if event_name != event_case(event_name):
-            err_msg = (
-                f"Event '{event_name}' in {abs_path} does not match naming convention "
-                f"'casing: {self._project.conventions['event']['casing']}' in "
-                f"{self._project.path}. "
+        self._project = project
+        self._schemas_dir = self._project.dir / "schemas"
+        self._meta_path = self._schemas_dir / ".reflekt/meta/1-0.json"
+
+        if meta_schema is None:
+            with self._meta_path.open() as f:
+                meta_schema = json.load(f)
+
+        self._meta_schema = meta_schema
+
+        # Check and compile the meta-schema once, not for every schema linted
+        Draft7Validator.check_schema(self._meta_schema)
+        self._validator = Draft7Validator(schema=self._meta_schema)
+
+        # Compile conventions and group rules once, not for every property
+        self._conventions = Conventions(project)
+        rules = list(RULES)
+        self._schema_checks = [(r.name, r.check) for r in rules if r.target == "schema"]
+        self._event_checks = [(r.name, r.check) for r in rules if r.target == "event"]
+        self._property_checks = [
+            (r.name, r.check) for r in rules if r.target == "property"
+        ]
+        self._iter_meta_errors = self._validator.iter_errors
+        self.profile = profile
+
+        if profile is not None:  # Wrap once, so there is no overhead without it
+            self._iter_meta_errors = profile.wrap("meta_schema", self._iter_meta_errors)
+            self._schema_checks, self._event_checks, self._property_checks = (
+                [(name, profile.wrap(name, check)) for name, check in checks]
+                for checks in (
+                    self._schema_checks,
+                    self._event_checks,
+                    self._property_checks,
+                )
             )
-            logger.error(err_msg)
-            errors.append(err_msg)
 
-    def lint_event_numbers(self, event_name: str, schema_id: str, errors: list):
-        """Check that the event name does not contain numbers.
+        # Lint results depend on schema content and everything hashed here
+        self.use_cache = use_cache
+        self._cache_dir = get_cache_dir(project.dir) / "lint"
+        self._results_key = hashlib.sha256(
+            json.dumps(
+                [
+                    LINT_CACHE_FORMAT,
+                    __version__,
+                    str(self._schemas_dir),
+                    project.conventions,
+                    self._meta_schema,
+                    [rule.name for rule in rules],
+                ],
+                sort_keys=True,
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def check_schema(self, r_schema: dict) -> list[LintViolation]:
+        """Lint event schema without logging, returning structured records.
 
         Args:
-            event_name (str): The event name.
-            schema_id (str): Reflekt schema ID.
-            errors (list): A list of linting errors.
+            r_schema (dict): The schema to lint.
+
+        Returns:
+            list[LintViolation]: Lint errors and notices, in the order found.
         """
-        abs_path = self._project.dir / "schemas" / schema_id
-        if any(char.isdigit() for char in event_name):
-            err_msg = (
-                f"Event '{event_name}' in {abs_path} does not match naming convention "
-                f"'numbers: {self._project.conventions['event']['numbers']}' in "
-                f"{self._project.path}. "
+        schema_id = r_schema["$id"]
+        schema_path = self._schemas_dir / schema_id
+        c = self._conventions
+        violations = []
+
+        # Lint schema against Reflekt meta-schema, valid schemas yield no errors
+        for error in sorted(self._iter_meta_errors(r_schema), key=str):
+            error_path = list(error.absolute_path)
+            error_key = error_path[0] if error_path else ""
+
+            if (
+                schema_id.startswith("segment/")
+                and (
+                    "/identify/" in str.lower(schema_id)
+                    or "/group/" in str.lower(schema_id)
+                )
+                and error_key == "metadata"
+            ):
+                pass  # Segment does not support metadata for identify/group calls
+            else:
+                path = None
+
+                for key in error_path:
+                    path = (path, key)
+
+                violations.append(
+                    LintViolation(
+                        schema_id,
+                        "meta_schema",
+                        f"Schema validation error in '{error_key}' in "
+                        f"{schema_path}:\n    {error.message}",
+                        pointer=json_pointer(path),
+                    )
+                )
+
+        # Lint event conventions
+        for rule, check in self._schema_checks:
+            for error_msg in check(c, schema_path, schema_id, r_schema):
+                violations.append(LintViolation(schema_id, rule, error_msg))
+
+        if not r_schema["self"].get("lint", True):
+            violations.append(
+                LintViolation(
+                    schema_id,
+                    "lint_false",
+                    f"    Skipped linting for event '{r_schema['self']['name']}'"
+                    " due to 'lint: false' config in schema.",
+                    level="info",
+                )
             )
-            logger.error(err_msg)
-            errors.append(err_msg)
+        else:
+            for rule, check in self._event_checks:
+                for error_msg in check(c, schema_path, schema_id, r_schema):
+                    violations.append(LintViolation(schema_id, rule, error_msg))
+
+        # Lint property conventions, visiting each (nested) property once. An
+        # explicit stack (depth-first, in schema order) avoids recursion limits.
+        stack = list(iter_child_properties(None, r_schema))
+        stack.reverse()
+
+        while stack:
+            path, prop_key, prop_dict = stack.pop()
+
+            if not prop_dict.get("lint", True):  # Also skips nested properties
+                violations.append(
+                    LintViolation(
+                        schema_id,
+                        "lint_false",
+                        f"    Skipped linting for property '{prop_key}' due to"
+                        " 'lint: false' config in schema.",
+                        level="info",
+                        pointer=json_pointer(path),
+                    )
+                )
+                continue
+
+            for rule, check in self._property_checks:
+                for error_msg in check(c, schema_path, prop_key, prop_dict):
+                    violations.append(
+                        LintViolation(
+                            schema_id, rule, error_msg, pointer=json_pointer(path)
+                        )
+                    )
+
+            children = list(iter_child_properties(path, prop_dict))
+            children.reverse()
+            stack.extend(children)
 
-    def lint_event_reserved(self, event_name: str, schema_id: str, errors: list):
-        """Check that the event name is not a reserved name.
+        return violations
+
+    def lint_schema(self, r_schema: dict, errors: list):
+        """Lint event schema.
+
+        Linting is performed against conventions defined in reflekt_project.yml
+        and required metadata fields defined in schemas/.reflekt/meta/1-0.json.
+
+        If a linting error is found, the error message is appended to the errors list.
 
         Args:
-            event_name (str): The event name.
-            schema_id (str): Reflekt schema ID.
+            r_schema (dict): The schema to lint.
+            errors (list): A list to append linting errors to.
+
+        Returns:
             errors (list): A list of linting errors.
         """
-        abs_path = self._project.dir / "schemas" / schema_id
-        if event_name in self._project.conventions["event"]["reserved"]:
-            err_msg = (
-                f"Event '{event_name}' in {abs_path} is a reserved name in convention "
-                f"in {self._project.path}. Reserved event names are:\n"
-                f"    'reserved: {self._project.conventions['event']['reserved']}'"
-            )
-            logger.error(err_msg)
-            errors.append(err_msg)
+        return self.log_violations(self.check_schema(r_schema), errors)
 
-    def lint_property_casing(self, prop_name: str, schema_id: str, errors: list):
-        """Check that the property name is in the correct casing.
+    def log_violations(self, violations: list[LintViolation], errors: list) -> list:
+        """Log lint records and append the error messages to the errors list.
 
         Args:
-            prop_name (str): The property name.
-            schema_id (str): Reflekt schema ID.
+            violations (list[LintViolation]): Records from check_schema().
+            errors (list): A list to append linting errors to.
+
+        Returns:
             errors (list): A list of linting errors.
         """
-        abs_path = self._project.dir / "schemas" / schema_id
-        if prop_name != property_case(prop_name):
-            err_msg = (
-                f"Property '{prop_name}' in {abs_path} does not match naming "
-                f"convention "
-                f"'casing: {self._project.conventions['property']['casing']}' in "
-                f"{self._project.path}."
-            )
-            logger.error(err_msg)
-            errors.append(err_msg)
+        for violation in violations:
+            if violation.level == "error":
+                logger.error(str(violation))
+                errors.append(str(violation))
+            else:
+                logger.info(str(violation))
+
+        return errors
+
+    def iter_lint(
+        self, schema_paths: list[Path], catalog: SchemaCatalog, jobs: int = 1
+    ) -> Iterator[tuple[Path, list[LintViolation]]]:
+        """Lint schemas, yielding the records for each schema in the order given.
 
-    def lint_property_numbers(self, prop_name: str, schema_id: str, errors: list):
-        """Check that the property name does not contain numbers.
+        If use_cache is set, schemas with unchanged content (and unchanged
+        conventions, meta-schema, rules, and reflekt version) reuse the records
+        stored in .reflekt_cache/lint/ by a previous run, including errors.
 
         Args:
-            prop_name (str): The property name.
-            schema_id (str): Reflekt schema ID.
-            errors (list): A list of linting errors.
+            schema_paths (list[Path]): Paths to the schemas to lint.
+            catalog (SchemaCatalog): Catalog used to load schemas.
+            jobs (int): Number of worker processes. Defaults to 1 (no pool).
+
+        Yields:
+            tuple[Path, list[LintViolation]]: Schema path and its lint records.
         """
-        abs_path = self._project.dir / "schemas" / schema_id
-        if any(char.isdigit() for char in prop_name):
-            err_msg = (
-                f"Property '{prop_name}' in {abs_path} does not match naming "
-                f"convention "
-                f"'numbers: {self._project.conventions['property']['numbers']}' in "
-                f"{self._project.path}."
-            )
-            logger.error(err_msg)
-            errors.append(err_msg)
+        if not self.use_cache:
+            yield from self._iter_lint_uncached(schema_paths, catalog, jobs)
 
-    def lint_property_reserved(self, prop_name: str, schema_id: str, errors: list):
-        """Check that the property name is not a reserved name.
+            return
+
+        cached: dict[Path, list[LintViolation]] = {}
+        digests: dict[Path, str] = {}
+
+        for schema_path in schema_paths:
+            digests[schema_path] = catalog.digest(schema_path)
+            violations = self._read_results(catalog, schema_path, digests[schema_path])
+
+            if violations is not None:
+                cached[schema_path] = violations
+
+        logger.debug(f"Reusing cached lint results for {len(cached)} schema(s)")
+
+        if self.profile is not None:
+            self.profile.count_cached += len(cached)
+
+        uncached = self._iter_lint_uncached(
+            [path for path in schema_paths if path not in cached], catalog, jobs
+        )
+
+        for schema_path in schema_paths:
+            if schema_path in cached:
+                yield schema_path, cached[schema_path]
+            else:
+                _, violations = next(uncached)
+                self._write_results(
+                    catalog, schema_path, digests[schema_path], violations
+                )
+                yield schema_path, violations
+
+        for _ in uncached:  # Run to the end, so the catalog saves its parse cache
+            pass
+
+    def check_consistency(
+        self, schema_paths: list[Path], catalog: SchemaCatalog
+    ) -> Iterator[tuple[Path, LintViolation]]:
+        """Check that properties are defined the same way across schemas.
+
+        Unlike the rules in check_schema(), this needs the whole selection, so it
+        runs in this process after per-schema linting. Schemas are loaded through
+        the catalog (and its parse cache), and each property is indexed once.
 
         Args:
-            prop_name (str): The property name.
-            schema_id (str): Reflekt schema ID.
-            errors (list): A list of linting errors.
+            schema_paths (list[Path]): Paths to the schemas to compare.
+            catalog (SchemaCatalog): Catalog used to load schemas.
+
+        Yields:
+            tuple[Path, LintViolation]: Schema path and lint error.
         """
-        abs_path = self._project.dir / "schemas" / schema_id
-        if prop_name in self._project.conventions["property"]["reserved"]:
-            err_msg = (
-                f"Property '{prop_name}' in {abs_path} is a reserved name in "
-                f"{self._project.path}. Reserved property names are:\n"
-                f"    'reserved: {self._project.conventions['property']['reserved']}'"
+        start = time.perf_counter()
+        index = PropertyIndex()
+
+        for schema_path, r_schema in catalog.iter_load(schema_paths):
+            index.add(schema_path, r_schema)
+
+        conflicts = list(index.conflicts())
+
+        if self.profile is not None:
+            self.profile.record(
+                "property_consistency", time.perf_counter() - start, len(conflicts)
             )
-            logger.error(err_msg)
-            errors.append(err_msg)
 
-    def lint_property_description(
-        self, prop_name: str, description: str, schema_id: str, errors: list
-    ):
-        """Check that the property description is not empty.
+        yield from conflicts
+
+    def _results_path(self, catalog: SchemaCatalog, schema_path: Path) -> Path:
+        """Get the lint results cache file for a schema (one file per schema).
 
         Args:
-            prop_name (str): The property name.
-            description (str): The property description.
-            schema_id (str): Reflekt schema ID.
-            errors (list): A list of linting errors.
+            catalog (SchemaCatalog): Catalog the schema belongs to.
+            schema_path (Path): Path to the schema file.
+
+        Returns:
+            Path: Path to the cache file.
         """
-        abs_path = self._project.dir / "schemas" / schema_id
-        if not description:
-            err_msg = (
-                f"Property '{prop_name}' in {abs_path} does not have a description."
-            )
-            logger.error(err_msg)
-            errors.append(err_msg)
+        name = hashlib.sha1(catalog.key(schema_path).encode("utf-8")).hexdigest()
 
-    def lint_property_has_type(
-        self, prop_name: str, prop_dict: dict, schema_id: str, errors: list
-    ):
-        """Check that the property has a type.
+        return self._cache_dir / f"{name}.json"
+
+    def _read_results(
+        self, catalog: SchemaCatalog, schema_path: Path, digest: str
+    ) -> Optional[list[LintViolation]]:
+        """Read cached lint records for a schema, if still valid.
 
         Args:
-            prop_name (str): The property name.
-            prop_dict (dict): The property's dictionary with type, description, etc.
-            schema_id (str): Reflekt schema ID.
-            errors (list): A list of linting errors.
+            catalog (SchemaCatalog): Catalog the schema belongs to.
+            schema_path (Path): Path to the schema file.
+            digest (str): Content hash of the schema file.
+
+        Returns:
+            Optional[list[LintViolation]]: Cached records, or None if there are
+                none for this schema content and lint configuration.
         """
-        abs_path = self._project.dir / "schemas" / schema_id
+        cached = read_json(self._results_path(catalog, schema_path))
 
-        if "type" not in prop_dict:
-            err_msg = (
-                f"Property '{prop_name}' in {abs_path} does not have a type. "
-                f"Please add a type to the property."
-            )
-            logger.error(err_msg)
-            errors.append(err_msg)
+        if cached is None or cached.get("key") != f"{self._results_key}:{digest}":
+            return None
+
+        return [LintViolation(*violation) for violation in cached["violations"]]
 
-    def lint_property_type(
-        self, prop_name: str, prop_type_list: list, schema_id: str, errors: list
-    ):
-        """Check that the property data type is valid.
+    def _write_results(
+        self,
+        catalog: SchemaCatalog,
+        schema_path: Path,
+        digest: str,
+        violations: list[LintViolation],
+    ) -> None:
+        """Store lint records for a schema, replacing older results.
 
         Args:
-            prop_name (str): The property name.
-            prop_type_list (list): list of valid property data types.
-            schema_id (str): Reflekt schema ID.
-            errors (list): A list of linting errors.
+            catalog (SchemaCatalog): Catalog the schema belongs to.
+            schema_path (Path): Path to the schema file.
+            digest (str): Content hash of the schema file.
+            violations (list[LintViolation]): Records from check_schema().
         """
-        abs_path = self._project.dir / "schemas" / schema_id
-        for prop_type in prop_type_list:
-            if prop_type not in self._project.conventions["data_types"]:
-                err_msg = (
-                    f"Property '{prop_name}' in schema '{abs_path}' has type "
-                    f"'{prop_type}' which is not allowed per the config in "
-                    f"reflekt_self._project.yml:\n "
-                    f"    'data_types: {self._project.conventions['data_types']}'"
-                )
-                logger.error(err_msg)
-                errors.append(err_msg)
+        write_json(
+            self._results_path(catalog, schema_path),
+            {
+                "key": f"{self._results_key}:{digest}",
+                "violations": [violation.to_list() for violation in violations],
+            },
+        )
 
-    def lint_schema(self, r_schema: dict, errors: list):
-        """Lint event schema.
+    def _iter_lint_uncached(
+        self, schema_paths: list[Path], catalog: SchemaCatalog, jobs: int
+    ) -> Iterator[tuple[Path, list[LintViolation]]]:
+        """Lint schemas, yielding the records for each schema in the order given.
 
-        Linting is performed against conventions defined in reflekt_project.yml
-        and required metadata fields defined in schemas/.reflekt/meta/1-0.json.
+        With jobs > 1, schemas are sharded across a process pool. Each worker gets
+        the project and meta-schema once (at startup), loads and lints its shards,
+        and returns structured records, so the output matches a serial run.
 
-        If a linting error is found, the error message is appended to the errors list.
+        Args:
+            schema_paths (list[Path]): Paths to the schemas to lint.
+            catalog (SchemaCatalog): Catalog used to load schemas.
+            jobs (int): Number of worker processes.
+
+        Yields:
+            tuple[Path, list[LintViolation]]: Schema path and its lint records.
+        """
+        if jobs <= 1 or len(schema_paths) <= 1:
+            for schema_path, r_schema in catalog.iter_load(schema_paths):
+                yield schema_path, self._check_schema_timed(schema_path, r_schema)
+
+            return
+
+        # Several small shards per worker balance the load without per-schema IPC
+        shard_size = max(1, math.ceil(len(schema_paths) / (jobs * 4)))
+        shards = [
+            [str(path) for path in schema_paths[i : i + shard_size]]
+            for i in range(0, len(schema_paths), shard_size)
+        ]
+
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(shards)),
+            initializer=_init_lint_worker,
+            initargs=(self._project, self._meta_schema, self.profile is not None),
+        ) as executor:
+            for shard, profile in executor.map(_lint_shard, shards):  # Ordered
+                if profile is not None:
+                    self.profile.merge(profile)
+
+                for schema_path, violations in shard:
+                    yield Path(schema_path), violations
+
+    def _check_schema_timed(
+        self, schema_path: Path, r_schema: dict
+    ) -> list[LintViolation]:
+        """Lint a schema, recording its lint time if profiling.
 
         Args:
+            schema_path (Path): Path to the schema file.
             r_schema (dict): The schema to lint.
-            errors (list): A list to append linting errors to.
 
         Returns:
-            errors (list): A list of linting errors.
+            list[LintViolation]: Lint errors and notices, in the order found.
         """
-        # Lint schema against Reflekt meta-schema
-        schema_path = self._project.dir / "schemas" / r_schema["$id"]
-        validator = Draft7Validator(schema=self._meta_schema)
-
-        if not validator.is_valid(r_schema):
-            for error in sorted(validator.iter_errors(r_schema), key=str):
-                if (
-                    r_schema["$id"].startswith("segment/")
-                    and (
-                        "/identify/" in str.lower(r_schema["$id"])
-                        or "/group/" in str.lower(r_schema["$id"])
-                    )
-                    and error.absolute_path[0] == "metadata"
-                ):
-                    pass  # Segment does not support metadata for identify/group calls
-                else:
-                    error_msg = (
-                        f"Schema validation error in '{error.absolute_path[0]}' in "
-                        f"{schema_path}:\n    {error.message}"
-                    )
-                    logger.error(error_msg)
-                    errors.append(error_msg)
+        if self.profile is None:
+            return self.check_schema(r_schema)
 
-        # Lint event conventions
-        self.lint_no_space_in_schema_id(r_schema["$id"], errors)
+        start = time.perf_counter()
+        violations = self.check_schema(r_schema)
+        self.profile.record_schema(str(schema_path), time.perf_counter() - start)
 
-        if not r_schema["self"].get("lint", True):
-            logger.info(
-                f"    Skipped linting for event '{r_schema['self']['name']}'"
-                " due to 'lint: false' config in schema."
-            )
-        else:
-            self.lint_event_name_matches_id(
-                r_schema["self"]["name"], r_schema["$id"], errors
-            )
-            self.lint_event_version_matches_id(
-                r_schema["self"]["version"], r_schema["$id"], errors
-            )
-            self.lint_event_casing(r_schema["self"]["name"], r_schema["$id"], errors)
-            self.lint_event_numbers(r_schema["self"]["name"], r_schema["$id"], errors)
-            self.lint_event_reserved(r_schema["self"]["name"], r_schema["$id"], errors)
+        return violations
 
-        # Lint property conventions
-        for prop_key, prop_dict in r_schema["properties"].items():
-            if not prop_dict.get("lint", True):
-                logger.info(
-                    f"    Skipped linting for property '{prop_key}' due to"
-                    " 'lint: false' config in schema."
-                )
-            else:
-                self.lint_property_casing(prop_key, r_schema["$id"], errors)
-                self.lint_property_numbers(prop_key, r_schema["$id"], errors)
-                self.lint_property_reserved(prop_key, r_schema["$id"], errors)
-                self.lint_property_description(
-                    prop_key, prop_dict["description"], r_schema["$id"], errors
-                )
-                self.lint_property_has_type(
-                    prop_key,
-                    prop_dict,
-                    r_schema["$id"],
-                    errors,
-                )
 
-                if "type" in prop_dict:
-                    if isinstance(prop_dict["type"], str):
-                        prop_type_list = [prop_dict["type"]]
-                    else:
-                        prop_type_list = prop_dict["type"]
+_worker_linter: Optional[Linter] = None  # Set in each lint worker process
 
-                    self.lint_property_type(
-                        prop_key, prop_type_list, r_schema["$id"], errors
-                    )
 
-        return errors
+def _init_lint_worker(project: Project, meta_schema: dict, profile: bool) -> None:
+    """Build the Linter once per worker process.
+
+    Args:
+        project (Project): Reflekt project object.
+        meta_schema (dict): Reflekt meta-schema.
+        profile (bool): Whether to record rule timings and counters.
+    """
+    global _worker_linter
+    _worker_linter = Linter(
+        project=project,
+        meta_schema=meta_schema,
+        use_cache=False,
+        profile=LintProfile() if profile else None,
+    )
+
+
+def _lint_shard(
+    schema_paths: list[str],
+) -> tuple[list[tuple[str, list[LintViolation]]], Optional[dict]]:
+    """Load and lint a shard of schemas in a worker process.
+
+    Args:
+        schema_paths (list[str]): Paths to the schemas in the shard.
+
+    Returns:
+        tuple[list[tuple[str, list[LintViolation]]], Optional[dict]]: Schema path
+            and its lint records, and the shard's profile if profiling.
+    """
+    results = []
+
+    for schema_path in schema_paths:
+        with open(schema_path, "rb") as f:
+            r_schema = json.loads(f.read())
+
+        results.append(
+            (schema_path, _worker_linter._check_schema_timed(schema_path, r_schema))
+        )
+
+    profile = _worker_linter.profile
+
+    if profile is None:
+        return results, None
+
+    shard_profile = profile.to_dict()
+    profile.reset()  # Only send each shard's timings once
+
+    return results, shard_profile
@@ -4,17 +4,21 @@
 
 from __future__ import annotations
 
-import json
 import os
-import pkgutil
 from pathlib import Path
 from typing import Optional
 
 import yaml
-from jsonschema import ValidationError, validate
+from jsonschema import ValidationError
 
 from reflekt.dumper import ReflektYamlDumper
 from reflekt.project import Project
+from reflekt.validation import (
+    config_digest,
+    is_validated,
+    record_validated,
+    validate_config,
+)
 
 PROFILE_VERSION = 1.0
 
@@ -79,8 +83,8 @@ class Profile:
                     )
                     raise ProfileError(error_msg, profile=self)
 
-                with self.path.open() as f:
-                    profiles = yaml.safe_load(f)
+                content = self.path.read_bytes()
+                profiles = yaml.safe_load(content)
 
                 try:
                     self.config = profiles[self.name]
@@ -88,8 +92,13 @@ class Profile:
                     error_msg = f"Profile '{self.name}' not found in {self.path}"
                     raise ProfileError(error_msg, profile=self)
 
+                digest = config_digest(content, self.name)
+
                 try:
-                    self.validate_profile()
+                    # Skip validation if this profile in this exact file was validated
+                    if not is_validated(self.project.dir, "profile", digest):
+                        self.validate_profile()
+                        record_validated(self.project.dir, "profile", digest)
                 except ValidationError as e:
                     raise ProfileError(
                         message=(
@@ -98,7 +107,7 @@ class Profile:
                             f"https://github.com/GClunies/Reflekt#reflekt_profilesyml "
                             f"for details on project configuration."
                         ),
-                        project=self,
+                        profile=self,
                     )
 
                 self.do_not_track = self.config.get("do_not_track")
@@ -174,8 +183,7 @@ class Profile:
 
     def validate_profile(self):
         """Validate Reflekt profile configuration."""
-        schema = json.loads(pkgutil.get_data("reflekt", "_validation/profile/1-0.json"))
-        validate(self.config, schema)
+        validate_config("profile", self.config)
 
 
 class ProfileError(Exception):
@@ -4,17 +4,28 @@
 
 from __future__ import annotations
 
-import json
 import os
-import pkgutil
 from pathlib import Path
 from typing import Optional
 
 import yaml
-from git import InvalidGitRepositoryError, Repo
-from jsonschema import ValidationError, validate
+from jsonschema import ValidationError
 
+from reflekt import PROJECT_DISCOVERY, __version__
+from reflekt.cache import get_cache_dir, read_json, write_json
 from reflekt.dumper import ReflektYamlDumper
+from reflekt.validation import (
+    config_digest,
+    is_validated,
+    record_validated,
+    validate_config,
+)
+
+# Directories never searched for reflekt_project.yml. Only names that cannot hold a
+# project are listed (not e.g. 'target' or 'logs', which a project could be under).
+# Hidden directories (e.g., .git, .venv) and Python virtual environments (with a
+# pyvenv.cfg) are always skipped as well.
+IGNORED_DIRS = frozenset(["node_modules", "__pycache__"])
 
 
 class Project:
@@ -24,7 +35,12 @@ class Project:
     Describes a Reflekt project and its configuration from a reflekt_project.yml.
     """
 
-    def __init__(self, use_defaults: bool = False, path: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        use_defaults: bool = False,
+        path: Optional[str] = None,
+        discovery: Optional[str] = None,
+    ) -> None:
         """Initialize Reflekt project.
 
         Args:
@@ -32,11 +48,17 @@ class Project:
                 default values. Defaults to False.
             path (Optional[str]): Path to reflekt_project.yml file. If None,
                 searches Git repo for reflekt_project.yml. Defaults to None.
+            discovery (Optional[str]): How to search the Git repo when path is None.
+                'scan' searches the whole repo (skipping vendored and hidden
+                directories) and ensures there is only one project. 'walk' only
+                checks the current directory and its parents. Defaults to the
+                REFLEKT_PROJECT_DISCOVERY environment variable, or 'scan'.
 
         Raises:
             ProjectError: An error occurred while initializing the project.
         """
         self.use_defaults = use_defaults
+        self.discovery = discovery if discovery is not None else PROJECT_DISCOVERY
         self.exists: bool = False
         self.dir: Optional[Path] = None
         self.path: Optional[Path] = (
@@ -103,11 +125,15 @@ class Project:
         self.exists = True if self.path is not None else False
 
         if self.exists:
-            with self.path.open() as f:  # Load config from reflekt_project.yml
-                self.config = yaml.safe_load(f)
+            content = self.path.read_bytes()  # Load config from reflekt_project.yml
+            self.config = yaml.safe_load(content)
+            digest = config_digest(content)
 
             try:
-                self.validate_project()
+                # Skip validation if this exact file content was already validated
+                if not is_validated(self.dir, "project", digest):
+                    self.validate_project()
+                    record_validated(self.dir, "project", digest)
             except ValidationError as e:
                 raise ProjectError(
                     message=(
@@ -177,11 +203,10 @@ class Project:
             )
 
     def validate_project(self):
-        """Validate Reflekt profile configuration."""
-        schema = json.loads(pkgutil.get_data("reflekt", "_validation/project/1-0.json"))
-        validate(self.config, schema)
+        """Validate Reflekt project configuration."""
+        validate_config("project", self.config)
 
-    def _get_project_dir(self, dir: Path) -> tuple[Path, Path]:
+    def _get_project_dir(self, dir: Path) -> tuple[Path, Path, bool]:
         """Get project dir and path to reflekt_project.yml. Set flag if project exists.
 
         Args:
@@ -194,36 +219,9 @@ class Project:
             tuple[Path, Path, bool]: Path to project directory, path to
                 reflekt_project.yml, boolean flag indicating if project exists.
         """
-        try:
-            repo = Repo(dir, search_parent_directories=True)
-            repo_root = Path(repo.git.rev_parse("--show-toplevel"))
-            # Find dirs w/ reflekt_project.yml file, but exclude template and test files
-            projects = [
-                path
-                for path in list(repo_root.glob("**/reflekt_project.yml"))
-                if "_templates/" not in str(path) and "tests/fixtures/" not in str(path)  # noqa: W503
-            ]
-
-            if len(projects) == 1:
-                # Return project dir, path to reflekt_project.yml, set exists to True
-                return projects[0].parents[0], Path(projects[0]), True
-            elif len(projects) > 1:
-                projects_str = "".join(f"    {str(p)}\n" for p in projects)
-                error_msg = (
-                    f"Git repo found at '{str(repo_root)}', but repo contains "
-                    f">1 'reflekt_project.yml':\n\n"
-                    f"{projects_str}"
-                    f"\nOnly one Reflekt project can be defined per repo."
-                )
-                raise ProjectError(error_msg, project=self)
-            else:  # pragma: no cover
-                error_msg = (
-                    f"Git repository found at {str(repo_root)}, but does not contain "
-                    f"reflekt_project.yml."
-                )
-                raise ProjectError(error_msg, project=self)
+        repo_root = self._get_repo_root(dir)
 
-        except InvalidGitRepositoryError:  # pragma: no cover
+        if repo_root is None:  # pragma: no cover
             error_msg = (
                 "Git repo not detected. Reflekt project must be inside a Git "
                 "repository. You can create one by running `git init` in the directory "
@@ -231,6 +229,160 @@ class Project:
             )
             raise ProjectError(error_msg, project=self)
 
+        if self.discovery == "walk":
+            for parent in [dir, *dir.parents]:
+                project_path = parent / "reflekt_project.yml"
+
+                if project_path.is_file() and self._is_project_path(project_path):
+                    return parent, project_path, True
+
+                if parent == repo_root:
+                    break
+
+        projects = self._find_projects(repo_root)
+
+        if len(projects) == 1:
+            # Return project dir, path to reflekt_project.yml, set exists to True
+            return projects[0].parents[0], Path(projects[0]), True
+        elif len(projects) > 1:
+            projects_str = "".join(f"    {str(p)}\n" for p in projects)
+            error_msg = (
+                f"Git repo found at '{str(repo_root)}', but repo contains "
+                f">1 'reflekt_project.yml':\n\n"
+                f"{projects_str}"
+                f"\nOnly one Reflekt project can be defined per repo."
+            )
+            raise ProjectError(error_msg, project=self)
+        else:  # pragma: no cover
+            error_msg = (
+                f"Git repository found at {str(repo_root)}, but does not contain "
+                f"reflekt_project.yml."
+            )
+            raise ProjectError(error_msg, project=self)
+
+    @staticmethod
+    def _get_repo_root(dir: Path) -> Optional[Path]:
+        """Get the root of the Git repo containing a directory.
+
+        Args:
+            dir (Path): Directory inside the Git repo.
+
+        Returns:
+            Optional[Path]: Git repo root, or None if dir is not inside a Git repo.
+        """
+        for parent in [dir, *dir.parents]:
+            if (parent / ".git").exists():  # .git is a file in worktrees/submodules
+                return parent
+
+        return None
+
+    @staticmethod
+    def _is_project_path(path: Path) -> bool:
+        """Check that reflekt_project.yml is not a template or test fixture.
+
+        Args:
+            path (Path): Path to a reflekt_project.yml file.
+
+        Returns:
+            bool: True if the file defines a Reflekt project.
+        """
+        return "_templates/" not in str(path) and "tests/fixtures/" not in str(path)
+
+    def _find_projects(self, repo_root: Path) -> list[Path]:
+        """Find all reflekt_project.yml files in a Git repo.
+
+        node_modules, __pycache__, hidden directories, and virtual environments are
+        skipped. The result is cached in .reflekt_cache/ at the repo root (which is
+        ignored by Git with its own .gitignore) along with the mtime of every directory
+        searched. Adding or removing a file changes its directory's mtime, so the
+        cache is reused only while every searched directory is unchanged. Checking
+        the mtimes costs one stat() per directory instead of listing every file.
+
+        Args:
+            repo_root (Path): Root of the Git repo.
+
+        Returns:
+            list[Path]: Paths to reflekt_project.yml files.
+        """
+        cache_path = get_cache_dir(repo_root) / "project_discovery.json"
+        cached = read_json(cache_path)
+
+        if (
+            cached is not None
+            and cached.get("version") == __version__
+            and cached.get("repo_root") == str(repo_root)
+            and self._dir_mtimes_match(repo_root, cached.get("dirs", {}))
+        ):
+            return [Path(p) for p in cached["projects"]]
+
+        try:  # Create cache dir first so it does not change the repo root's mtime
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            gitignore_path = cache_path.parent / ".gitignore"
+
+            if not gitignore_path.exists():  # Outside the project's .gitignore
+                gitignore_path.write_text("# Created by reflekt\n*\n")
+        except OSError:  # pragma: no cover
+            pass
+
+        projects = []
+        dir_mtimes = {}
+
+        for root, dirs, files in os.walk(repo_root):
+            dirs[:] = sorted(
+                d for d in dirs if not d.startswith(".") and d not in IGNORED_DIRS
+            )
+            rel_root = os.path.relpath(root, repo_root)
+
+            try:
+                dir_mtimes[rel_root] = os.stat(root).st_mtime_ns
+            except OSError:  # pragma: no cover
+                continue
+
+            if "pyvenv.cfg" in files:  # Python virtual environment
+                dirs[:] = []
+                continue
+
+            if "reflekt_project.yml" in files:
+                project_path = Path(root) / "reflekt_project.yml"
+
+                if self._is_project_path(project_path):
+                    projects.append(project_path)
+
+        write_json(
+            cache_path,
+            {
+                "version": __version__,
+                "repo_root": str(repo_root),
+                "projects": [str(p) for p in projects],
+                "dirs": dir_mtimes,
+            },
+        )
+
+        return projects
+
+    @staticmethod
+    def _dir_mtimes_match(repo_root: Path, dir_mtimes: dict) -> bool:
+        """Check that cached directory mtimes match the file system.
+
+        Args:
+            repo_root (Path): Root of the Git repo.
+            dir_mtimes (dict): Mapping of relative directory path to mtime (ns).
+
+        Returns:
+            bool: True if no searched directory has changed.
+        """
+        if not dir_mtimes:
+            return False
+
+        for rel_dir, mtime in dir_mtimes.items():
+            try:
+                if os.stat(repo_root / rel_dir).st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+
+        return True
+
 
 class ProjectError(Exception):
     """Raised when an error with the Reflekt project is detected."""
@@ -247,5 +399,36 @@ class ProjectError(Exception):
         super().__init__(self.message)
 
 
+_current_project: Optional[Project] = None  # Shared by the whole process
+
+
+def get_project() -> Project:
+    """Get the Reflekt project shared by the current process.
+
+    Project discovery (Git repo search, YAML load, validation) only runs the first
+    time this is called. Later calls reuse the same Project object.
+
+    Returns:
+        Project: The shared Reflekt project.
+    """
+    global _current_project
+
+    if _current_project is None:
+        _current_project = Project()
+
+    return _current_project
+
+
+def set_project(project: Optional[Project]) -> None:
+    """Set the Reflekt project shared by the current process.
+
+    Args:
+        project (Optional[Project]): Project to share. If None, the next call to
+            get_project() discovers the project again.
+    """
+    global _current_project
+    _current_project = project
+
+
 if __name__ == "__main__":  # pragma: no cover
     project = Project()
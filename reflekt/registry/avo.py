@@ -5,10 +5,7 @@
 from __future__ import annotations
 
 import copy
-import json
-from pathlib import Path
 
-import requests
 from loguru import logger
 from requests import Response
 from requests.auth import HTTPBasicAuth
@@ -19,6 +16,9 @@ from reflekt.constants import REFLEKT_JSON_SCHEMA
 from reflekt.errors import ApiResponseError, RegistryError, SelectArgError
 from reflekt.profile import Profile
 from reflekt.project import Project
+from reflekt.registry.rate_limit import get_rate_limiter
+from reflekt.registry.transport import HttpTransport
+from reflekt.registry.writer import SchemaWriter
 
 install(show_locals=SHOW_LOCALS)
 
@@ -47,6 +47,15 @@ class AvoRegistry:
                 self.service_account_name = registry["service_account_name"]
                 self.service_account_secret = registry["service_account_secret"]
                 self.base_url = f"https://api.avo.app/workspaces/{self.workspace_id}/"
+                # One keep-alive session with timeouts, retries, and the rate limit
+                # from reflekt_project.yml for all requests
+                self.transport = HttpTransport.from_config(
+                    registry,
+                    auth=HTTPBasicAuth(
+                        self.service_account_name, self.service_account_secret
+                    ),
+                    rate_limiter=get_rate_limiter(self.type, self.profile.project),
+                )
 
         if not self.config_exists:
             raise RegistryError(
@@ -139,10 +148,7 @@ class AvoRegistry:
 
         branch_id = self._get_avo_branch_id(branch)
         url = self.base_url + f"branches/{branch_id}/export/v1"
-        r = requests.get(
-            url=url,
-            auth=HTTPBasicAuth(self.service_account_name, self.service_account_secret),
-        )
+        r = self.transport.get(url=url)
 
         logger.debug("Logging request details sent to Avo API...")
         logger.debug(f"Request Method: {r.request.method}")
@@ -168,16 +174,25 @@ class AvoRegistry:
 
         return a_schemas
 
-    def pull(self, select: str):
+    def pull(self, select: str, prune: bool = False) -> int:
         """Pull schemas from Avo and write to Reflekt JSON schemas files.
 
+        Files with unchanged content are not rewritten.
+
         Args:
             select (str): The --select argument passed to Reflekt CLI.
+            prune (bool): Whether to delete schemas that were removed from the
+                branch in Avo (see SchemaWriter.prune). Defaults to False.
+
+        Returns:
+            int: The count of schemas pulled from Avo.
         """
         branch = self._parse_select(select=select)
         a_schemas = self._get_avo(select=select, branch=branch)
+        writer = SchemaWriter(self.profile.project, self.type)
+        pulled = []
 
-        for i, a_schema in enumerate(a_schemas, start=1):
+        for a_schema in a_schemas:
             name = a_schema["name"]
             description = a_schema["description"]
             metadata = {}
@@ -235,20 +250,18 @@ class AvoRegistry:
             r_schema["required"] = required
             r_schema["additionalProperties"] = additional_properties
 
-            json_file = Path(self.profile.project.dir / "schemas" / r_schema["$id"])
+            writer.write(r_schema)
+            pulled.append(r_schema["$id"])
 
-            if not json_file.parent.exists():
-                json_file.parent.mkdir(parents=True)
-
-            logger.info(
-                f"{i} of {len(a_schemas)} Writing to [magenta]{json_file}[magenta/]"
-            )
-            with open(json_file, "w", encoding="utf-8") as f:
-                json.dump(r_schema, f, indent=4, ensure_ascii=False)
-                f.write("\n")  # Add newline at end of file
+        if prune:  # The whole branch is pulled
+            writer.prune(branch, pulled)
 
+        writer.save()
+        logger.info(f"Pulled {len(pulled)} schemas: {writer}")
         logger.info("[green]Completed successfully[green/]")
 
+        return len(pulled)  # Return the count of schemas pulled
+
 
 if __name__ == "__main__":  # pragma: no cover
     project = Project()
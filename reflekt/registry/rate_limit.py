@@ -0,0 +1,156 @@
+# SPDX-FileCopyrightText: 2022 Gregory Clunies <greg@reflekt-ci.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Callable, Optional
+
+from reflekt.project import Project
+
+_rate_limiters: dict[tuple, RateLimiter] = {}  # (type, rate, burst) -> limiter
+_rate_limiters_lock = threading.Lock()
+
+
+class RateLimiter:
+    """Token bucket that paces the requests sent to a schema registry API.
+
+    The bucket holds up to `burst` tokens and refills at `rate` tokens per
+    second. Each request takes a token, waiting for one if the bucket is empty.
+    Requests reserve their token in the order they arrive, so concurrent requests
+    are queued instead of all retrying at once. When the API answers 429, pause()
+    holds every request until the Retry-After delay has passed.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize RateLimiter.
+
+        Args:
+            rate (float): Requests per second allowed on average.
+            burst (Optional[int]): Requests that can be sent at once after being
+                idle. Defaults to rate (rounded up), and at least 1.
+            clock (Callable[[], float]): Monotonic clock in seconds. Defaults to
+                time.monotonic.
+            sleep (Callable[[float], None]): Function used to wait. Defaults to
+                time.sleep.
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, math.ceil(rate))
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._resume_at = 0.0  # Clock time a 429 Retry-After ends
+        self._lock = threading.Lock()
+        self.count_requests = 0
+        self.count_waits = 0  # Requests that waited for a token
+        self.count_throttled = 0  # 429 responses that paused all requests
+        self.seconds_waited = 0.0
+        self.max_wait = 0.0
+
+    def acquire(self) -> float:
+        """Take a token for a request, waiting until one is available.
+
+        Returns:
+            float: Seconds waited.
+        """
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(
+                float(self.burst), self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1  # Reserve a token, negative while requests queue
+            wait = max(
+                -self._tokens / self.rate if self._tokens < 0 else 0.0,
+                self._resume_at - now,
+            )
+            self.count_requests += 1
+
+            if wait > 0:
+                self.count_waits += 1
+                self.seconds_waited += wait
+                self.max_wait = max(self.max_wait, wait)
+
+        if wait > 0:
+            self.sleep(wait)
+
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hold all requests for a number of seconds (e.g., after a 429).
+
+        Args:
+            seconds (float): Seconds to wait before the next request.
+        """
+        with self._lock:
+            self._resume_at = max(self._resume_at, self.clock() + seconds)
+            self.count_throttled += 1
+
+    def to_dict(self) -> dict:
+        """Get the rate limiter metrics.
+
+        Returns:
+            dict: Counts of requests, waits, and 429 pauses, and wait times.
+        """
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "count_requests": self.count_requests,
+            "count_waits": self.count_waits,
+            "count_throttled": self.count_throttled,
+            "seconds_waited": self.seconds_waited,
+            "max_wait": self.max_wait,
+        }
+
+    def __str__(self) -> str:
+        """Summarize the metrics, e.g. '120 requests, 20 waited 1.9s (max 0.1s)'."""
+        return (
+            f"{self.count_requests} requests at up to {self.rate:g}/s, "
+            f"{self.count_waits} waited {self.seconds_waited:.1f}s "
+            f"(max {self.max_wait:.1f}s), {self.count_throttled} throttled (429)"
+        )
+
+
+def get_rate_limiter(registry_type: str, project: Project) -> Optional[RateLimiter]:
+    """Get the rate limiter shared by all API requests to a registry type.
+
+    Rate limits are set per registry type in reflekt_project.yml:
+
+        registry:
+          segment:
+            rate_limit:
+              requests_per_second: 10
+              burst: 20  # Optional
+
+    Args:
+        registry_type (str): Type of the schema registry (e.g., 'segment').
+        project (Project): Reflekt project with the registry config.
+
+    Returns:
+        Optional[RateLimiter]: The shared rate limiter, or None if the registry
+            type has no rate limit.
+    """
+    config = ((project.registry or {}).get(registry_type) or {}).get("rate_limit")
+
+    if config is None:
+        return None
+
+    key = (registry_type, config["requests_per_second"], config.get("burst"))
+
+    with _rate_limiters_lock:
+        if key not in _rate_limiters:
+            _rate_limiters[key] = RateLimiter(
+                rate=config["requests_per_second"], burst=config.get("burst")
+            )
+
+        return _rate_limiters[key]
@@ -5,25 +5,41 @@
 from __future__ import annotations
 
 import copy
+import fnmatch
+import hashlib
 import json
-import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
 
-import requests
 from inflection import titleize
 from loguru import logger
 from requests import Response
 from rich.traceback import install
 
 from reflekt import SHOW_LOCALS
+from reflekt.cache import get_cache_dir, read_json, write_json
 from reflekt.casing import event_case
+from reflekt.catalog import SchemaCatalog
 from reflekt.constants import REFLEKT_JSON_SCHEMA
 from reflekt.errors import ApiResponseError, RegistryError, SelectArgError
 from reflekt.profile import Profile
 from reflekt.project import Project
+from reflekt.registry.rate_limit import get_rate_limiter
+from reflekt.registry.transport import HttpTransport
+from reflekt.registry.writer import SchemaWriter
 
 install(show_locals=SHOW_LOCALS)
 
+SEGMENT_PAGE_SIZE = 200  # Max items per page allowed by the Segment Public API
+DEFAULT_PLAN_CACHE_TTL = 24 * 60 * 60  # Seconds a cached plan name -> ID is used
+SEGMENT_BATCH_SIZE = 100  # Max rules per PATCH/DELETE request
+SEGMENT_BATCH_BYTES = 512 * 1024  # Max size of a PATCH/DELETE request body
+DEFAULT_PLAN_CONCURRENCY = 4  # Tracking plans pulled or pushed at the same time
+DEFAULT_BATCH_CONCURRENCY = 4  # PATCH/DELETE requests sent at the same time per plan
+RULE_FIELDS = ("key", "type", "version", "jsonSchema")  # Fields managed by Reflekt
 SEGMENT_JSON_SCHEMA = {
     "key": "",  # Schema name
     "type": "",  # TRACK/IDENTIFY/GROUP
@@ -46,6 +62,205 @@ SEGMENT_JSON_SCHEMA = {
 }
 
 
+def _normalize_rule(value):
+    """Normalize a rule so equivalent local and remote rules serialize the same.
+
+    Segment returns property types as lists (e.g., ["string"]) while Reflekt
+    schemas use a string for a single type.
+
+    Args:
+        value: Rule or part of a rule.
+
+    Returns:
+        The normalized value.
+    """
+    if isinstance(value, dict):
+        normalized = {key: _normalize_rule(item) for key, item in value.items()}
+        prop_type = normalized.get("type")
+
+        if isinstance(prop_type, list) and len(prop_type) == 1:
+            normalized["type"] = prop_type[0]
+
+        return normalized
+    elif isinstance(value, list):
+        return [_normalize_rule(item) for item in value]
+
+    return value
+
+
+def rule_key(rule: dict) -> tuple[str, str, int]:
+    """Get the (type, key, version) that identifies a rule in a tracking plan.
+
+    Args:
+        rule (dict): Segment rule.
+
+    Returns:
+        tuple[str, str, int]: Rule type, key (empty for IDENTIFY/GROUP), version.
+    """
+    return rule["type"], rule.get("key") or "", rule["version"]
+
+
+def canonical_rule(rule: dict) -> str:
+    """Serialize the Reflekt-managed fields of a rule as canonical JSON.
+
+    Args:
+        rule (dict): Segment rule, local or as returned by the API.
+
+    Returns:
+        str: JSON with sorted keys and no whitespace.
+    """
+    fields = {field: rule.get(field) for field in RULE_FIELDS}
+    fields["key"] = fields["key"] or ""
+
+    return json.dumps(
+        _normalize_rule(fields),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+
+class RuleDiff:
+    """Difference between local rules and the rules in a Segment tracking plan."""
+
+    def __init__(
+        self, added: list, changed: list, deleted: list, count_unchanged: int
+    ) -> None:
+        """Initialize RuleDiff.
+
+        Args:
+            added (list): Local rules missing from the tracking plan.
+            changed (list): Local rules that differ from the tracking plan.
+            deleted (list): Rules (type, key, and version) to delete from the
+                tracking plan.
+            count_unchanged (int): Number of local rules already in the plan.
+        """
+        self.added = added
+        self.changed = changed
+        self.deleted = deleted
+        self.count_unchanged = count_unchanged
+
+    @property
+    def upserts(self) -> list:
+        """Rules to add or update with PATCH requests."""
+        return self.added + self.changed
+
+    def __str__(self) -> str:
+        """Summarize the diff, e.g. '2 added, 1 changed, 0 deleted, 9 unchanged'."""
+        return (
+            f"{len(self.added)} added, {len(self.changed)} changed, "
+            f"{len(self.deleted)} deleted, {self.count_unchanged} unchanged"
+        )
+
+
+def diff_rules(
+    local: list, remote: list, delete: bool = False, prune: bool = False
+) -> RuleDiff:
+    """Compare local rules to remote rules, by canonical JSON per rule.
+
+    Args:
+        local (list): Rules built from Reflekt schemas.
+        remote (list): Rules in the Segment tracking plan.
+        delete (bool): Whether the local rules are to be deleted (reflekt push
+            --delete). Only rules in the tracking plan are deleted. Defaults to
+            False.
+        prune (bool): Whether remote rules missing locally are deleted (a whole
+            tracking plan is pushed). COMMON and ALIAS rules, which Reflekt does
+            not manage, are kept. Defaults to False.
+
+    Returns:
+        RuleDiff: Rules to add, change, and delete.
+    """
+    remote_by_key = {rule_key(rule): rule for rule in remote}
+    added, changed, deleted = [], [], []
+    count_unchanged = 0
+
+    for rule in local:
+        remote_rule = remote_by_key.get(rule_key(rule))
+
+        if delete:
+            if remote_rule is not None:
+                deleted.append(rule_key(rule))
+        elif remote_rule is None:
+            added.append(rule)
+        elif canonical_rule(rule) != canonical_rule(remote_rule):
+            changed.append(rule)
+        else:
+            count_unchanged += 1
+
+    if prune and not delete:
+        local_keys = {rule_key(rule) for rule in local}
+        deleted.extend(
+            key
+            for key, rule in remote_by_key.items()
+            if key not in local_keys and rule["type"] not in ["COMMON", "ALIAS"]
+        )
+
+    deleted = [
+        {"type": rule_type, "key": key, "version": version}
+        if key
+        else {"type": rule_type, "version": version}
+        for rule_type, key, version in deleted
+    ]
+
+    return RuleDiff(added, changed, deleted, count_unchanged)
+
+
+def iter_batches(
+    rules: list,
+    max_count: int = SEGMENT_BATCH_SIZE,
+    max_bytes: int = SEGMENT_BATCH_BYTES,
+) -> Iterator[list[bytes]]:
+    """Split rules into batches bounded by rule count and serialized size.
+
+    Rules are serialized once, as compact JSON. A rule larger than max_bytes on
+    its own is sent in a batch of one.
+
+    Args:
+        rules (list): Segment rules.
+        max_count (int): Maximum rules per batch. Defaults to SEGMENT_BATCH_SIZE.
+        max_bytes (int): Maximum size of a batch's rules, joined with commas.
+            Defaults to SEGMENT_BATCH_BYTES.
+
+    Yields:
+        list[bytes]: Serialized rules in each batch.
+    """
+    batch, size = [], 0
+
+    for rule in rules:
+        data = json.dumps(rule, separators=(",", ":"), ensure_ascii=False).encode()
+
+        if batch and (len(batch) == max_count or size + 1 + len(data) > max_bytes):
+            yield batch
+            batch, size = [], 0
+
+        if len(data) > max_bytes:
+            logger.warning(
+                f"Rule '{rule.get('key') or rule['type']}' is {len(data)} bytes, "
+                f"more than the batch limit of {max_bytes} bytes"
+            )
+
+        size += len(data) + (1 if batch else 0)  # Comma between rules
+        batch.append(data)
+
+    if batch:
+        yield batch
+
+
+def split_select(select: str) -> list[str]:
+    """Split a --select argument for several tracking plans (comma-separated).
+
+    Args:
+        select (str): The --select argument, e.g. 'plan_a,plan_b/Event_Name'.
+
+    Returns:
+        list[str]: Each selection, without duplicates, in the order given.
+    """
+    items = (item.strip().strip("/") for item in select.split(","))
+
+    return list(dict.fromkeys(item for item in items if item))
+
+
 class SegmentRegistry:
     """Class with methods for interacting with Segment's schema registry."""
 
@@ -73,6 +288,29 @@ class SegmentRegistry:
                     "Authorization": f"Bearer {self.api_token}",
                     "Content-Type": "application/json",
                 }
+                self.plan_cache_ttl = registry.get(
+                    "plan_cache_ttl", DEFAULT_PLAN_CACHE_TTL
+                )
+                self.plan_concurrency = registry.get(
+                    "plan_concurrency", DEFAULT_PLAN_CONCURRENCY
+                )
+                self.batch_concurrency = registry.get(
+                    "batch_concurrency", DEFAULT_BATCH_CONCURRENCY
+                )
+                # One keep-alive session with timeouts, retries, and the rate limit
+                # from reflekt_project.yml for all requests, with a connection per
+                # request in flight for each plan
+                self.transport = HttpTransport.from_config(
+                    registry,
+                    headers=self.headers,
+                    pool_maxsize=max(
+                        10, self.plan_concurrency * max(2, self.batch_concurrency)
+                    ),
+                    rate_limiter=get_rate_limiter(self.type, self.profile.project),
+                )
+
+        self._plan_ids: Optional[dict] = None  # Plan name -> ID, listed once
+        self._plan_lock = threading.Lock()  # Plans are pulled/pushed in threads
 
         if not self.config_exists:
             raise RegistryError(
@@ -83,40 +321,195 @@ class SegmentRegistry:
                 profile=self.profile,
             )
 
+    def _get_page(self, url: str, cursor: Optional[str]) -> dict:
+        """Get a page of results from a paginated Segment API endpoint.
+
+        Args:
+            url (str): URL of the endpoint.
+            cursor (Optional[str]): Cursor of the page. None for the first page.
+
+        Returns:
+            dict: The data in the response, including its 'pagination'.
+        """
+        params = {"pagination[count]": SEGMENT_PAGE_SIZE}
+
+        if cursor is not None:
+            params["pagination[cursor]"] = cursor
+
+        r = self.transport.get(url=url, params=params)
+        logger.debug(f"Request: {r.request.method} {r.url}")
+        logger.debug(f"    Status Code: {r.status_code}")
+        logger.debug(f"    Reason: {r.reason}")
+
+        return self._handle_response(r)
+
+    def _iter_pages(self, url: str, key: str, prefetch: bool = True) -> Iterator[list]:
+        """Iterate over the pages of a paginated Segment API endpoint.
+
+        Pages are requested following the 'next' cursor until the last page. With
+        prefetch, the next page is requested in a background thread while the
+        caller processes the current one.
+
+        Args:
+            url (str): URL of the endpoint.
+            key (str): Key of the items in the response data (e.g., 'rules').
+            prefetch (bool): Whether to request the next page in the background.
+                Defaults to True.
+
+        Yields:
+            list: Items in each page.
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        seen_cursors = set()
+
+        try:
+            data = self._get_page(url, None)
+
+            while True:
+                next_cursor = (data.get("pagination") or {}).get("next")
+
+                if next_cursor in seen_cursors:  # Guard against a cursor loop
+                    logger.warning(f"Segment API repeated cursor {next_cursor}")
+                    next_cursor = None
+
+                seen_cursors.add(next_cursor)
+                future = (
+                    executor.submit(self._get_page, url, next_cursor)
+                    if executor is not None and next_cursor
+                    else None
+                )
+                yield data.get(key, [])
+
+                if not next_cursor:
+                    return
+
+                data = (
+                    future.result()
+                    if future is not None
+                    else self._get_page(url, next_cursor)
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
     def _get_plans(self) -> list:
         """Retrieve list of dicts describing tracking plans and their attributes.
 
         Returns:
             list: A list of dicts describing tracking plans and their attributes.
         """
-        r = requests.get(
-            url=self.base_url, headers=self.headers, params={"pagination[count]": 200}
-        )
-        data = self._handle_response(r)
+        return [
+            plan
+            for page in self._iter_pages(self.base_url, "trackingPlans")
+            for plan in page
+        ]
+
+    def _plan_cache(self) -> tuple[Path, str, dict]:
+        """Read the cache of tracking plan name -> ID for this workspace.
+
+        Cached IDs are keyed by a hash of the API token (never stored), so
+        profiles for different workspaces do not share IDs.
+
+        Returns:
+            tuple[Path, str, dict]: Cache file, workspace key, and cached data.
+        """
+        cache_path = get_cache_dir(self.profile.project.dir) / "segment_plans.json"
+        workspace = hashlib.sha256(
+            f"{self.base_url}\0{self.api_token}".encode("utf-8")
+        ).hexdigest()[:16]
+
+        return cache_path, workspace, read_json(cache_path) or {}
 
-        return data["trackingPlans"]
+    def _list_plan_ids(self) -> dict[str, str]:
+        """List the ID of every tracking plan, keyed by plan name.
 
-    def _get_plan_id(self, plan_name: str) -> str:
+        Plans are listed once per registry and shared by every plan pulled or
+        pushed in the command. The IDs are also cached in .reflekt_cache/.
+
+        Returns:
+            dict[str, str]: Tracking plan name -> ID.
+        """
+        with self._plan_lock:  # Other threads wait for the same listing
+            if self._plan_ids is None:
+                plan_ids = {plan["name"]: plan["id"] for plan in self._get_plans()}
+
+                if self.plan_cache_ttl > 0:  # Later commands may use every plan
+                    cache_path, workspace, cached = self._plan_cache()
+                    now = time.time()
+                    cached[workspace] = {
+                        name: {"id": plan_id, "cached_at": now}
+                        for name, plan_id in plan_ids.items()
+                    }
+                    write_json(cache_path, cached)
+
+                self._plan_ids = plan_ids
+
+            return self._plan_ids
+
+    def _get_plan_id(self, plan_name: str, use_cache: bool = True) -> Optional[str]:
         """Get tracking plan ID from plan name as it appears in Segment Protocols.
 
         The plan ID uniquely identifies the tracking plan on Segment's servers.
+        IDs are cached in .reflekt_cache/ for plan_cache_ttl seconds, so repeated
+        commands skip listing every plan. Callers that get a 404 for a cached ID
+        should call _forget_plan_id() and look it up again.
 
         Args:
             plan_name (str): The name of the tracking plan.
+            use_cache (bool): Whether to use a cached ID. Defaults to True.
 
         Returns:
-            str: The ID of the tracking plan.
+            Optional[str]: The ID of the tracking plan, or None if it does not exist.
         """
-        plans = self._get_plans()
+        if not use_cache:
+            self._plan_ids = None  # List the plans again
+        elif self._plan_ids is not None:  # Plans listed by this command
+            return self._plan_ids.get(plan_name)
+        elif self.plan_cache_ttl > 0:
+            _, workspace, cached = self._plan_cache()
+            entry = cached.get(workspace, {}).get(plan_name)
+
+            if entry is not None and (
+                time.time() - entry["cached_at"] < self.plan_cache_ttl
+            ):
+                logger.debug(f"Using cached ID for tracking plan '{plan_name}'")
+
+                return entry["id"]
 
-        for plan in plans:
-            if plan["name"] == plan_name:
-                plan_id = plan["id"]
-                break  # Exit loop once plan ID is found
+        return self._list_plan_ids().get(plan_name)
+
+    def _set_plan_id(self, plan_name: str, plan_id: Optional[str]) -> None:
+        """Cache a tracking plan ID (e.g., for a new plan), or forget it if None.
+
+        Args:
+            plan_name (str): The name of the tracking plan.
+            plan_id (Optional[str]): The ID of the tracking plan.
+        """
+        with self._plan_lock:
+            if self._plan_ids is not None:
+                if plan_id is None:
+                    self._plan_ids.pop(plan_name, None)
+                else:
+                    self._plan_ids[plan_name] = plan_id
+
+            cache_path, workspace, cached = self._plan_cache()
+            plans = cached.setdefault(workspace, {})
+
+            if plan_id is None:
+                if plans.pop(plan_name, None) is None:
+                    return
             else:
-                plan_id = None
+                plans[plan_name] = {"id": plan_id, "cached_at": time.time()}
+
+            write_json(cache_path, cached)
 
-        return plan_id
+    def _forget_plan_id(self, plan_name: str) -> None:
+        """Forget a cached tracking plan ID (e.g., after a 404 for the plan).
+
+        Args:
+            plan_name (str): The name of the tracking plan.
+        """
+        self._set_plan_id(plan_name, None)
 
     def _parse_select(self, select: str) -> tuple[str, str, int]:
         """Parse --select arg into a tuple of (plan_name, schema_name, schema_ver).
@@ -171,6 +564,80 @@ class SegmentRegistry:
 
         return plan_name, schema_name, schema_major_version
 
+    def _expand_select(
+        self, select: str, plan_names: Callable[[], Iterable[str]]
+    ) -> list[str]:
+        """Expand a --select argument for one or more tracking plans.
+
+        The argument can list several selections separated by commas. The plan
+        name of each selection can be a glob (e.g., 'ecommerce_*'), matched
+        against plan_names.
+
+        Args:
+            select (str): The --select argument passed to Reflekt CLI.
+            plan_names (Callable[[], Iterable[str]]): Function returning the plan
+                names to match globs against. Only called if there is a glob.
+
+        Raises:
+            SelectArgError: No tracking plan matches a glob.
+
+        Returns:
+            list[str]: Selections, each for a single tracking plan.
+        """
+        selects = []
+        names = None
+
+        for item in split_select(select):
+            plan_pattern, sep, rest = item.partition("/")
+
+            if not any(char in plan_pattern for char in "*?["):
+                selects.append(item)
+                continue
+
+            if names is None:
+                names = sorted(plan_names())
+
+            matches = fnmatch.filter(names, plan_pattern)
+
+            if not matches:
+                raise SelectArgError(
+                    message=f"No tracking plans match '{plan_pattern}' in: {select}",
+                    select=select,
+                )
+
+            selects.extend(f"{name}{sep}{rest}" for name in matches)
+
+        return list(dict.fromkeys(selects))
+
+    def _map_plans(self, func: Callable, items: list, consume: Callable) -> None:
+        """Run func for each tracking plan concurrently, consuming results in order.
+
+        Requests share the registry's transport (its pooled connections and
+        retries) and run in a thread pool of plan_concurrency threads. Results
+        are consumed as soon as they and all results before them are ready, in the
+        calling thread only, so they are written in a stable order.
+
+        Args:
+            func (Callable): Blocking function of one item (e.g., fetch a plan).
+            items (list): Items to run func for, one per tracking plan.
+            consume (Callable): Function of (item, result), called in item order.
+        """
+        if len(items) <= 1 or self.plan_concurrency <= 1:
+            for item in items:
+                consume(item, func(item))
+
+            return
+
+        with ThreadPoolExecutor(max_workers=self.plan_concurrency) as executor:
+            futures = [executor.submit(func, item) for item in items]
+
+            try:
+                for item, future in zip(items, futures):
+                    consume(item, future.result())
+            finally:  # On an error, items not started yet are skipped
+                for future in futures:
+                    future.cancel()
+
     def _handle_response(self, response: Response) -> dict:
         """Handle response from the Segment API, returning requested data as a dict.
 
@@ -195,6 +662,40 @@ class SegmentRegistry:
 
         return response.json()["data"]
 
+    def _get_rules(self, plan_name: str) -> tuple[Optional[str], list]:
+        """Get the ID and all rules of a tracking plan.
+
+        A cached plan ID that no longer exists (404) is looked up again.
+
+        Args:
+            plan_name (str): The name of the tracking plan.
+
+        Returns:
+            tuple[Optional[str], list]: The plan ID and its rules, or (None, []) if
+                the plan does not exist.
+        """
+        for use_cache in (True, False):
+            plan_id = self._get_plan_id(plan_name, use_cache=use_cache)
+
+            if plan_id is None:
+                return None, []
+
+            try:
+                rules = [
+                    rule
+                    for page in self._iter_pages(
+                        self.base_url + f"/{plan_id}/rules", "rules"
+                    )
+                    for rule in page
+                ]
+            except ApiResponseError as error:
+                if error.response.status_code != 404 or not use_cache:
+                    raise
+
+                self._forget_plan_id(plan_name)
+            else:
+                return plan_id, rules
+
     def _get_segment(self, select: str) -> list:
         """Get Segment tracking plan schemas from API based on --select from CLI.
 
@@ -207,26 +708,17 @@ class SegmentRegistry:
         Returns:
             list: Tracking plan schemas from Segment Protocols.
         """
-        logger.info("Searching Segment for schemas")
         plan_name, schema_name, schema_version = self._parse_select(select)
-        plan_id = self._get_plan_id(plan_name)
-        r = requests.get(
-            url=self.base_url + f"/{plan_id}/rules",
-            headers=self.headers,
-            params={"pagination[count]": 200},
-        )
-        logger.debug("Logging request details sent to Segment API...")
-        logger.debug(f"Request Method: {r.request.method}")
-        logger.debug(f"Request URL: {r.url}")
-        logger.debug(f"Request Headers: {r.headers}")
-        logger.debug("Logging Segment API response details...")
-        logger.debug(f"    Status Code: {r.status_code}")
-        logger.debug(f"    Reason: {r.reason}")
-        logger.debug(f"    Response: {r.text}")
-        plan = self._handle_response(r)
-        s_schemas = [
-            rule for rule in plan["rules"] if rule["type"] not in ["COMMON", "ALIAS"]
-        ]
+        logger.info(f"Searching Segment for schemas in tracking plan '{plan_name}'")
+        plan_id, rules = self._get_rules(plan_name)
+
+        if plan_id is None:
+            raise SelectArgError(
+                message=f"Tracking plan '{plan_name}' not found in Segment.",
+                select=select,
+            )
+
+        s_schemas = [rule for rule in rules if rule["type"] not in ["COMMON", "ALIAS"]]
 
         if schema_name is not None:
             # Seeach using exact match
@@ -256,216 +748,371 @@ class SegmentRegistry:
                 select=select,
             )
         else:
-            logger.info(f"Found {len(s_schemas)} schemas to pull:")
+            logger.info(f"Found {len(s_schemas)} schemas to pull from '{plan_name}'")
 
         return s_schemas
 
-    def _post_put_patch_del_segment(
-        self, select: str, plan_name: str, schemas: list, delete: bool = False
-    ) -> None:
+    def _send_rules(self, method: str, plan_id: str, rules: list) -> None:
+        """Send rules to a tracking plan in batches, several batches at a time.
+
+        Batches are bounded by SEGMENT_BATCH_SIZE rules and SEGMENT_BATCH_BYTES
+        per request body. Batches update or delete different rules, so up to
+        batch_concurrency of them are sent at the same time. If a batch fails,
+        batches not started yet are skipped. Running push again resumes from
+        there, since only rules that still differ from Segment are sent.
+
+        Args:
+            method (str): 'PATCH' to add or update rules, 'DELETE' to delete them.
+            plan_id (str): The ID of the tracking plan.
+            rules (list): Rules to send.
+
+        Raises:
+            ApiResponseError: A batch failed.
+        """
+        url = self.base_url + f"/{plan_id}/rules"
+        prefix = f'{{"trackingPlanId":{json.dumps(plan_id)},"rules":['.encode()
+        batches = list(
+            iter_batches(rules, max_bytes=SEGMENT_BATCH_BYTES - len(prefix) - 2)
+        )
+
+        def send(batch: list[bytes]) -> int:
+            r = self.transport.request(
+                method, url=url, data=prefix + b",".join(batch) + b"]}"
+            )
+            logger.debug(f"{method} {len(batch)} rule(s): {r.status_code} {r.reason}")
+            self._handle_response(r)
+
+            return len(batch)
+
+        if len(batches) <= 1 or self.batch_concurrency <= 1:
+            count_sent = 0
+
+            for batch in batches:
+                try:
+                    count_sent += send(batch)
+                except Exception:
+                    self._log_partial_send(method, count_sent, len(rules))
+                    raise
+
+            return
+
+        with ThreadPoolExecutor(max_workers=self.batch_concurrency) as executor:
+            futures = [executor.submit(send, batch) for batch in batches]
+
+            try:
+                for future in futures:
+                    future.result()
+            except Exception:
+                for future in futures:  # Skip batches not started yet
+                    future.cancel()
+
+                executor.shutdown(wait=True)  # Let batches in flight finish
+                count_sent = sum(
+                    future.result()
+                    for future in futures
+                    if not future.cancelled() and future.exception() is None
+                )
+                self._log_partial_send(method, count_sent, len(rules))
+                raise
+
+    def _log_partial_send(self, method: str, count_sent: int, count_rules: int) -> None:
+        """Log how many rules were sent before a batch failed.
+
+        Args:
+            method (str): HTTP method of the batches.
+            count_sent (int): Number of rules in batches that succeeded.
+            count_rules (int): Number of rules to send.
+        """
+        logger.error(
+            f"{method} failed after {count_sent} of {count_rules} rule(s) were sent. "
+            f"Run reflekt push again to send the rest (only rules that differ from "
+            f"Segment are sent)."
+        )
+
+    def _sync_segment(
+        self,
+        plan_name: str,
+        schema_name: Optional[str],
+        schemas: list,
+        delete: bool = False,
+        partial: bool = False,
+        dry_run: bool = False,
+    ) -> RuleDiff:
         """Sync `--select`-ed schemas from Reflekt to Segment Protocols.
 
-        Tracking plan does not exists -> POST request to create tracking plan
-        Tracking plan exists -> PUT request to update tracking plan
-        Specific schema(s) selected -> PATCH request to update tracking plan
-        Delete flag set -> DELETE request to delete schema(s) from tracking plan
+        The tracking plan's rules are fetched and compared to the schemas, and only
+        the difference is sent:
+            Tracking plan does not exist -> POST request to create tracking plan
+            Added or changed rules -> PATCH requests
+            Rules missing locally (whole plan selected) -> DELETE requests
+            Delete flag set -> DELETE request for the selected schema(s)
 
         Args:
-            select (str): The --select argument passed to Reflekt CLI.
             plan_name (str): The name of the tracking plan.
-            schemas (list): A list of schemas to be updated in the tracking plan.
+            schema_name (Optional[str]): The schema name in the --select argument,
+                or None if the whole plan is selected.
+            schemas (list): Segment rules built from the selected schemas.
             delete (bool): Flag to delete the schemas identified by the --select
                 argument.
+            partial (bool): Flag that schemas are a subset of the --select-ed
+                schemas (e.g., --changed-since), so other rules must be kept.
+            dry_run (bool): Log the difference without sending any changes.
+
+        Returns:
+            RuleDiff: The difference between the schemas and the tracking plan.
         """
+        plan_id, remote_rules = self._get_rules(plan_name)
+        diff = diff_rules(
+            schemas,
+            remote_rules,
+            delete=delete,
+            prune=schema_name is None and not partial,
+        )
+        logger.info(f"Tracking plan '{plan_name}': {diff}")
+
+        for label, rules in (
+            ("Add", diff.added),
+            ("Change", diff.changed),
+            ("Delete", diff.deleted),
+        ):
+            for rule in rules:
+                (logger.info if dry_run else logger.debug)(
+                    f"    {label} {rule['type']} '{rule.get('key') or ''}' "
+                    f"version {rule['version']}"
+                )
 
-        plan_name, schema_name, _ = self._parse_select(select)
-        plan_id = self._get_plan_id(plan_name=plan_name)
+        if dry_run:
+            logger.info("Dry run, no changes sent to Segment")
 
-        if not delete:  # Add/Update schemas
-            if plan_id is None:  # Create new tracking plan if it doesn't exist
-                r = requests.post(
-                    url=self.base_url,
-                    headers=self.headers,
-                    json={"name": plan_name, "type": "LIVE"},
+            return diff
+
+        if plan_id is None and diff.upserts:  # Create tracking plan if needed
+            r = self.transport.post(
+                url=self.base_url,
+                json={"name": plan_name, "type": "LIVE"},
+            )
+            plan_data = self._handle_response(r)
+            plan_id = plan_data["trackingPlan"]["id"]
+            self._set_plan_id(plan_name, plan_id)
+
+        self._send_rules("PATCH", plan_id, diff.upserts)
+        self._send_rules("DELETE", plan_id, diff.deleted)
+
+        return diff
+
+    def _to_reflekt(self, plan_name: str, s_schema: dict) -> dict:
+        """Convert a Segment rule to a Reflekt JSON schema.
+
+        Args:
+            plan_name (str): The name of the tracking plan.
+            s_schema (dict): Segment rule.
+
+        Returns:
+            dict: Reflekt JSON schema.
+        """
+        if s_schema["type"] in ["IDENTIFY", "GROUP"]:
+            name = (
+                event_case(s_schema["type"], project=self.profile.project)
+                if self.profile.project.conventions["event"]["casing"] != "any"
+                else titleize(  # This is how it appears in Segment Protocols
+                    s_schema["type"]
                 )
-                plan_data = self._handle_response(r)
-                plan_id = plan_data["trackingPlan"]["id"]
-            else:
-                if schema_name is None:  # Update all schemas in tracking plan
-                    r = requests.put(
-                        url=self.base_url + f"/{plan_id}/rules",
-                        headers=self.headers,
-                        json={"trackingPlanId": plan_id, "rules": schemas},
-                    )
-                elif (
-                    schema_name is not None
-                ):  # Update specified schema(s) in tracking plan
-                    r = requests.patch(
-                        url=self.base_url + f"/{plan_id}/rules",
-                        headers=self.headers,
-                        json={"trackingPlanId": plan_id, "rules": schemas},
-                    )
-        else:  # Delete schemas
-            r = requests.delete(
-                url=self.base_url + f"/{plan_id}/rules",
-                headers=self.headers,
-                json={"trackingPlanId": plan_id, "rules": schemas},
+            )
+            description = f"Segment {str.lower(s_schema['type'])}() call."
+            metadata = s_schema["jsonSchema"].get("labels", {})
+            properties = (
+                s_schema["jsonSchema"]
+                .get("properties", {})
+                .get("traits", {})
+                .get("properties", {})
+            )
+            required = (
+                s_schema["jsonSchema"]
+                .get("properties", {})
+                .get("traits", {})
+                .get("required", [])
+            )
+            additional_properties = (
+                s_schema["jsonSchema"]
+                .get("properties", {})
+                .get("traits", {})
+                .get("additionalProperties", False)
+            )
+        elif s_schema["type"] == "TRACK":
+            name = s_schema["key"]
+            description = s_schema["jsonSchema"].get("description", "")
+            metadata = s_schema["jsonSchema"].get("labels", {})
+            properties = (
+                s_schema["jsonSchema"]
+                .get("properties", {})
+                .get("properties", {})
+                .get("properties", {})
+            )
+            required = (
+                s_schema["jsonSchema"]
+                .get("properties", {})
+                .get("properties", {})
+                .get("required", [])
+            )
+            additional_properties = (
+                s_schema["jsonSchema"]
+                .get("properties", {})
+                .get("properties", {})
+                .get("additionalProperties", False)
             )
 
-        logger.debug("Logging request details sent to Segment API...")
-        logger.debug(f"Request Method: {r.request.method}")
-        logger.debug(f"Request URL: {r.url}")
-        logger.debug(f"Request Headers: {r.headers}")
-        logger.debug(f"Request body: {r.request.body.decode('utf-8')}")
-        logger.debug("Logging Segment API response details...")
-        logger.debug(f"    Status Code: {r.status_code}")
-        logger.debug(f"    Reason: {r.reason}")
-        logger.debug(f"    Response: {r.text}")
-        self._handle_response(r)
-        logger.info("[green]Completed successfully[green/]")
+            if properties != {}:  # Cleanup 'type:' formatting
+                for key, _ in properties.items():
+                    if "type" in properties[key]:
+                        if len(properties[key]["type"]) == 1:  # Convert list to str
+                            properties[key]["type"] = properties[key]["type"][0]
+
+        version = f"{str(s_schema['version'])}-0"
+        # Schema IDs never have a space in them
+        id = f"{plan_name}/{name.replace(' ', '_')}/{version}.json"
+
+        # Copy empty Reflekt jsonschema and set values
+        r_schema = copy.deepcopy(REFLEKT_JSON_SCHEMA)
+        r_schema["$id"] = id
+        r_schema["description"] = description
+        r_schema["self"]["vendor"] = self.profile.project.vendor
+        r_schema["self"]["name"] = name
+        r_schema["self"]["version"] = version
+        r_schema["self"]["metadata"] = metadata
+        r_schema["properties"] = properties
+        r_schema["required"] = required
+        r_schema["additionalProperties"] = additional_properties
+
+        return r_schema
+
+    def _pull_plan(self, select: str) -> list:
+        """Get the --select-ed schemas of one tracking plan as Reflekt schemas.
 
-    def pull(self, select: str) -> int:
+        Args:
+            select (str): Selection for a single tracking plan.
+
+        Returns:
+            list: Reflekt JSON schemas.
+        """
+        plan_name, _, _ = self._parse_select(select)
+
+        return [
+            self._to_reflekt(plan_name, s_schema)
+            for s_schema in self._get_segment(select=select)
+        ]
+
+    def pull(self, select: str, prune: bool = False) -> int:
         """Pull schemas from Segment Protocols and write to Reflekt JSON schemas files.
 
+        --select can list several tracking plans (comma-separated) or a glob
+        (e.g., 'ecommerce_*'). Plans are fetched concurrently, up to
+        plan_concurrency at a time, and written one plan at a time in the order
+        selected. Files with unchanged content are not rewritten.
+
         Args:
             select (str): The --select argument passed to Reflekt CLI.
+            prune (bool): Whether to delete schemas that were removed from a plan
+                pulled in full (see SchemaWriter.prune). Defaults to False.
 
         Returns:
             int: The count of schemas pulled from Segment Protocols.
         """
-        plan_name, _, _ = self._parse_select(select)
-        s_schemas = self._get_segment(select=select)  # Segment schemas
-
-        for i, s_schema in enumerate(s_schemas, start=1):
-            if s_schema["type"] in ["IDENTIFY", "GROUP"]:
-                name = (
-                    event_case(s_schema["type"])
-                    if self.profile.project.conventions["event"]["casing"] != "any"
-                    else titleize(  # This is how it appears in Segment Protocols
-                        s_schema["type"]
-                    )
-                )
-                description = f"Segment {str.lower(s_schema['type'])}() call."
-                metadata = s_schema["jsonSchema"].get("labels", {})
-                properties = (
-                    s_schema["jsonSchema"]
-                    .get("properties", {})
-                    .get("traits", {})
-                    .get("properties", {})
-                )
-                required = (
-                    s_schema["jsonSchema"]
-                    .get("properties", {})
-                    .get("traits", {})
-                    .get("required", [])
-                )
-                additional_properties = (
-                    s_schema["jsonSchema"]
-                    .get("properties", {})
-                    .get("traits", {})
-                    .get("additionalProperties", False)
-                )
-            elif s_schema["type"] == "TRACK":
-                name = s_schema["key"]
-                description = s_schema["jsonSchema"].get("description", "")
-                metadata = s_schema["jsonSchema"].get("labels", {})
-                properties = (
-                    s_schema["jsonSchema"]
-                    .get("properties", {})
-                    .get("properties", {})
-                    .get("properties", {})
-                )
-                required = (
-                    s_schema["jsonSchema"]
-                    .get("properties", {})
-                    .get("properties", {})
-                    .get("required", [])
-                )
-                additional_properties = (
-                    s_schema["jsonSchema"]
-                    .get("properties", {})
-                    .get("properties", {})
-                    .get("additionalProperties", False)
-                )
+        selects = self._expand_select(select, lambda: self._list_plan_ids())
+        writer = SchemaWriter(self.profile.project, self.type)
+        counts = []
 
-                if properties != {}:  # Cleanup 'type:' formatting
-                    for key, _ in properties.items():
-                        if "type" in properties[key]:
-                            if len(properties[key]["type"]) == 1:  # Convert list to str
-                                properties[key]["type"] = properties[key]["type"][0]
-
-            version = f"{str(s_schema['version'])}-0"
-            # Schema IDs never have a space in them
-            id = f"{plan_name}/{name.replace(' ', '_')}/{version}.json"
-
-            # Copy empty Reflekt jsonschema and set values
-            r_schema = copy.deepcopy(REFLEKT_JSON_SCHEMA)
-            r_schema["$id"] = id
-            r_schema["description"] = description
-            r_schema["self"]["vendor"] = self.profile.project.vendor
-            r_schema["self"]["name"] = name
-            r_schema["self"]["version"] = version
-            r_schema["self"]["metadata"] = metadata
-            r_schema["properties"] = properties
-            r_schema["required"] = required
-            r_schema["additionalProperties"] = additional_properties
-
-            json_file = Path(self.profile.project.dir / "schemas" / r_schema["$id"])
-
-            if not json_file.parent.exists():
-                json_file.parent.mkdir(parents=True)
+        def write(select: str, r_schemas: list) -> None:
+            for r_schema in r_schemas:
+                writer.write(r_schema)
 
-            logger.info(
-                f"{i} of {len(s_schemas)} Writing to [magenta]{json_file}[magenta/]"
-            )
-            with open(json_file, "w", encoding="utf-8") as f:
-                json.dump(r_schema, f, indent=4, ensure_ascii=False)
-                f.write("\n")  # Add newline at end of file
+            plan_name, schema_name, _ = self._parse_select(select)
+
+            if prune and schema_name is None:  # Whole plan pulled
+                writer.prune(plan_name, [r_schema["$id"] for r_schema in r_schemas])
 
+            counts.append(len(r_schemas))
+
+        try:
+            self._map_plans(self._pull_plan, selects, write)
+        finally:  # Keep the manifest of plans written before an error
+            writer.save()
+
+        logger.info(f"Pulled {sum(counts)} schemas: {writer}")
         logger.info("[green]Completed successfully[green/]")
 
-        return len(s_schemas)  # Return the count of schemas pulled
+        return sum(counts)  # Return the count of schemas pulled
 
-    def push(self, select: str, delete: bool = False) -> int:
-        """Push Reflekt JSON schemas to Segment Protocols.
+    def _to_segment(self, r_schema: dict) -> dict:
+        """Convert a Reflekt JSON schema to a Segment rule.
 
         Args:
-            select (str): The --select argument passed to Reflekt CLI.
-            delete (bool): Flag to delete the schemas identified by the --select
-                argument.
+            r_schema (dict): Reflekt JSON schema.
+
+        Returns:
+            dict: Segment rule.
+        """
+        if str.lower(r_schema["self"]["name"]) in ["identify", "group"]:
+            s_schema = copy.deepcopy(SEGMENT_JSON_SCHEMA)
+            s_schema["type"] = r_schema["self"]["name"].upper()
+            s_schema["version"] = int(r_schema["self"]["version"].split("-")[0])
+            s_schema["jsonSchema"]["properties"]["traits"]["properties"] = r_schema[
+                "properties"
+            ]
+            s_schema["jsonSchema"]["properties"]["traits"]["required"] = r_schema[
+                "required"
+            ]
+            s_schema["jsonSchema"]["properties"]["traits"][
+                "additionalProperties"
+            ] = r_schema["additionalProperties"]
+        else:
+            s_schema = copy.deepcopy(SEGMENT_JSON_SCHEMA)
+            s_schema["key"] = r_schema["self"]["name"]
+            s_schema["type"] = "TRACK"
+            s_schema["version"] = int(r_schema["self"]["version"].split("-")[0])
+            s_schema["jsonSchema"]["labels"] = r_schema["self"]["metadata"]
+            s_schema["jsonSchema"]["description"] = r_schema["description"]
+            s_schema["jsonSchema"]["properties"]["properties"]["properties"] = r_schema[
+                "properties"
+            ]
+            s_schema["jsonSchema"]["properties"]["properties"]["required"] = r_schema[
+                "required"
+            ]
+            s_schema["jsonSchema"]["properties"]["properties"][
+                "additionalProperties"
+            ] = r_schema["additionalProperties"]
+
+        return s_schema
+
+    def _build_rules(
+        self, select: str, catalog: SchemaCatalog
+    ) -> Optional[tuple[str, Optional[str], list]]:
+        """Build Segment rules from the --select-ed schemas of one tracking plan.
+
+        Args:
+            select (str): Selection for a single tracking plan.
+            catalog (SchemaCatalog): Catalog used to find and load schemas.
 
         Raises:
-            SelectArgError: Error with the --select argument.
+            SelectArgError: No schemas found for the selection.
 
         Returns:
-            int: The count of schemas pushed to Segment Protocols.
+            Optional[tuple[str, Optional[str], list]]: Plan name, schema name (None
+                if the whole plan is selected), and rules. None if no schemas
+                changed (--changed-since).
         """
-        plan_name, _, schema_version = self._parse_select(select)
+        plan_name, schema_name, schema_version = self._parse_select(select)
 
         if schema_version is not None:
             select = f"{select}.json"
 
-        project = Project()
-        schema_paths = []  # list of schema paths to push
-        s_schemas = []  # Segment schemas
-        r_schemas = []  # Reflekt schemas
-        select_path = project.dir / "schemas" / select
-        logger.info(f"Searching for JSON schemas in: {str(select_path)}")
-
-        if select_path.is_dir():  # Get all schemas in directory
-            for root, _, files in os.walk(select_path):
-                for file in files:
-                    if file.endswith(".json"):
-                        schema_paths.append(Path(root) / file)
-        else:  # Get single schema file
-            if select_path.exists():
-                schema_paths.append(select_path)
-
-        for schema_path in schema_paths:  # Get all Reflekt schemas
-            with schema_path.open("r") as f:
-                r_schemas.append(json.load(f))
-
-        if len(r_schemas) == 0:
+        schema_paths = catalog.select(select)  # list of schema paths to push
+        r_schemas = catalog.load_many(schema_paths)  # Reflekt schemas
+
+        if len(r_schemas) == 0 and catalog.changed_since is not None:
+            logger.info(f"No changed schemas to push for: '--select {select}'")
+
+            return None
+        elif len(r_schemas) == 0:
             raise SelectArgError(
                 message=(
                     f"No schemas found in Reflekt project for: '--select {select}'\n\n"
@@ -476,49 +1123,86 @@ class SegmentRegistry:
         else:
             logger.info(f"Found {len(r_schemas)} schemas to push")
 
+        s_schemas = []  # Segment schemas
+
         for i, r_schema in enumerate(r_schemas, start=1):
             schema_path = self.profile.project.dir / "schemas" / r_schema["$id"]
             logger.info(
                 f"{i} of {len(schema_paths)} Pushing "
                 f"[magenta]{schema_path}[magenta/]"
             )
-            if str.lower(r_schema["self"]["name"]) in ["identify", "group"]:
-                s_schema = copy.deepcopy(SEGMENT_JSON_SCHEMA)
-                s_schema["type"] = r_schema["self"]["name"].upper()
-                s_schema["version"] = int(r_schema["self"]["version"].split("-")[0])
-                s_schema["jsonSchema"]["properties"]["traits"]["properties"] = r_schema[
-                    "properties"
-                ]
-                s_schema["jsonSchema"]["properties"]["traits"]["required"] = r_schema[
-                    "required"
-                ]
-                s_schema["jsonSchema"]["properties"]["traits"][
-                    "additionalProperties"
-                ] = r_schema["additionalProperties"]
-            else:
-                s_schema = copy.deepcopy(SEGMENT_JSON_SCHEMA)
-                s_schema["key"] = r_schema["self"]["name"]
-                s_schema["type"] = "TRACK"
-                s_schema["version"] = int(r_schema["self"]["version"].split("-")[0])
-                s_schema["jsonSchema"]["labels"] = r_schema["self"]["metadata"]
-                s_schema["jsonSchema"]["description"] = r_schema["description"]
-                s_schema["jsonSchema"]["properties"]["properties"][
-                    "properties"
-                ] = r_schema["properties"]
-                s_schema["jsonSchema"]["properties"]["properties"][
-                    "required"
-                ] = r_schema["required"]
-                s_schema["jsonSchema"]["properties"]["properties"][
-                    "additionalProperties"
-                ] = r_schema["additionalProperties"]
-
-            s_schemas.append(s_schema)
-
-        self._post_put_patch_del_segment(
-            select=select, plan_name=plan_name, schemas=s_schemas, delete=delete
+            s_schemas.append(self._to_segment(r_schema))
+
+        return plan_name, schema_name, s_schemas
+
+    def push(
+        self,
+        select: str,
+        delete: bool = False,
+        catalog: Optional[SchemaCatalog] = None,
+        dry_run: bool = False,
+    ) -> int:
+        """Push Reflekt JSON schemas to Segment Protocols.
+
+        Only rules that differ from the tracking plan in Segment are sent.
+        --select can list several tracking plans (comma-separated) or a glob
+        matched against the plans in schemas/. Schemas are loaded up front, then
+        plans are synced concurrently, up to plan_concurrency at a time.
+
+        Args:
+            select (str): The --select argument passed to Reflekt CLI.
+            delete (bool): Flag to delete the schemas identified by the --select
+                argument.
+            catalog (Optional[SchemaCatalog]): Catalog used to find and load
+                schemas. If None, a new catalog is created for the profile's project.
+            dry_run (bool): Log the rules that would be added, changed, or deleted
+                without sending them. Defaults to False.
+
+        Raises:
+            SelectArgError: Error with the --select argument.
+
+        Returns:
+            int: The count of schemas pushed to Segment Protocols.
+        """
+        if catalog is None:
+            catalog = SchemaCatalog(self.profile.project)
+
+        selects = self._expand_select(
+            select, lambda: {key.split("/")[0] for key in catalog.keys}
         )
+        plans: dict[str, list] = {}  # Plan name -> rules to sync, per selection
+
+        for plan_select in selects:
+            rules = self._build_rules(plan_select, catalog)
+
+            if rules is not None:
+                plans.setdefault(rules[0], []).append(rules)
+
+        def sync_plan(plan_rules: list) -> list:
+            # Selections of the same plan are synced one after the other
+            return [
+                self._sync_segment(
+                    plan_name=plan_name,
+                    schema_name=schema_name,
+                    schemas=s_schemas,
+                    delete=delete,
+                    partial=catalog.changed_since is not None,
+                    dry_run=dry_run,
+                )
+                for plan_name, schema_name, s_schemas in plan_rules
+            ]
+
+        self._map_plans(sync_plan, list(plans.values()), lambda *args: None)
 
-        return len(r_schemas)  # Return the count of schemas pushed
+        if plans and not dry_run:
+            logger.info("[green]Completed successfully[green/]")
+
+        # Return the count of schemas pushed
+        return sum(
+            len(s_schemas)
+            for plan_rules in plans.values()
+            for _, _, s_schemas in plan_rules
+        )
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,232 @@
+# SPDX-FileCopyrightText: 2022 Gregory Clunies <greg@reflekt-ci.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Callable, Optional, Union
+
+import requests
+from loguru import logger
+from requests import Response
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    from reflekt.registry.rate_limit import RateLimiter
+
+DEFAULT_CONNECT_TIMEOUT = 10.0  # Seconds to establish a connection
+DEFAULT_READ_TIMEOUT = 60.0  # Seconds to wait for response data
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF_FACTOR = 0.5  # Seconds, doubled on each retry
+MAX_BACKOFF = 30.0  # Longest wait between retries, unless Retry-After says more
+MAX_RETRY_AFTER = 300.0  # Longest Retry-After that is honored
+RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "PATCH", "DELETE"])
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or an HTTP date).
+
+    Args:
+        value (Optional[str]): Value of the Retry-After header.
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if missing or invalid.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class HttpTransport:
+    """HTTP client for schema registry APIs, shared by all requests of a registry.
+
+    Requests go through one requests.Session, so connections (and TLS sessions)
+    are kept alive and reused. Every request has a timeout. Connection errors and
+    429/5xx responses are retried with exponential backoff (with jitter), waiting
+    for the Retry-After header when the API sends one. POST requests, which are
+    not idempotent, are only retried when the server did not process them (429 or
+    a failed connection). With a RateLimiter, every attempt waits for a token, and
+    a 429 holds all requests sharing the limiter until Retry-After has passed.
+    """
+
+    def __init__(
+        self,
+        headers: Optional[dict] = None,
+        auth: Optional[requests.auth.AuthBase] = None,
+        timeout: Union[float, tuple[float, float]] = (
+            DEFAULT_CONNECT_TIMEOUT,
+            DEFAULT_READ_TIMEOUT,
+        ),
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        pool_maxsize: int = 10,
+        sleep: Callable[[float], None] = time.sleep,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        """Initialize HttpTransport.
+
+        Args:
+            headers (Optional[dict]): Headers sent with every request (e.g.,
+                Authorization). Defaults to None.
+            auth (Optional[AuthBase]): Auth used for every request. Defaults to None.
+            timeout (Union[float, tuple[float, float]]): Request timeout in seconds,
+                or (connect, read) timeouts. Defaults to (10, 60).
+            max_retries (int): Maximum number of retries per request. Defaults to
+                DEFAULT_MAX_RETRIES.
+            backoff_factor (float): Wait before the first retry in seconds, doubled
+                for each retry after that. Defaults to DEFAULT_BACKOFF_FACTOR.
+            pool_maxsize (int): Maximum number of connections kept alive per host.
+                Defaults to 10.
+            sleep (Callable[[float], None]): Function used to wait between retries.
+                Defaults to time.sleep.
+            rate_limiter (Optional[RateLimiter]): Rate limiter shared with other
+                transports for the same registry. Defaults to None.
+        """
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.sleep = sleep
+        self.rate_limiter = rate_limiter
+        self.session = requests.Session()
+        self.session.headers.update(headers or {})
+        self.session.auth = auth
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @classmethod
+    def from_config(cls, registry: dict, **kwargs) -> HttpTransport:
+        """Build a transport using the optional settings of a registry config.
+
+        Args:
+            registry (dict): Registry config from reflekt_profiles.yml. The
+                optional 'timeout' (seconds) and 'max_retries' keys are used.
+            **kwargs: Other arguments passed to HttpTransport (e.g., headers).
+
+        Returns:
+            HttpTransport: Transport for the registry.
+        """
+        if "timeout" in registry:
+            kwargs["timeout"] = registry["timeout"]
+
+        if "max_retries" in registry:
+            kwargs["max_retries"] = registry["max_retries"]
+
+        return cls(**kwargs)
+
+    def _backoff(self, retry: int) -> float:
+        """Get the wait before a retry: exponential, capped, with jitter.
+
+        Args:
+            retry (int): Number of the retry, starting at 0.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        delay = min(MAX_BACKOFF, self.backoff_factor * 2**retry)
+
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def request(self, method: str, url: str, **kwargs) -> Response:
+        """Send a request, retrying connection errors and 429/5xx responses.
+
+        Args:
+            method (str): HTTP method, e.g. 'GET'.
+            url (str): URL of the request.
+            **kwargs: Other arguments passed to requests.Session.request() (e.g.,
+                params, json).
+
+        Raises:
+            RequestException: The request failed on every attempt without a
+                response (e.g., connection refused, timeout).
+
+        Returns:
+            Response: The last response, which may still be an error if retries
+                ran out. Errors are handled by the registry.
+        """
+        method = method.upper()
+        kwargs.setdefault("timeout", self.timeout)
+        idempotent = method in IDEMPOTENT_METHODS
+
+        for retry in range(self.max_retries + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                # Read timeouts may have been processed by the server
+                retryable = idempotent or not isinstance(error, requests.ReadTimeout)
+
+                if not retryable or retry == self.max_retries:
+                    raise
+
+                delay = self._backoff(retry)
+                reason = repr(error)
+                throttled = False
+            else:
+                retryable = response.status_code in RETRY_STATUS_CODES and (
+                    idempotent or response.status_code == 429
+                )
+
+                if not retryable or retry == self.max_retries:
+                    return response
+
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                delay = (
+                    min(retry_after, MAX_RETRY_AFTER)
+                    if retry_after is not None
+                    else self._backoff(retry)
+                )
+                reason = f"{response.status_code} {response.reason}"
+                throttled = response.status_code == 429
+                response.close()  # Release the connection back to the pool
+
+            logger.debug(
+                f"{method} {url} failed ({reason}), retry {retry + 1} of "
+                f"{self.max_retries} in {delay:.2f}s"
+            )
+
+            if throttled and self.rate_limiter is not None:
+                self.rate_limiter.pause(delay)  # Next acquire() waits for everyone
+            else:
+                self.sleep(delay)
+
+    def get(self, url: str, **kwargs) -> Response:
+        """Send a GET request (see request())."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Response:
+        """Send a POST request (see request())."""
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> Response:
+        """Send a PUT request (see request())."""
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> Response:
+        """Send a PATCH request (see request())."""
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> Response:
+        """Send a DELETE request (see request())."""
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        """Close the session and its pooled connections."""
+        self.session.close()
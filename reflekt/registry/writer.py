@@ -0,0 +1,144 @@
+# SPDX-FileCopyrightText: 2022 Gregory Clunies <greg@reflekt-ci.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Iterable
+
+from loguru import logger
+
+from reflekt.cache import atomic_write, get_cache_dir, read_json, write_json
+from reflekt.project import Project
+
+
+def dump_schema(r_schema: dict) -> bytes:
+    """Serialize a Reflekt JSON schema as written to schemas/.
+
+    The format is fixed (4-space indent, UTF-8 without escapes, newline at end of
+    file), so pulling the same schema twice gives the same bytes.
+
+    Args:
+        r_schema (dict): Reflekt JSON schema.
+
+    Returns:
+        bytes: Serialized schema.
+    """
+    return (json.dumps(r_schema, indent=4, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class SchemaWriter:
+    """Writes schemas pulled from a schema registry to the project's schemas/.
+
+    Files whose content is unchanged are not rewritten, so their mtimes (used by
+    editors, dbt, and CI change detection) are kept. Files are written atomically
+    (temp file + rename). A manifest of the schemas pulled, with a hash of each
+    file, is kept in .reflekt_cache/pull/ to find schemas deleted in the registry.
+    """
+
+    def __init__(self, project: Project, registry_type: str) -> None:
+        """Initialize SchemaWriter.
+
+        Args:
+            project (Project): Reflekt project to write schemas to.
+            registry_type (str): Type of the schema registry (e.g., 'segment').
+        """
+        self.schemas_dir = project.dir / "schemas"
+        self.manifest_path = (
+            get_cache_dir(project.dir) / "pull" / f"{registry_type}.json"
+        )
+        self.manifest: dict[str, str] = read_json(self.manifest_path) or {}
+        self.count_written = 0
+        self.count_unchanged = 0
+        self.count_deleted = 0
+
+    def write(self, r_schema: dict) -> bool:
+        """Write a schema to schemas/<$id>, unless the file has the same content.
+
+        Args:
+            r_schema (dict): Reflekt JSON schema.
+
+        Returns:
+            bool: Whether the file was written.
+        """
+        key = r_schema["$id"]
+        json_file = self.schemas_dir / key
+        data = dump_schema(r_schema)
+        self.manifest[key] = _digest(data)
+
+        try:
+            unchanged = json_file.read_bytes() == data
+        except FileNotFoundError:
+            unchanged = False
+
+        if unchanged:
+            logger.debug(f"Unchanged [magenta]{json_file}[magenta/]")
+            self.count_unchanged += 1
+
+            return False
+
+        logger.info(f"Writing to [magenta]{json_file}[magenta/]")
+        json_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(json_file, data)
+        self.count_written += 1
+
+        return True
+
+    def prune(self, prefix: str, keys: Iterable[str]) -> None:
+        """Delete schemas pulled before under prefix that are no longer pulled.
+
+        Only files written by an earlier pull and not edited since (same hash as
+        in the manifest) are deleted. Schemas created or edited locally are kept.
+
+        Args:
+            prefix (str): Directory in schemas/ that was pulled in full (e.g., a
+                tracking plan).
+            keys (Iterable[str]): Schema IDs pulled under prefix.
+        """
+        pulled = set(keys)
+        prefix = f"{prefix.strip('/')}/"
+
+        for key, digest in list(self.manifest.items()):
+            if not key.startswith(prefix) or key in pulled:
+                continue
+
+            del self.manifest[key]
+            json_file = self.schemas_dir / key
+
+            try:
+                data = json_file.read_bytes()
+            except FileNotFoundError:
+                continue
+
+            if _digest(data) != digest:
+                logger.warning(
+                    f"Keeping [magenta]{json_file}[magenta/], which is no longer in "
+                    f"the schema registry but was edited locally"
+                )
+                continue
+
+            logger.info(f"Deleting [magenta]{json_file}[magenta/]")
+            json_file.unlink()
+            self.count_deleted += 1
+
+            try:  # Remove the schema's directory once its last version is deleted
+                json_file.parent.rmdir()
+            except OSError:
+                pass
+
+    def save(self) -> None:
+        """Save the manifest of pulled schemas to .reflekt_cache/pull/."""
+        write_json(self.manifest_path, self.manifest)
+
+    def __str__(self) -> str:
+        """Summarize the writes, e.g. '2 written, 40 unchanged, 1 deleted'."""
+        return (
+            f"{self.count_written} written, {self.count_unchanged} unchanged, "
+            f"{self.count_deleted} deleted"
+        )
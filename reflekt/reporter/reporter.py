@@ -2,8 +2,11 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+from __future__ import annotations
+
 import json
 from pathlib import Path
+from typing import Optional
 
 from loguru import logger
 
@@ -20,19 +23,24 @@ class Reporter:
         """Initialize Reflekt Reporter."""
         self.parser = JSONParser()
 
-    def build_md(self, schema_path: Path) -> str:
+    def build_md(self, schema_path: Path, schema: Optional[dict] = None) -> str:
         """Build a markdown report from a JSON schema file.
 
         Args:
             schema_path (Path): Path to JSON schema file.
+            schema (Optional[dict]): The already parsed schema (e.g., from a
+                SchemaCatalog). If None, the schema is loaded from schema_path.
 
         Returns:
             str: Markdown report string for the schema.
         """
         logger.info(f"Generating Markdown report for schema in: {schema_path}")
 
-        with open(schema_path, "r") as f:
-            schema_obj = json.load(f)
+        if schema is not None:
+            schema_obj = schema
+        else:
+            with open(schema_path, "r") as f:
+                schema_obj = json.load(f)
 
         md_lines = self.parser.parse_schema(schema_obj)
         md_str = "".join(md_lines)
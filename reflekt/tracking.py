@@ -2,12 +2,12 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import functools
 import os
 import uuid
 from pathlib import Path
 from typing import Optional
 
-import segment.analytics as segment_analytics  # FOR DEBUGGING, use 'import analytics as segment_analytics'  # noqa: E501
 import yaml
 from loguru import logger
 
@@ -22,15 +22,29 @@ def on_error(error):
     logger.error("An error occurred:", error)
 
 
-# Setup Segment
-if os.getenv("REFLEKT_SEGMENT_WRITE_KEY_DEV") is not None:
-    segment_analytics.write_key = os.getenv("REFLEKT_SEGMENT_WRITE_KEY_DEV")
-    segment_analytics.debug = (
-        True if os.getenv("REFLEKT_SHOW_LOCALS") == "true" else False
-    )
-    segment_analytics.on_error = on_error
-else:
-    segment_analytics.write_key = "2r0G0DfAXeRZ9ZUhfa9Xk1Hk3FnO2GnW"
+@functools.lru_cache(maxsize=None)
+def get_segment_analytics():
+    """Import and set up Segment analytics on first use.
+
+    Segment analytics (and requests) is slow to import, so it is only imported when
+    an event is tracked, not every time the CLI starts.
+
+    Returns:
+        ModuleType: The configured segment.analytics module.
+    """
+    import segment.analytics as segment_analytics  # FOR DEBUGGING, use 'import analytics as segment_analytics'  # noqa: E501
+
+    # Setup Segment
+    if os.getenv("REFLEKT_SEGMENT_WRITE_KEY_DEV") is not None:
+        segment_analytics.write_key = os.getenv("REFLEKT_SEGMENT_WRITE_KEY_DEV")
+        segment_analytics.debug = (
+            True if os.getenv("REFLEKT_SHOW_LOCALS") == "true" else False
+        )
+        segment_analytics.on_error = on_error
+    else:
+        segment_analytics.write_key = "2r0G0DfAXeRZ9ZUhfa9Xk1Hk3FnO2GnW"
+
+    return segment_analytics
 
 
 class ReflektUser:
@@ -94,4 +108,4 @@ def track_event(user_id: str, event_name: str, properties: dict, context: dict):
         properties (dict): The event properties.
         context (dict): The event context.
     """
-    segment_analytics.track(user_id, event_name, properties, context)
+    get_segment_analytics().track(user_id, event_name, properties, context)
@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: 2022 Gregory Clunies <greg@reflekt-ci.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import pkgutil
+from pathlib import Path
+
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+from reflekt import __version__
+from reflekt.cache import get_cache_dir, read_json, write_json
+
+CONFIG_SCHEMA_VERSION = "1-0"
+MAX_VALIDATED_DIGESTS = 32  # Per config type, oldest are dropped first
+
+
+@functools.lru_cache(maxsize=None)
+def get_config_validator(config_type: str):
+    """Get the compiled validator for reflekt_project.yml or reflekt_profiles.yml.
+
+    The bundled meta-schema is loaded, checked, and compiled once per process.
+
+    Args:
+        config_type (str): Type of config, 'project' or 'profile'.
+
+    Returns:
+        Validator: jsonschema validator for the config type.
+    """
+    schema = json.loads(
+        pkgutil.get_data(
+            "reflekt", f"_validation/{config_type}/{CONFIG_SCHEMA_VERSION}.json"
+        )
+    )
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+
+    return validator_cls(schema)
+
+
+def validate_config(config_type: str, config: dict) -> None:
+    """Validate a config against its meta-schema.
+
+    Args:
+        config_type (str): Type of config, 'project' or 'profile'.
+        config (dict): The config to validate.
+
+    Raises:
+        ValidationError: The config is invalid. Same error as jsonschema.validate().
+    """
+    error = best_match(get_config_validator(config_type).iter_errors(config))
+
+    if error is not None:
+        raise error
+
+
+def config_digest(content: bytes, *keys: str) -> str:
+    """Hash config file content with the reflekt version and meta-schema version.
+
+    Args:
+        content (bytes): Raw content of the YAML config file.
+        *keys (str): Extra values that identify what was validated (e.g., the
+            profile name in reflekt_profiles.yml).
+
+    Returns:
+        str: Hex digest.
+    """
+    digest = hashlib.sha256(content)
+
+    for key in (__version__, CONFIG_SCHEMA_VERSION, *keys):
+        digest.update(b"\0" + key.encode("utf-8"))
+
+    return digest.hexdigest()
+
+
+def is_validated(cache_root: Path, config_type: str, digest: str) -> bool:
+    """Check if config content with this digest was already validated.
+
+    Args:
+        cache_root (Path): Directory containing .reflekt_cache/.
+        config_type (str): Type of config, 'project' or 'profile'.
+        digest (str): Digest from config_digest().
+
+    Returns:
+        bool: True if the content is known to be valid.
+    """
+    cached = read_json(get_cache_dir(cache_root) / "validated_configs.json") or {}
+
+    return digest in cached.get(config_type, [])
+
+
+def record_validated(cache_root: Path, config_type: str, digest: str) -> None:
+    """Record that config content with this digest is valid.
+
+    Args:
+        cache_root (Path): Directory containing .reflekt_cache/.
+        config_type (str): Type of config, 'project' or 'profile'.
+        digest (str): Digest from config_digest().
+    """
+    cache_path = get_cache_dir(cache_root) / "validated_configs.json"
+    cached = read_json(cache_path) or {}
+    digests = [d for d in cached.get(config_type, []) if d != digest]
+    digests.append(digest)
+    cached[config_type] = digests[-MAX_VALIDATED_DIGESTS:]
+    write_json(cache_path, cached)
@@ -0,0 +1,249 @@
+# SPDX-FileCopyrightText: 2022 Gregory Clunies <greg@reflekt-ci.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Local stand-in HTTP servers for schema registry API tests."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class MockApiHandler(BaseHTTPRequestHandler):
+    """Request handler that delegates to the server's handle() callback."""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive
+
+    def _respond(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        url = urlparse(self.path)
+        request = {
+            "method": self.command,
+            "path": url.path,
+            "query": {k: v[-1] for k, v in parse_qs(url.query).items()},
+            "headers": dict(self.headers),
+            "json": json.loads(body) if body else None,
+            "client": self.client_address,
+        }
+        self.server.requests.append(request)
+        status, headers, data, delay = self.server.handle(request)
+
+        if delay:
+            time.sleep(delay)
+
+        payload = json.dumps(data).encode("utf-8") if data is not None else b""
+
+        try:
+            self.send_response(status)
+
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        except (BrokenPipeError, ConnectionResetError):  # Client timed out
+            pass
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+    def log_message(self, format, *args) -> None:  # Keep test output quiet
+        pass
+
+
+class MockApi(ThreadingHTTPServer):
+    """Local HTTP server that answers with a handle(request) callback.
+
+    handle() returns (status, headers, data, delay), where data is serialized as
+    JSON and delay (seconds) is waited before responding, to inject latency.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, handle) -> None:
+        super().__init__(("127.0.0.1", 0), MockApiHandler)
+        self.handle = handle
+        self.requests = []
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address
+
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "MockApi":
+        self._thread.start()
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def scripted(*responses):
+    """Build a handle() callback that answers with responses in order.
+
+    The last response is repeated once the script runs out.
+    """
+    responses = list(responses)
+
+    def handle(request):
+        return responses.pop(0) if len(responses) > 1 else responses[0]
+
+    return handle
+
+
+class MockSegment:
+    """In-memory stand-in for the Segment Public API tracking plan endpoints.
+
+    List endpoints are paginated with opaque cursors, like the real API.
+    """
+
+    def __init__(self, plans: dict, page_size: int = 200, delay: float = 0) -> None:
+        """Initialize MockSegment.
+
+        Args:
+            plans (dict): Plan ID -> {"name": ..., "rules": [...]}.
+            page_size (int): Maximum items per page the API returns.
+            delay (float): Latency added to every response, in seconds.
+        """
+        self.plans = plans
+        self.page_size = page_size
+        self.delay = delay
+
+    def _page(self, request, key, items):
+        count = min(int(request["query"].get("pagination[count]", 10)), self.page_size)
+        start = int(request["query"].get("pagination[cursor]", "c0")[1:])
+        end = start + count
+        data = {
+            key: items[start:end],
+            "pagination": {
+                "current": f"c{start}",
+                "next": f"c{end}" if end < len(items) else None,
+                "totalEntries": len(items),
+            },
+        }
+
+        return 200, None, {"data": data}, self.delay
+
+    def __call__(self, request):
+        parts = request["path"].strip("/").split("/")  # tracking-plans/<id>/rules
+
+        if request["method"] == "GET" and len(parts) == 1:
+            plans = [
+                {"id": plan_id, "name": plan["name"]}
+                for plan_id, plan in self.plans.items()
+            ]
+
+            return self._page(request, "trackingPlans", plans)
+
+        if request["method"] == "GET" and len(parts) == 3:
+            if parts[1] not in self.plans:
+                return 404, None, {"errors": [{"message": "Not found"}]}, self.delay
+
+            return self._page(request, "rules", self.plans[parts[1]]["rules"])
+
+        if request["method"] == "POST" and len(parts) == 1:
+            plan_id = f"tp_{len(self.plans) + 1}"
+            self.plans[plan_id] = {"name": request["json"]["name"], "rules": []}
+            data = {"trackingPlan": {"id": plan_id, "name": request["json"]["name"]}}
+
+            return 200, None, {"data": data}, self.delay
+
+        if len(parts) == 3 and request["method"] in ("PUT", "PATCH", "DELETE"):
+            if parts[1] not in self.plans:
+                return 404, None, {"errors": [{"message": "Not found"}]}, self.delay
+
+            plan = self.plans[parts[1]]
+            rules = request["json"]["rules"]
+
+            if request["method"] == "PUT":
+                plan["rules"] = list(rules)
+            else:
+                keys = {rule_key(rule) for rule in rules}
+                plan["rules"] = [r for r in plan["rules"] if rule_key(r) not in keys]
+
+                if request["method"] == "PATCH":
+                    plan["rules"].extend(rules)
+
+            return 200, None, {"data": {}}, self.delay
+
+        return 405, None, {"errors": [{"message": "Not supported"}]}, self.delay
+
+
+def rule_key(rule: dict) -> tuple:
+    """Get the (type, key, version) that identifies a Segment rule."""
+    return rule["type"], rule.get("key") or "", rule["version"]
+
+
+def make_rules(count: int, version: int = 1) -> list:
+    """Build Segment TRACK rules named 'Event 0', 'Event 1', ..."""
+    return [
+        {
+            "key": f"Event {i}",
+            "type": "TRACK",
+            "version": version,
+            "jsonSchema": {
+                "$schema": "http://json-schema.org/draft-07/schema#",
+                "type": "object",
+                "labels": {},
+                "description": f"Event {i}.",
+                "properties": {
+                    "context": {},
+                    "traits": {},
+                    "properties": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"description": "ID.", "type": ["string"]}
+                        },
+                        "required": ["id"],
+                    },
+                },
+            },
+        }
+        for i in range(count)
+    ]
+
+
+class InFlight:
+    """Wraps a handle() callback to count the requests it handles at once.
+
+    Matching requests are held until `wait_for` of them are in flight at the same
+    time (or `timeout` seconds pass), so concurrent clients overlap deterministically
+    while a client sending one request at a time never gets past 1.
+    """
+
+    def __init__(self, handle, match, wait_for: int = 2, timeout: float = 5) -> None:
+        self.handle = handle
+        self.match = match
+        self.wait_for = wait_for
+        self.timeout = timeout
+        self.count = 0
+        self.max_count = 0
+        self._lock = threading.Lock()
+        self._overlapped = threading.Event()
+
+    def __call__(self, request):
+        if not self.match(request):
+            return self.handle(request)
+
+        with self._lock:
+            self.count += 1
+            self.max_count = max(self.max_count, self.count)
+
+            if self.count >= self.wait_for:
+                self._overlapped.set()
+
+        try:
+            self._overlapped.wait(self.timeout)
+
+            return self.handle(request)
+        finally:
+            with self._lock:
+                self.count -= 1
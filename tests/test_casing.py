@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2022 Gregory Clunies <greg@reflekt-ci.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from pathlib import Path
+
+import pytest
+
+from reflekt.casing import (
+    CASE_PATTERNS,
+    CaseConverter,
+    _convert_case,
+    event_case,
+    get_case_converter,
+    property_case,
+)
+from reflekt.project import Project
+
+
+def _name_corpus() -> list[str]:
+    """Event and property names from the example schemas, in several casings.
+
+    Names repeat the way they do in a tracking plan: each property name appears
+    in hundreds of events.
+    """
+    names = set()
+
+    for schema_path in Path("./schemas").glob("**/*.json"):
+        r_schema = json.loads(schema_path.read_text())
+        names.add(r_schema.get("self", {}).get("name", "Unknown Event"))
+        names.update(r_schema.get("properties", {}))
+
+    variants = set()
+
+    for name in sorted(names):
+        for casing in ("snake", "camel", "pascal", "title"):
+            converted = _convert_case(name, {"casing": casing, "numbers": False})
+            variants.update([converted, f"{converted}2", f"{converted} V2"])
+
+    return sorted(variants) * 50
+
+
+@pytest.mark.parametrize("casing", list(CASE_PATTERNS))
+@pytest.mark.parametrize("numbers", [False, True])
+def test_case_converter_matches_convert_case(casing, numbers):
+    """Test that memoized conversions and checks match _convert_case()."""
+    convention = {"casing": casing, "numbers": numbers}
+    converter = CaseConverter(convention, maxsize=16)  # Exercise evictions
+    names = sorted(set(_name_corpus()))
+    expected = [_convert_case(name, convention) for name in names]
+
+    assert [converter.convert(name) for name in names] == expected
+    assert converter.convert_many(names + names[::-1]) == expected + expected[::-1]
+    assert [converter.is_case(name) for name in names] == [
+        name == converted for name, converted in zip(names, expected)
+    ]
+
+
+def test_event_and_property_case_use_project_conventions():
+    """Test that the wrappers follow edits to project.conventions."""
+    project = Project(path="./reflekt_project.yml")
+    project.conventions["event"] = {"casing": "title", "numbers": False}
+    project.conventions["property"] = {"casing": "camel", "numbers": True}
+
+    assert event_case("order_completed", project=project) == "Order Completed"
+    assert property_case("step_2_name", project=project) == "stepName"
+
+    project.conventions["property"] = {"casing": "snake", "numbers": False}
+
+    assert property_case("step2Name", project=project) == "step2_name"
+    assert get_case_converter(project.conventions["property"]) is (
+        get_case_converter({"casing": "snake", "numbers": False})
+    )
+
+
+def test_case_converter_memoizes():
+    """Test that each distinct name is converted once, then read from the cache."""
+    names = _name_corpus()
+    count_distinct = len(set(names))
+
+    assert count_distinct < len(names)  # Names repeat, like in a schemas/ dir
+
+    for casing in ("snake", "camel", "title"):
+        convention = {"casing": casing, "numbers": True}
+        expected = [_convert_case(name, convention) for name in names]
+        converter = CaseConverter(convention)
+
+        assert converter.convert_many(names) == expected
+        assert converter.convert.cache_info().misses == count_distinct
+        assert converter.convert.cache_info().hits == 0  # Repeats in a batch
+
+        assert converter.convert_many(names) == expected
+        assert converter.convert.cache_info().misses == count_distinct
+        assert converter.convert.cache_info().hits == count_distinct
@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: 2022 Gregory Clunies <greg@reflekt-ci.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from reflekt.cache import atomic_write
+from reflekt.catalog import SchemaCatalog
+from reflekt.errors import ChangedSinceArgError
+from reflekt.project import Project
+
+
+def test_catalog_select():
+    """Test --select resolves to a directory of schemas or a single schema."""
+    project = Project(path="./reflekt_project.yml")
+    catalog = SchemaCatalog(project)
+    schemas_dir = project.dir / "schemas"
+
+    assert catalog.select("jaffle_shop/Cart_Viewed/1-0") == [
+        schemas_dir / "jaffle_shop/Cart_Viewed/1-0.json"
+    ]
+    assert catalog.select("jaffle_shop/Cart_Viewed/1-0.json") == [
+        schemas_dir / "jaffle_shop/Cart_Viewed/1-0.json"
+    ]
+    assert len(catalog.select("jaffle_shop")) == 9
+    assert len(catalog.select("jaffle_shop/")) == 9
+    assert catalog.select("jaffle") == []  # Prefix of a directory is not a match
+    assert catalog.select("does_not_exist") == []
+    assert not any(".reflekt" in str(path) for path in catalog.select(""))
+
+
+def test_catalog_parses_each_schema_once(monkeypatch):
+    """Test that schemas are parsed once no matter how often they are loaded."""
+    project = Project(path="./reflekt_project.yml")
+    catalog = SchemaCatalog(project, use_cache=False)
+    count_parses = 0
+    original_loads = json.loads
+
+    def counting_loads(*args, **kwargs):
+        nonlocal count_parses
+        count_parses += 1
+        return original_loads(*args, **kwargs)
+
+    monkeypatch.setattr(json, "loads", counting_loads)
+    schema_paths = catalog.select("jaffle_shop")
+    catalog.load_many(schema_paths)
+    catalog.load_many(schema_paths)
+    catalog.find(name="Cart Viewed")
+
+    assert count_parses == len(catalog.keys)
+
+
+def test_catalog_load_returns_copies(tmp_path):
+    """Test that changing a loaded schema does not change the cached schema."""
+    shutil.copy("./tests/fixtures/reflekt_project.yml", tmp_path)
+    shutil.copytree("./schemas", tmp_path / "schemas")
+    project = Project(path=str(tmp_path / "reflekt_project.yml"))
+    catalog = SchemaCatalog(project)
+    schema_path = catalog.select("jaffle_shop/Cart_Viewed/1-0")[0]
+    expected = json.loads(schema_path.read_text())
+    r_schema = catalog.load(schema_path)
+    r_schema["properties"]["cart_id"]["type"] = "integer"
+    del r_schema["required"]
+    catalog.save()
+
+    assert catalog.load(schema_path) == expected
+    assert SchemaCatalog(project).load(schema_path) == expected  # From the cache
+
+
+def test_catalog_find():
+    """Test schemas can be found by $id, name, version, vendor and metadata keys."""
+    project = Project(path="./reflekt_project.yml")
+    catalog = SchemaCatalog(project)
+    cart_viewed = project.dir / "schemas/jaffle_shop/Cart_Viewed/1-0.json"
+
+    assert catalog.find(id="jaffle_shop/Cart_Viewed/1-0.json") == [cart_viewed]
+    assert catalog.find(name="Cart Viewed", version="1-0") == [cart_viewed]
+    assert cart_viewed in catalog.find(vendor="com.thejaffleshop")
+    assert catalog.find(name="Cart Viewed", version="2-0") == []
+    assert catalog.find(metadata_key="does_not_exist") == []
+
+
+def test_catalog_parse_cache(tmp_path, monkeypatch):
+    """Test unchanged schemas are reused from .reflekt_cache in later runs."""
+    shutil.copy("./tests/fixtures/reflekt_project.yml", tmp_path)
+    shutil.copytree("./schemas/jaffle_shop", tmp_path / "schemas" / "jaffle_shop")
+    project = Project(path=str(tmp_path / "reflekt_project.yml"))
+    schema_paths = SchemaCatalog(project).select("")
+    expected = SchemaCatalog(project).load_many(schema_paths)  # Populate cache
+
+    assert (tmp_path / ".reflekt_cache" / "schemas.bin").exists()
+
+    count_parses = 0
+    original_loads = json.loads
+
+    def counting_loads(*args, **kwargs):
+        nonlocal count_parses
+        count_parses += 1
+        return original_loads(*args, **kwargs)
+
+    monkeypatch.setattr(json, "loads", counting_loads)
+
+    assert SchemaCatalog(project).load_many(schema_paths) == expected
+    assert count_parses == 0
+
+    # Edited schemas are re-parsed
+    schema = dict(expected[0], description="Edited description.")
+    schema_paths[0].write_text(json.dumps(schema, indent=4))
+
+    assert SchemaCatalog(project).load_many(schema_paths)[0] == schema
+    assert count_parses == 1
+
+    # Changed conventions invalidate the whole cache
+    project.conventions["property"]["casing"] = "camel"
+    SchemaCatalog(project).load_many(schema_paths)
+
+    assert count_parses == 1 + len(schema_paths)
+
+
+def test_catalog_iter_load_preserves_order():
+    """Test schemas loaded by the thread pool are yielded in the order selected."""
+    project = Project(path="./reflekt_project.yml")
+    schema_paths = SchemaCatalog(project).select("")
+    sequential = list(
+        SchemaCatalog(project, use_cache=False, threads=1).iter_load(schema_paths)
+    )
+    threaded = list(
+        SchemaCatalog(project, use_cache=False, threads=4).iter_load(schema_paths)
+    )
+
+    assert [path for path, _ in threaded] == schema_paths
+    assert threaded == sequential
+
+
+def test_catalog_changed_since(tmp_path):
+    """Test --changed-since selects schemas changed since a Git ref."""
+    shutil.copy("./tests/fixtures/reflekt_project.yml", tmp_path)
+    shutil.copytree("./schemas", tmp_path / "schemas")
+    git = ["git", "-c", "user.name=test", "-c", "user.email=test@test.com"]
+    subprocess.run(git + ["init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(git + ["add", "-A"], cwd=tmp_path, check=True)
+    subprocess.run(git + ["commit", "-q", "-m", "init"], cwd=tmp_path, check=True)
+    project = Project(path=str(tmp_path / "reflekt_project.yml"))
+    cart_viewed = tmp_path / "schemas/jaffle_shop/Cart_Viewed/1-0.json"
+    cart_viewed.write_text(cart_viewed.read_text().replace("viewed", "looked at"))
+    new_schema = tmp_path / "schemas/jaffle_shop/Cart_Viewed/2-0.json"
+    shutil.copy(cart_viewed, new_schema)  # Untracked
+
+    catalog = SchemaCatalog(project, changed_since="HEAD")
+
+    assert catalog.select("") == [cart_viewed, new_schema]
+    assert catalog.select("jaffle_shop/Cart_Viewed/2-0") == [new_schema]
+    assert catalog.select("jaffle_shop/Order_Completed") == []
+
+    # Changes to reflekt_project.yml affect every schema
+    with (tmp_path / "reflekt_project.yml").open("a") as f:
+        f.write("\n")
+
+    catalog = SchemaCatalog(project, changed_since="HEAD")
+
+    assert catalog.select("") == SchemaCatalog(project).select("")
+
+    with pytest.raises(ChangedSinceArgError):
+        SchemaCatalog(project, changed_since="does-not-exist").select("")
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX file modes")
+def test_atomic_write_permissions(tmp_path):
+    """Test that new files get the umask's permissions and rewrites keep theirs."""
+    new_file = tmp_path / "new.json"
+    kept_file = tmp_path / "kept.json"
+    kept_file.write_bytes(b"{}")
+    kept_file.chmod(0o600)
+    umask = os.umask(0o027)
+
+    try:
+        atomic_write(new_file, b"{}")
+        atomic_write(kept_file, b"[]")
+    finally:
+        os.umask(umask)
+
+    assert new_file.stat().st_mode & 0o777 == 0o640
+    assert kept_file.stat().st_mode & 0o777 == 0o600
+    assert kept_file.read_bytes() == b"[]"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["kept.json", "new.json"]
@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2022 Gregory Clunies <greg@reflekt-ci.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import io
+import json
+from pathlib import Path
+
+from reflekt.constants import LintFormatEnum
+from reflekt.lint_format import get_lint_writer
+from reflekt.linter import LintViolation
+
+BASE_DIR = Path("/project").absolute()
+VIOLATIONS = [
+    (
+        BASE_DIR / "schemas/jaffle_shop/Cart_Viewed/1-0.json",
+        LintViolation(
+            "jaffle_shop/Cart_Viewed/1-0.json",
+            "property_casing",
+            "Property 'CartId' does not match naming convention.",
+            pointer="/properties/CartId",
+        ),
+    ),
+    (
+        BASE_DIR / "schemas/jaffle_shop/Order_Completed/1-0.json",
+        LintViolation(
+            "jaffle_shop/Order_Completed/1-0.json",
+            "property_description",
+            "Property 'total' is missing a description.",
+            pointer="/properties/total",
+        ),
+    ),
+]
+
+
+def _write(format: LintFormatEnum) -> str:
+    stream = io.StringIO()
+    writer = get_lint_writer(format, stream=stream, base_dir=BASE_DIR)
+    writer.start()
+
+    for schema_path, violation in VIOLATIONS:
+        writer.write(schema_path, violation)
+
+    writer.finish()
+
+    assert writer.count_errors == len(VIOLATIONS)
+
+    return stream.getvalue()
+
+
+def test_jsonl_writer():
+    """Test that each lint error is written as one JSON record per line."""
+    lines = _write(LintFormatEnum.jsonl).splitlines()
+
+    assert [json.loads(line) for line in lines] == [
+        {**violation.to_dict(), "path": str(schema_path)}
+        for schema_path, violation in VIOLATIONS
+    ]
+
+
+def test_sarif_writer():
+    """Test that the streamed SARIF log is valid JSON with one result per error."""
+    sarif = json.loads(_write(LintFormatEnum.sarif))
+    run = sarif["runs"][0]
+    rules = run["tool"]["driver"]["rules"]
+
+    assert sarif["version"] == "2.1.0"
+    assert [rule["id"] for rule in rules] == ["property_casing", "property_description"]
+    assert [
+        (
+            rules[result["ruleIndex"]]["id"],
+            result["locations"][0]["physicalLocation"]["artifactLocation"]["uri"],
+            result["locations"][0]["logicalLocations"][0]["fullyQualifiedName"],
+        )
+        for result in run["results"]
+    ] == [
+        (
+            "property_casing",
+            "schemas/jaffle_shop/Cart_Viewed/1-0.json",
+            "/properties/CartId",
+        ),
+        (
+            "property_description",
+            "schemas/jaffle_shop/Order_Completed/1-0.json",
+            "/properties/total",
+        ),
+    ]
+
+
+def test_sarif_writer_no_errors():
+    """Test that the SARIF log is valid JSON when there are no lint errors."""
+    stream = io.StringIO()
+    writer = get_lint_writer(LintFormatEnum.sarif, stream=stream)
+    writer.start()
+    writer.finish()
+
+    assert json.loads(stream.getvalue())["runs"][0]["results"] == []
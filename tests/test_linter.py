@@ -0,0 +1,433 @@
+# SPDX-FileCopyrightText: 2022 Gregory Clunies <greg@reflekt-ci.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import copy
+import json
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+from jsonschema import Draft7Validator
+
+import reflekt.linter
+from reflekt.catalog import SchemaCatalog
+from reflekt.lint_profile import LintProfile
+from reflekt.linter import RULES, Linter, PropertyIndex, register_rule
+from reflekt.project import Project
+
+
+def _load_schema(schema_path: str) -> dict:
+    with Path(schema_path).open() as f:
+        return json.load(f)
+
+
+def test_lint_schema():
+    """Test that a valid schema lints without errors."""
+    project = Project(path="./reflekt_project.yml")
+    linter = Linter(project=project)
+    errors = []
+    linter.lint_schema(
+        _load_schema("./schemas/jaffle_shop/Cart_Viewed/1-0.json"), errors
+    )
+
+    assert errors == []
+
+
+def test_lint_does_not_rediscover_project(monkeypatch):
+    """Test that linting reuses the Linter's project instead of discovering it.
+
+    Lint cost should grow with the number of schemas, not with the number of
+    properties times the cost of finding and validating reflekt_project.yml.
+    """
+    project = Project(path="./reflekt_project.yml")
+    linter = Linter(project=project)
+    r_schema = _load_schema("./schemas/jaffle_shop/Cart_Viewed/1-0.json")
+    count_project_init = 0
+    original_init = Project.__init__
+
+    def counting_init(self, *args, **kwargs):
+        nonlocal count_project_init
+        count_project_init += 1
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(Project, "__init__", counting_init)
+    errors = []
+
+    for _ in range(200):
+        linter.lint_schema(copy.deepcopy(r_schema), errors)
+
+    assert errors == []
+    assert count_project_init == 0
+
+
+def test_lint_compiles_meta_schema_once(monkeypatch):
+    """Test that the meta-schema validator is built in __init__, not per schema."""
+    project = Project(path="./reflekt_project.yml")
+    linter = Linter(project=project)
+    r_schema = _load_schema("./schemas/jaffle_shop/Cart_Viewed/1-0.json")
+    invalid_schema = copy.deepcopy(r_schema)
+    invalid_schema["description"] = 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Draft7Validator built while linting")
+
+    monkeypatch.setattr(reflekt.linter, "Draft7Validator", fail)
+    errors = []
+    linter.lint_schema(r_schema, errors)
+
+    assert errors == []
+
+    linter.lint_schema(invalid_schema, errors)
+
+    assert len(errors) == 1
+    assert "Schema validation error in 'description'" in errors[0]
+
+
+def test_lint_custom_rule_visits_each_property_once(monkeypatch):
+    """Test that registered rules run in the single pass over properties."""
+    monkeypatch.setattr(reflekt.linter, "RULES", list(RULES))
+    visited = []
+
+    @register_rule("no_foo_property", "property")
+    def lint_no_foo_property(c, abs_path, prop_name, prop_dict):
+        visited.append(prop_name)
+
+        if "foo" in prop_name:
+            yield f"Property '{prop_name}' in {abs_path} contains 'foo'."
+
+    project = Project(path="./reflekt_project.yml")
+    linter = Linter(project=project)
+    r_schema = _load_schema("./schemas/jaffle_shop/Cart_Viewed/1-0.json")
+    r_schema["properties"]["foo_id"] = {"type": "string", "description": "Foo."}
+    errors = []
+    linter.lint_schema(r_schema, errors)
+
+    nested = list(r_schema["properties"]["products"]["items"]["properties"])
+    top_level = list(r_schema["properties"])
+    i = top_level.index("products") + 1
+
+    assert visited == top_level[:i] + nested + top_level[i:]
+    assert errors == [
+        f"Property 'foo_id' in {project.dir / 'schemas' / r_schema['$id']} "
+        f"contains 'foo'. (at '/properties/foo_id')"
+    ]
+
+
+def test_lint_nested_properties():
+    """Test that nested object properties and array items are linted."""
+    project = Project(path="./reflekt_project.yml")
+    linter = Linter(project=project, use_cache=False)
+    r_schema = _load_schema("./schemas/jaffle_shop/Cart_Viewed/1-0.json")
+    products = r_schema["properties"]["products"]
+    products["items"]["properties"]["ProductDetails"] = {
+        "description": "Product details.",
+        "type": "object",
+        "properties": {
+            "color/Size": {"type": "string", "description": "Color and size."},
+            "tags": {
+                "description": "Tags.",
+                "type": "array",
+                "items": {"type": "object", "properties": {"label": {}}},
+            },
+        },
+    }
+    violations = linter.check_schema(r_schema)
+    pointer = "/properties/products/items/properties/ProductDetails"
+
+    assert [(v.rule, v.pointer) for v in violations] == [
+        ("property_casing", pointer),
+        ("property_casing", f"{pointer}/properties/color~1Size"),
+        ("property_description", f"{pointer}/properties/tags/items/properties/label"),
+        ("property_has_type", f"{pointer}/properties/tags/items/properties/label"),
+    ]
+
+
+def test_lint_deeply_nested_schema():
+    """Test that properties are linted at any depth, past Python's recursion limit.
+
+    Property rules are run without meta-schema validation, which is done by
+    jsonschema (and recurses into every level of the schema).
+    """
+    project = Project(path="./reflekt_project.yml")
+    linter = Linter(project=project, use_cache=False)
+    linter._iter_meta_errors = Draft7Validator(schema={}).iter_errors  # Rules only
+
+    def nested_schema(depth: int) -> dict:
+        name = {"type": "string", "description": "Name."}
+        node = {"type": "object", "description": "Leaf.", "properties": {}}
+        node["properties"]["BadName"] = name  # Deepest level
+
+        for _ in range(depth):
+            node = {
+                "type": "array",
+                "description": "Level.",
+                "items": {
+                    "type": "object",
+                    "properties": {"child": node, "name": name},
+                },
+            }
+
+        r_schema = _load_schema("./schemas/jaffle_shop/Cart_Viewed/1-0.json")
+        r_schema["properties"] = {"root": node}
+
+        return r_schema
+
+    for depth in (1, 300, 3000):
+        violations = linter.check_schema(nested_schema(depth))
+
+        assert [v.rule for v in violations] == ["property_casing"]
+        assert violations[0].pointer.count("/child/") == depth
+        assert violations[0].pointer.endswith("/child/properties/BadName")
+
+
+def test_lint_numbers_convention():
+    """Test that the rule engine reports names with numbers as the old checks did."""
+    project = Project(path="./reflekt_project.yml")
+    r_schema = _load_schema("./schemas/jaffle_shop/Cart_Viewed/1-0.json")
+    r_schema["properties"]["step_2"] = {"type": "integer", "description": "Step."}
+    errors = []
+    Linter(project=project).lint_schema(r_schema, errors)
+
+    assert len(errors) == 1
+    assert "numbers: False" in errors[0]
+
+    project.conventions["property"]["numbers"] = True
+    errors = []
+    Linter(project=project).lint_schema(r_schema, errors)
+
+    assert len(errors) == 2
+    assert "casing: snake" in errors[0]
+    assert "numbers: True" in errors[1]
+
+
+def test_lint_jobs_matches_serial(tmp_path):
+    """Test that linting in a process pool returns the serial results, in order."""
+    shutil.copy("./tests/fixtures/reflekt_project.yml", tmp_path)
+    shutil.copytree("./schemas", tmp_path / "schemas")
+    bad_schema = tmp_path / "schemas/jaffle_shop/Cart_Viewed/1-0.json"
+    bad_schema.write_text(bad_schema.read_text().replace("cart_id", "CartId"))
+    project = Project(path=str(tmp_path / "reflekt_project.yml"))
+    catalog = SchemaCatalog(project, use_cache=False)
+    schema_paths = catalog.select("")
+    linter = Linter(project=project, use_cache=False)
+    serial = list(linter.iter_lint(schema_paths, catalog=catalog, jobs=1))
+    parallel = list(linter.iter_lint(schema_paths, catalog=catalog, jobs=2))
+
+    assert [path for path, _ in parallel] == schema_paths
+    assert parallel == serial
+    assert any(
+        violation.rule == "property_casing" for _, vs in serial for violation in vs
+    )
+
+
+def test_lint_property_consistency(tmp_path):
+    """Test that properties defined differently across schemas are errors."""
+    shutil.copy("./tests/fixtures/reflekt_project.yml", tmp_path)
+    shutil.copytree("./schemas", tmp_path / "schemas")
+    project = Project(path=str(tmp_path / "reflekt_project.yml"))
+    catalog = SchemaCatalog(project, use_cache=False)
+    schema_paths = catalog.select("")
+    linter = Linter(project=project, use_cache=False)
+
+    assert list(linter.check_consistency(schema_paths, catalog)) == []
+
+    # 'cart_id' is a string elsewhere, and nested 'product_id' a string too
+    bad_schema = tmp_path / "schemas/jaffle_shop/Cart_Viewed/1-0.json"
+    r_schema = json.loads(bad_schema.read_text())
+    r_schema["properties"]["cart_id"]["type"] = "integer"
+    products = r_schema["properties"]["products"]["items"]["properties"]
+    products["product_id"]["format"] = "uuid"
+    bad_schema.write_text(json.dumps(r_schema))
+    catalog = SchemaCatalog(project, use_cache=False)
+    results = list(linter.check_consistency(schema_paths, catalog))
+
+    assert [(path, v.rule, v.pointer) for path, v in results] == [
+        (bad_schema, "property_consistency", "/properties/cart_id"),
+        (
+            bad_schema,
+            "property_consistency",
+            "/properties/products/items/properties/product_id",
+        ),
+    ]
+    assert "has type 'integer', but is defined with type 'string'" in str(results[0][1])
+
+    # Schemas with 'lint: false' are not compared
+    r_schema["self"]["lint"] = False
+    bad_schema.write_text(json.dumps(r_schema))
+    catalog = SchemaCatalog(project, use_cache=False)
+
+    assert list(linter.check_consistency(schema_paths, catalog)) == []
+
+
+def test_property_index_expected_definition():
+    """Test that the definition used most often is the expected one."""
+    index = PropertyIndex()
+    definitions = [
+        {"type": ["string", "null"]},
+        {"type": ["null", "string"], "enum": ["a", None]},  # Same type, any order
+        {"type": "string"},
+    ]
+
+    for i, prop_dict in enumerate(definitions):
+        r_schema = {"$id": f"{i}.json", "properties": {"plan": prop_dict}}
+        index.add(Path(f"{i}.json"), r_schema)
+
+    conflicts = list(index.conflicts())
+
+    assert [path for path, _ in conflicts] == [Path("2.json")]
+    assert (
+        'has type \'string\', but is defined with type ["null", "string"] in 2 '
+        "other place(s) (e.g., '0.json')"
+    ) in conflicts[0][1].message
+
+
+def test_property_index_ignores_enum_and_description():
+    """Test that enum and description differences are not conflicts, on purpose."""
+    index = PropertyIndex()
+    definitions = [
+        {"type": "string", "enum": ["segment", "avo"], "description": "Registry."},
+        {"type": "string", "enum": ["segment"], "description": "Registry pushed to."},
+        {"type": "string"},
+    ]
+
+    for i, prop_dict in enumerate(definitions):
+        r_schema = {"$id": f"{i}.json", "properties": {"registry": prop_dict}}
+        index.add(Path(f"{i}.json"), r_schema)
+
+    assert list(index.conflicts()) == []
+
+
+def test_lint_profile(tmp_path):
+    """Test that --timings counts rule calls and merges worker timings."""
+    shutil.copy("./tests/fixtures/reflekt_project.yml", tmp_path)
+    shutil.copytree("./schemas", tmp_path / "schemas")
+    project = Project(path=str(tmp_path / "reflekt_project.yml"))
+    catalog = SchemaCatalog(project, use_cache=False)
+    schema_paths = catalog.select("")
+    expected = list(Linter(project, use_cache=False).iter_lint(schema_paths, catalog))
+    profiles = []
+
+    for jobs in (1, 2):
+        profile = LintProfile(count_slowest=3)
+        linter = Linter(project=project, use_cache=False, profile=profile)
+
+        assert list(linter.iter_lint(schema_paths, catalog, jobs=jobs)) == expected
+
+        profiles.append(profile.to_dict())
+
+    for data in profiles:
+        calls = {stats["rule"]: stats["calls"] for stats in data["rules"]}
+        seconds = [stats["seconds"] for stats in data["rules"]]
+
+        assert data["count_schemas"] == len(schema_paths)
+        assert calls["meta_schema"] == calls["event_casing"] == len(schema_paths)
+        assert calls["property_casing"] > len(schema_paths)
+        assert seconds == sorted(seconds, reverse=True)
+        assert len(data["slowest_schemas"]) == 3
+
+    assert [stats["calls"] for stats in profiles[0]["rules"]] == [
+        {stats["rule"]: stats["calls"] for stats in profiles[1]["rules"]}[stats["rule"]]
+        for stats in profiles[0]["rules"]
+    ]
+
+    path = LintProfile().write(tmp_path / ".logs" / "lint_profile.json")
+
+    assert json.loads(path.read_text())["rules"] == []
+
+
+def test_lint_cache(tmp_path, monkeypatch):
+    """Test unchanged schemas reuse cached lint results, including errors."""
+    shutil.copy("./tests/fixtures/reflekt_project.yml", tmp_path)
+    shutil.copytree("./schemas", tmp_path / "schemas")
+    bad_schema = tmp_path / "schemas/jaffle_shop/Cart_Viewed/1-0.json"
+    bad_schema.write_text(bad_schema.read_text().replace("cart_id", "CartId"))
+    project = Project(path=str(tmp_path / "reflekt_project.yml"))
+    catalog = SchemaCatalog(project)
+    schema_paths = catalog.select("")
+    expected = list(Linter(project=project).iter_lint(schema_paths, catalog))
+    count_checks = 0
+    original_check_schema = Linter.check_schema
+
+    def counting_check_schema(self, r_schema):
+        nonlocal count_checks
+        count_checks += 1
+        return original_check_schema(self, r_schema)
+
+    monkeypatch.setattr(Linter, "check_schema", counting_check_schema)
+    catalog = SchemaCatalog(project)
+
+    assert list(Linter(project=project).iter_lint(schema_paths, catalog)) == expected
+    assert count_checks == 0
+
+    # Edited schemas are linted again
+    bad_schema.write_text(bad_schema.read_text().replace("CartId", "cart_id"))
+    catalog = SchemaCatalog(project)
+    results = dict(Linter(project=project).iter_lint(schema_paths, catalog))
+
+    assert count_checks == 1
+    assert results[bad_schema] == []
+
+    # Changed conventions invalidate all results, --no-cache ignores them
+    project.conventions["property"]["reserved"].append("cart_id")
+    catalog = SchemaCatalog(project)
+    list(Linter(project=project).iter_lint(schema_paths, catalog))
+
+    assert count_checks == 1 + len(schema_paths)
+
+    catalog = SchemaCatalog(project, use_cache=False)
+    list(Linter(project=project, use_cache=False).iter_lint(schema_paths, catalog))
+
+    assert count_checks == 1 + 2 * len(schema_paths)
+
+
+def test_lint_cache_parses_each_schema_once(tmp_path, monkeypatch):
+    """Test that cache keys hash raw bytes, and the parse cache is saved."""
+    shutil.copy("./tests/fixtures/reflekt_project.yml", tmp_path)
+    shutil.copytree("./schemas", tmp_path / "schemas")
+    project = Project(path=str(tmp_path / "reflekt_project.yml"))
+    count_parses = 0
+    original_parse = SchemaCatalog._parse
+
+    def counting_parse(self, key):
+        nonlocal count_parses
+        count_parses += 1
+        return original_parse(self, key)
+
+    monkeypatch.setattr(SchemaCatalog, "_parse", counting_parse)
+
+    for jobs, count_parent_parses in ((1, 1), (2, 0)):  # Workers parse with jobs
+        shutil.rmtree(tmp_path / ".reflekt_cache", ignore_errors=True)
+        catalog = SchemaCatalog(project)
+        schema_paths = catalog.select("")
+        count_parses = 0
+        list(Linter(project=project).iter_lint(schema_paths, catalog, jobs=jobs))
+
+        assert count_parses == count_parent_parses * len(schema_paths)
+        # Parse cache saved by lint alone, without check_consistency()
+        assert catalog._cache_path.exists() == (count_parent_parses > 0)
+
+
+@pytest.mark.benchmark
+def test_lint_schema_benchmark(record_property):
+    """Micro-benchmark of per-schema lint cost (run with `make benchmark`).
+
+    The budget is generous so the benchmark is not flaky on slow machines, but it
+    catches regressions like rebuilding validators or re-discovering the project
+    for every schema or property.
+    """
+    project = Project(path="./reflekt_project.yml")
+    linter = Linter(project=project)
+    r_schema = _load_schema("./schemas/jaffle_shop/Cart_Viewed/1-0.json")
+    count_schemas = 200
+    linter.lint_schema(r_schema, [])  # Warm up
+    start = time.perf_counter()
+
+    for _ in range(count_schemas):
+        linter.lint_schema(r_schema, [])
+
+    per_schema_ms = (time.perf_counter() - start) / count_schemas * 1000
+    record_property("lint_ms_per_schema", round(per_schema_ms, 3))
+
+    assert per_schema_ms < 25
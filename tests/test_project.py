@@ -5,6 +5,7 @@
 import copy
 import os
 import shutil
+import time
 from pathlib import Path
 
 import pytest
@@ -269,3 +270,151 @@ def test_multiple_reflekt_project_files_error():
         Project()
 
     shutil.rmtree(Path("./tests/tmp"))
+
+
+def _make_repo(tmp_path: Path) -> Path:
+    """Create a Git repo with a Reflekt project and a vendored directory."""
+    (tmp_path / ".git").mkdir()
+    shutil.copy(
+        "./tests/fixtures/reflekt_project.yml", tmp_path / "reflekt_project.yml"
+    )
+    vendored_dir = tmp_path / "node_modules" / "some_pkg"
+    vendored_dir.mkdir(parents=True)
+    shutil.copy("./tests/fixtures/reflekt_project.yml", vendored_dir)
+    (tmp_path / "app" / "src").mkdir(parents=True)
+
+    return tmp_path
+
+
+def test_project_discovery_skips_vendored_dirs(tmp_path, monkeypatch):
+    """Test that the repo scan ignores reflekt_project.yml in vendored dirs."""
+    repo = _make_repo(tmp_path)
+    monkeypatch.chdir(repo / "app" / "src")
+    project = Project()
+
+    assert project.path == repo / "reflekt_project.yml"
+
+
+def test_project_discovery_walk(tmp_path, monkeypatch):
+    """Test that 'walk' discovery finds the project in a parent directory."""
+    repo = _make_repo(tmp_path)
+    monkeypatch.chdir(repo / "app" / "src")
+    project = Project(discovery="walk")
+
+    assert project.path == repo / "reflekt_project.yml"
+    assert not (repo / ".reflekt_cache" / "project_discovery.json").exists()
+
+
+def test_project_discovery_cache(tmp_path, monkeypatch):
+    """Test that the repo scan is cached and invalidated when directories change."""
+    repo = _make_repo(tmp_path)
+    monkeypatch.chdir(repo)
+    Project()  # Populate cache
+
+    assert (repo / ".reflekt_cache" / "project_discovery.json").exists()
+
+    def fail_walk(*args, **kwargs):
+        raise AssertionError("Repo should not be scanned when the cache is valid")
+
+    monkeypatch.setattr(os, "walk", fail_walk)
+    project = Project()  # Cache hit
+    monkeypatch.undo()
+    monkeypatch.chdir(repo)
+
+    assert project.path == repo / "reflekt_project.yml"
+
+    # Adding another reflekt_project.yml changes its directory's mtime
+    shutil.copy("./reflekt_project.yml", repo / "app" / "reflekt_project.yml")
+
+    with pytest.raises(ProjectError):
+        Project()
+
+
+def test_project_discovery_skip_list(tmp_path, monkeypatch):
+    """Test that only unambiguous dirs are skipped, e.g. not a project in target/."""
+    (tmp_path / ".git").mkdir()
+    project_dir = tmp_path / "analytics" / "target"
+    project_dir.mkdir(parents=True)
+    shutil.copy("./tests/fixtures/reflekt_project.yml", project_dir)
+    venv_dir = tmp_path / "tools" / "env"  # Virtual environment, has a pyvenv.cfg
+    (venv_dir / "lib").mkdir(parents=True)
+    (venv_dir / "pyvenv.cfg").write_text("home = /usr/bin\n")
+    shutil.copy("./tests/fixtures/reflekt_project.yml", venv_dir / "lib")
+    monkeypatch.chdir(tmp_path)
+    project = Project()
+
+    assert project.path == project_dir / "reflekt_project.yml"
+    # The discovery cache at the repo root is not covered by the project .gitignore
+    assert (tmp_path / ".reflekt_cache" / ".gitignore").read_text().endswith("*\n")
+
+
+@pytest.mark.benchmark
+def test_project_discovery_large_repo(tmp_path, monkeypatch, record_property):
+    """Benchmark discovery in a repo of 100k files (run with `make benchmark`)."""
+    repo = _make_repo(tmp_path)
+
+    for i in range(1000):  # 80k vendored files, 20k files in the repo
+        files_dir = tmp_path / ("node_modules" if i < 800 else "app") / f"pkg_{i}"
+        files_dir.mkdir(parents=True)
+
+        for j in range(100):
+            (files_dir / f"file_{j}.js").touch()
+
+    monkeypatch.chdir(repo / "app")
+    timings = {}
+
+    for run in ("scan", "cached", "walk"):
+        start = time.perf_counter()
+        project = Project(discovery="walk" if run == "walk" else "scan")
+        timings[run] = time.perf_counter() - start
+
+        assert project.path == repo / "reflekt_project.yml"
+
+    for run, seconds in timings.items():
+        record_property(f"discovery_{run}_ms", round(seconds * 1000, 1))
+
+    assert timings["scan"] < 2
+    assert timings["cached"] < 0.5
+    assert timings["walk"] < 0.5
+
+
+def test_project_validation_cached(tmp_path, monkeypatch):
+    """Test reflekt_project.yml is only validated again when its content changes."""
+    from reflekt.validation import get_config_validator
+
+    repo = _make_repo(tmp_path)
+    monkeypatch.chdir(repo)
+    count_validations = 0
+    original_validate = Project.validate_project
+
+    def counting_validate(self):
+        nonlocal count_validations
+        count_validations += 1
+        original_validate(self)
+
+    monkeypatch.setattr(Project, "validate_project", counting_validate)
+    Project()
+    Project()
+
+    assert count_validations == 1
+    assert get_config_validator("project") is get_config_validator("project")
+
+    with (repo / "reflekt_project.yml").open("a") as f:
+        f.write("\n# Changed content\n")
+
+    Project()
+
+    assert count_validations == 2
+
+
+def test_invalid_project_not_cached(tmp_path, monkeypatch):
+    """Test that an invalid reflekt_project.yml always fails validation."""
+    repo = _make_repo(tmp_path)
+    monkeypatch.chdir(repo)
+
+    with (repo / "reflekt_project.yml").open("a") as f:
+        f.write("\nversion: not_a_number\n")
+
+    for _ in range(2):
+        with pytest.raises(ProjectError):
+            Project()
@@ -0,0 +1,424 @@
+# SPDX-FileCopyrightText: 2022 Gregory Clunies <greg@reflekt-ci.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import copy
+import json
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from loguru import logger
+
+from reflekt.profile import Profile
+from reflekt.project import Project
+from reflekt.catalog import SchemaCatalog
+from reflekt.errors import ApiResponseError
+from reflekt.registry.segment import (
+    SEGMENT_BATCH_BYTES,
+    SEGMENT_BATCH_SIZE,
+    SegmentRegistry,
+    canonical_rule,
+    iter_batches,
+)
+from tests.mock_api import InFlight, MockApi, MockSegment, make_rules
+
+
+def _registry(api: MockApi, project_dir: Path) -> SegmentRegistry:
+    project = Project(use_defaults=False, path="./tests/fixtures/reflekt_project.yml")
+    project.dir = project_dir  # Keep .reflekt_cache/ and pulled schemas out of repo
+
+    registry = SegmentRegistry(profile=Profile(project=project))
+    registry.base_url = api.url + "/tracking-plans"
+
+    return registry
+
+
+def test_get_segment_follows_cursors(tmp_path):
+    """Test that plans and rules beyond the first page are fetched."""
+    plans = {f"tp_{i}": {"name": f"plan_{i}", "rules": []} for i in range(450)}
+    plans["tp_449"]["rules"] = make_rules(5000)
+    segment = MockSegment(plans)
+
+    with MockApi(segment) as api:
+        registry = _registry(api, tmp_path)
+        s_schemas = registry._get_segment("plan_449")
+
+    assert [s_schema["key"] for s_schema in s_schemas] == [
+        f"Event {i}" for i in range(5000)
+    ]
+    cursors = [
+        request["query"].get("pagination[cursor]")
+        for request in api.requests
+        if request["path"].endswith("/rules")
+    ]
+    assert len(cursors) == 25
+    assert cursors[:2] == [None, "c200"]
+    assert len(api.requests) == 3 + 25  # 450 plans in 3 pages, 5k rules in 25
+
+
+def test_iter_pages_prefetches_next_page(tmp_path):
+    """Test that the next page is requested while the current one is processed."""
+    plans = {"tp_1": {"name": "plan", "rules": make_rules(2000)}}
+    segment = MockSegment(plans)
+
+    for prefetch in (False, True):
+        cursors = []
+        requested = threading.Condition()
+
+        def handle(request):
+            with requested:
+                cursors.append(request["query"].get("pagination[cursor]"))
+                requested.notify_all()
+
+            return segment(request)
+
+        with MockApi(handle) as api:
+            registry = _registry(api, tmp_path)
+            url = registry.base_url + "/tp_1/rules"
+            count_rules = 0
+
+            for i, page in enumerate(registry._iter_pages(url, "rules", prefetch)):
+                next_cursor = f"c{200 * (i + 1)}"
+
+                if i < 9:  # Processing page i, before asking for the next one
+                    with requested:
+                        prefetched = requested.wait_for(
+                            lambda: next_cursor in cursors,
+                            timeout=5 if prefetch else 0,
+                        )
+
+                    assert prefetched == prefetch
+
+                count_rules += len(page)
+
+        assert count_rules == 2000
+        assert cursors == [None] + [f"c{200 * i}" for i in range(1, 10)]
+
+
+def test_plan_id_cache(tmp_path):
+    """Test that plan IDs are cached across commands and refreshed on a 404."""
+    plans = {"tp_1": {"name": "plan", "rules": make_rules(3)}}
+
+    with MockApi(MockSegment(plans)) as api:
+        for _ in range(3):  # E.g., repeated CI runs
+            assert len(_registry(api, tmp_path)._get_segment("plan")) == 3
+
+        paths = [request["path"] for request in api.requests]
+
+        assert paths.count("/tracking-plans") == 1
+        assert paths.count("/tracking-plans/tp_1/rules") == 3
+
+        # Plan re-created with a new ID, the cached ID gets a 404
+        plans["tp_2"] = plans.pop("tp_1")
+        api.requests.clear()
+
+        assert len(_registry(api, tmp_path)._get_segment("plan")) == 3
+        assert [request["path"] for request in api.requests] == [
+            "/tracking-plans/tp_1/rules",
+            "/tracking-plans",
+            "/tracking-plans/tp_2/rules",
+        ]
+
+        # Expired IDs are looked up again
+        registry = _registry(api, tmp_path)
+        registry.plan_cache_ttl = 0
+        api.requests.clear()
+        registry._get_segment("plan")
+
+        assert api.requests[0]["path"] == "/tracking-plans"
+
+    cache_text = (tmp_path / ".reflekt_cache" / "segment_plans.json").read_text()
+
+    assert "test_token" not in cache_text
+    assert [
+        {name: entry["id"] for name, entry in plan_ids.items()}
+        for plan_ids in json.loads(cache_text).values()
+    ] == [{"plan": "tp_2"}]
+
+
+def _push(api: MockApi, tmp_path: Path, select: str, **kwargs) -> list:
+    """Push schemas with a new registry, returning the write requests sent."""
+    registry = _registry(api, tmp_path)
+    catalog = SchemaCatalog(registry.profile.project, use_cache=False)
+    count_requests = len(api.requests)
+    registry.push(select=select, catalog=catalog, **kwargs)
+
+    return [r for r in api.requests[count_requests:] if r["method"] != "GET"]
+
+
+def test_push_sends_only_changed_rules(tmp_path):
+    """Test that push sends only added, changed, and deleted rules."""
+    shutil.copytree("./schemas/jaffle_shop", tmp_path / "schemas/jaffle_shop")
+    segment = MockSegment({})
+
+    with MockApi(segment) as api:
+        # New plan: created, then every rule is added
+        writes = _push(api, tmp_path, "jaffle_shop")
+        rules = segment.plans["tp_1"]["rules"]
+
+        assert [(r["method"], r["path"]) for r in writes] == [
+            ("POST", "/tracking-plans"),
+            ("PATCH", "/tracking-plans/tp_1/rules"),
+        ]
+        assert len(rules) == len(list((tmp_path / "schemas").glob("**/*.json")))
+
+        # Segment returns types as lists, which is not a change
+        for rule in rules:
+            for prop in (
+                rule["jsonSchema"]["properties"]["properties"]
+                .get("properties", {})
+                .values()
+            ):
+                if isinstance(prop.get("type"), str):
+                    prop["type"] = [prop["type"]]
+
+        assert _push(api, tmp_path, "jaffle_shop") == []
+
+        # One schema changed, one deleted, a COMMON rule is kept
+        rules.append({"type": "COMMON", "key": None, "version": 1, "jsonSchema": {}})
+        changed = tmp_path / "schemas/jaffle_shop/Cart_Viewed/1-0.json"
+        changed.write_text(changed.read_text().replace("Unique", "The unique"))
+        deleted = tmp_path / "schemas/jaffle_shop/Product_Clicked/1-0.json"
+        deleted.unlink()
+        writes = _push(api, tmp_path, "jaffle_shop")
+
+        assert [(r["method"], len(r["json"]["rules"])) for r in writes] == [
+            ("PATCH", 1),
+            ("DELETE", 1),
+        ]
+        assert writes[0]["json"]["rules"][0]["key"] == "Cart Viewed"
+        assert writes[1]["json"]["rules"] == [
+            {"type": "TRACK", "key": "Product Clicked", "version": 1}
+        ]
+        assert "COMMON" in [rule["type"] for rule in rules]
+
+        # Pushing one schema never deletes the others
+        changed.write_text(changed.read_text().replace("The unique", "Unique"))
+        writes = _push(api, tmp_path, "jaffle_shop/Cart_Viewed")
+
+        assert [(r["method"], len(r["json"]["rules"])) for r in writes] == [
+            ("PATCH", 1)
+        ]
+
+
+def test_push_dry_run(tmp_path):
+    """Test that --dry-run sends nothing."""
+    shutil.copytree("./schemas/jaffle_shop", tmp_path / "schemas/jaffle_shop")
+    segment = MockSegment({"tp_1": {"name": "jaffle_shop", "rules": make_rules(2)}})
+    remote_rules = copy.deepcopy(segment.plans["tp_1"]["rules"])
+
+    with MockApi(segment) as api:
+        assert _push(api, tmp_path, "jaffle_shop", dry_run=True) == []
+        assert _push(api, tmp_path, "jaffle_shop", delete=True, dry_run=True) == []
+
+    assert [canonical_rule(r) for r in segment.plans["tp_1"]["rules"]] == [
+        canonical_rule(r) for r in remote_rules
+    ]
+
+
+def test_pull_plans_concurrently(tmp_path):
+    """Test that plans matched by a glob share one listing and are fetched at once."""
+    plans = {
+        f"tp_{i}": {"name": f"ecommerce_{i}", "rules": make_rules(3)} for i in range(4)
+    }
+    plans["tp_other"] = {"name": "marketing", "rules": make_rules(1)}
+
+    for concurrency in (1, 4):
+        shutil.rmtree(tmp_path / ".reflekt_cache", ignore_errors=True)
+        in_flight = InFlight(
+            MockSegment(plans),
+            match=lambda request: request["path"].endswith("/rules"),
+            wait_for=concurrency,  # All 4 plans' rules are requested at once
+        )
+
+        with MockApi(in_flight) as api:
+            registry = _registry(api, tmp_path)
+            registry.plan_concurrency = concurrency
+
+            assert registry.pull("ecommerce_*,marketing") == 4 * 3 + 1
+
+        paths = [request["path"] for request in api.requests]
+
+        assert paths.count("/tracking-plans") == 1
+        assert len(paths) == 1 + 5
+        assert in_flight.max_count == concurrency
+
+    for i in range(4):
+        assert len(list((tmp_path / f"schemas/ecommerce_{i}").glob("*/*.json"))) == 3
+
+
+def test_pull_plans_in_running_event_loop(tmp_path):
+    """Test that plans are pulled concurrently when called from an event loop."""
+    plans = {
+        f"tp_{i}": {"name": f"ecommerce_{i}", "rules": make_rules(2)} for i in range(3)
+    }
+
+    async def pull(registry):
+        return registry.pull("ecommerce_*")
+
+    with MockApi(MockSegment(plans)) as api:
+        registry = _registry(api, tmp_path)
+
+        assert asyncio.run(pull(registry)) == 3 * 2
+
+
+def test_push_several_plans(tmp_path):
+    """Test that a comma-separated --select pushes each plan."""
+    for plan_name in ("jaffle_shop", "jaffle_shop_dev"):
+        shutil.copytree("./schemas/jaffle_shop", tmp_path / f"schemas/{plan_name}")
+
+    segment = MockSegment({})
+
+    with MockApi(segment) as api:
+        writes = _push(api, tmp_path, "jaffle_shop_*,jaffle_shop/Cart_Viewed")
+
+    count_schemas = len(list((tmp_path / "schemas/jaffle_shop").glob("**/*.json")))
+
+    assert [r["method"] for r in writes].count("POST") == 2
+    assert sorted(plan["name"] for plan in segment.plans.values()) == [
+        "jaffle_shop",
+        "jaffle_shop_dev",
+    ]
+    assert sorted(len(plan["rules"]) for plan in segment.plans.values()) == [
+        1,
+        count_schemas,
+    ]
+
+
+def test_pull_writes_only_changed_schemas(tmp_path):
+    """Test that pull skips unchanged files and prunes schemas removed in Segment."""
+    segment = MockSegment({"tp_1": {"name": "plan", "rules": make_rules(4)}})
+    schemas_dir = tmp_path / "schemas/plan"
+
+    messages = []
+    sink_id = logger.add(lambda message: messages.append(message.record["message"]))
+
+    with MockApi(segment) as api:
+        registry = _registry(api, tmp_path)
+        registry.pull("plan")
+        mtimes = {p: p.stat().st_mtime_ns for p in schemas_dir.glob("**/*.json")}
+
+        assert len(mtimes) == 4
+        assert all(p.stat().st_mode & 0o777 != 0o600 for p in mtimes)
+
+        time.sleep(0.01)
+        _registry(api, tmp_path).pull("plan")
+
+        assert "Pulled 4 schemas: 0 written, 4 unchanged, 0 deleted" in messages
+        assert {p: p.stat().st_mtime_ns for p in mtimes} == mtimes
+
+        # Event 0 changed, Event 2 and Event 3 deleted (Event 3 was edited locally)
+        rules = segment.plans["tp_1"]["rules"]
+        rules[0]["jsonSchema"]["description"] = "Changed."
+        del rules[2:]
+        edited = schemas_dir / "Event_3/1-0.json"
+        edited.write_text(edited.read_text().replace("Event 3.", "Edited."))
+        _registry(api, tmp_path).pull("plan")
+
+        assert "Pulled 2 schemas: 1 written, 1 unchanged, 0 deleted" in messages
+        assert len(list(schemas_dir.glob("**/*.json"))) == 4  # Only deleted if --prune
+
+        _registry(api, tmp_path).pull("plan", prune=True)
+
+    logger.remove(sink_id)
+
+    assert "Pulled 2 schemas: 0 written, 2 unchanged, 1 deleted" in messages
+    assert f"Deleting [magenta]{schemas_dir / 'Event_2/1-0.json'}[magenta/]" in messages
+    assert sorted(p.parent.name for p in schemas_dir.glob("**/*.json")) == [
+        "Event_0",
+        "Event_1",
+        "Event_3",
+    ]
+    assert not (schemas_dir / "Event_2").exists()
+    assert "Changed." in (schemas_dir / "Event_0/1-0.json").read_text()
+
+
+def test_iter_batches_bounds_count_and_size():
+    """Test that batches are bounded by rule count and serialized size."""
+    rules = make_rules(10)
+    sizes = [len(json.dumps(rule, separators=(",", ":"))) for rule in rules]
+
+    assert [len(b) for b in iter_batches(rules, max_count=4)] == [4, 4, 2]
+    assert [len(b) for b in iter_batches(rules, max_bytes=sum(sizes[:3]) + 2)] == [
+        3,
+        3,
+        3,
+        1,
+    ]
+    assert [len(b) for b in iter_batches(rules, max_bytes=10)] == [1] * 10
+
+
+def test_push_sends_large_plans_in_parallel_batches(tmp_path):
+    """Test that large pushes are split into bounded batches sent in parallel."""
+    rules = make_rules(600)
+
+    for rule in rules[:100]:  # Large rules, batched by size
+        rule["jsonSchema"]["description"] = "x" * 20_000
+
+    for concurrency in (1, 4):
+        segment = MockSegment({"tp_1": {"name": "plan", "rules": []}})
+        in_flight = InFlight(
+            segment,
+            match=lambda request: request["method"] == "PATCH",
+            wait_for=min(concurrency, 2),
+        )
+
+        with MockApi(in_flight) as api:
+            registry = _registry(api, tmp_path)
+            registry.batch_concurrency = concurrency
+            registry._sync_segment("plan", None, copy.deepcopy(rules))
+
+        patches = [r for r in api.requests if r["method"] == "PATCH"]
+
+        assert sorted(canonical_rule(r) for r in segment.plans["tp_1"]["rules"]) == (
+            sorted(canonical_rule(r) for r in rules)
+        )
+        assert all(
+            len(json.dumps(r["json"], separators=(",", ":"))) <= SEGMENT_BATCH_BYTES
+            and len(r["json"]["rules"]) <= SEGMENT_BATCH_SIZE
+            for r in patches
+        )
+        assert len(patches) == 4 + 5  # 100 large rules by size, 500 others by count
+
+        if concurrency == 1:
+            assert in_flight.max_count == 1
+        else:
+            assert 1 < in_flight.max_count <= concurrency
+
+
+def test_push_resumes_after_failed_batch(tmp_path):
+    """Test that pushing again after a failed batch only sends the rest."""
+    rules = make_rules(350)
+    segment = MockSegment({"tp_1": {"name": "plan", "rules": []}})
+    count_patches = []
+
+    def handle(request):
+        if request["method"] == "PATCH":
+            count_patches.append(1)
+
+            if len(count_patches) == 3:
+                return 500, None, {"errors": [{"message": "Timeout"}]}, 0
+
+        return segment(request)
+
+    with MockApi(handle) as api:
+        registry = _registry(api, tmp_path)
+        registry.batch_concurrency = 1
+        registry.transport.max_retries = 0
+
+        with pytest.raises(ApiResponseError):
+            registry._sync_segment("plan", None, copy.deepcopy(rules))
+
+        assert len(segment.plans["tp_1"]["rules"]) == 200  # First two batches
+        api.requests.clear()
+        diff = _registry(api, tmp_path)._sync_segment("plan", None, rules)
+
+    assert len(diff.added) == 150
+    assert sorted(
+        len(r["json"]["rules"]) for r in api.requests if r["method"] == "PATCH"
+    ) == [50, 100]
+    assert len(segment.plans["tp_1"]["rules"]) == 350
@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2022 Gregory Clunies <greg@reflekt-ci.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import subprocess
+import sys
+
+import pytest
+
+# Modules that must only be imported by the commands that need them
+HEAVY_MODULES = [
+    "sqlalchemy",
+    "snowflake",
+    "redshift_connector",
+    "sqlalchemy_redshift",
+    "segment",
+    "requests",
+    "git",
+    "pkg_resources",
+]
+IMPORT_TIME_BUDGET_US = 1_500_000  # Generous, catches loading warehouse drivers
+
+
+def _import_times(code: str, *args: str) -> dict:
+    """Run Python with -X importtime and return cumulative import time by module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, *args],
+        capture_output=True,
+        text=True,
+    )
+    import_times = {}
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, module = line.split("|")
+        import_times[module.strip()] = int(cumulative)
+
+    return import_times
+
+
+COMMANDS = pytest.mark.parametrize(
+    "code, args",
+    [
+        ("from reflekt.cli import app; app(prog_name='reflekt')", ["--version"]),
+        ("import reflekt.cli, reflekt.linter", []),  # reflekt lint
+        ("import reflekt.cli, reflekt.reporter.reporter", []),  # reflekt report
+    ],
+    ids=["version", "lint", "report"],
+)
+
+
+@COMMANDS
+def test_cold_start_imports(code, args):
+    """Test that CLI startup does not import warehouse, registry or tracking deps."""
+    import_times = _import_times(code, *args)
+    heavy_imports = [
+        module for module in import_times if module.split(".")[0] in HEAVY_MODULES
+    ]
+
+    assert "reflekt.cli" in import_times
+    assert heavy_imports == []
+
+
+@pytest.mark.benchmark
+@COMMANDS
+def test_cold_start_import_time(code, args, record_property):
+    """Benchmark CLI import time (run with `make benchmark`)."""
+    import_times = _import_times(code, *args)
+    record_property("reflekt_cli_import_us", import_times["reflekt.cli"])
+
+    assert import_times["reflekt.cli"] < IMPORT_TIME_BUDGET_US
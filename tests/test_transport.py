@@ -0,0 +1,238 @@
+# SPDX-FileCopyrightText: 2022 Gregory Clunies <greg@reflekt-ci.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+
+import pytest
+import requests
+
+from reflekt.profile import Profile
+from reflekt.project import Project
+from reflekt.registry.rate_limit import RateLimiter
+from reflekt.registry.segment import SegmentRegistry
+from reflekt.registry.transport import HttpTransport, parse_retry_after
+from tests.mock_api import MockApi, scripted
+
+OK = (200, None, {"data": {"ok": True}}, 0)
+
+
+def _transport(sleeps: list, **kwargs) -> HttpTransport:
+    return HttpTransport(sleep=sleeps.append, **kwargs)
+
+
+def test_transport_reuses_connection():
+    """Test that requests share one keep-alive connection."""
+    with MockApi(scripted(OK)) as api:
+        transport = _transport([])
+
+        for _ in range(5):
+            assert transport.get(f"{api.url}/plans").json() == {"data": {"ok": True}}
+
+        transport.close()
+
+    assert len(api.requests) == 5
+    assert len({request["client"] for request in api.requests}) == 1
+
+
+def test_transport_retries_with_backoff():
+    """Test that 5xx responses are retried with exponential backoff."""
+    error = (503, None, {"errors": []}, 0)
+
+    with MockApi(scripted(error, error, error, OK)) as api:
+        sleeps = []
+        response = _transport(sleeps, backoff_factor=1).get(f"{api.url}/plans")
+
+    assert response.status_code == 200
+    assert len(api.requests) == 4
+    assert len(sleeps) == 3
+
+    for retry, seconds in enumerate(sleeps):  # Jitter keeps 1/2 to 1x the backoff
+        assert 2**retry / 2 <= seconds <= 2**retry
+
+
+def test_transport_honors_retry_after():
+    """Test that 429 responses wait for the Retry-After header."""
+    throttled = (429, {"Retry-After": "7"}, {"errors": []}, 0)
+
+    with MockApi(scripted(throttled, OK)) as api:
+        sleeps = []
+        response = _transport(sleeps).post(f"{api.url}/plans", json={"name": "x"})
+
+    assert response.status_code == 200
+    assert sleeps == [7.0]
+    assert api.requests[1]["json"] == {"name": "x"}
+
+
+def test_transport_does_not_retry_failed_post():
+    """Test that POST is not retried on 5xx, since it may have been processed."""
+    with MockApi(scripted((500, None, {"errors": []}, 0), OK)) as api:
+        sleeps = []
+        response = _transport(sleeps).post(f"{api.url}/plans", json={})
+
+    assert response.status_code == 500
+    assert sleeps == []
+    assert len(api.requests) == 1
+
+
+def test_transport_gives_up_after_max_retries():
+    """Test that the last error response is returned once retries run out."""
+    with MockApi(scripted((502, None, {"errors": []}, 0))) as api:
+        sleeps = []
+        response = _transport(sleeps, max_retries=2).get(f"{api.url}/plans")
+
+    assert response.status_code == 502
+    assert len(api.requests) == 3
+    assert len(sleeps) == 2
+
+
+def test_transport_retries_timeouts():
+    """Test that slow responses time out and are retried."""
+    slow = (200, None, {"data": {"ok": False}}, 1.0)
+
+    with MockApi(scripted(slow, OK)) as api:
+        sleeps = []
+        transport = _transport(sleeps, timeout=0.2)
+
+        assert transport.get(f"{api.url}/plans").json() == {"data": {"ok": True}}
+        assert len(sleeps) == 1
+
+        with pytest.raises(requests.ReadTimeout):  # Not retried for POST
+            api.handle = scripted(slow)
+            _transport([], timeout=0.2).post(f"{api.url}/plans", json={})
+
+
+def test_parse_retry_after():
+    """Test Retry-After in seconds and as an HTTP date."""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0  # In the past
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_segment_registry_uses_transport(tmp_path):
+    """Test that SegmentRegistry requests go through its transport."""
+    plans = {"data": {"trackingPlans": [{"name": "plan", "id": "tp_1"}]}}
+    project = Project(use_defaults=False, path="./tests/fixtures/reflekt_project.yml")
+    project.dir = tmp_path  # Keep .reflekt_cache/ out of the repo
+    registry = SegmentRegistry(profile=Profile(project=project))
+    registry.transport.sleep = lambda seconds: None
+
+    with MockApi(
+        scripted((503, None, {"errors": []}, 0), (200, None, plans, 0))
+    ) as api:
+        registry.base_url = api.url + "/tracking-plans"
+
+        assert registry._get_plan_id("plan") == "tp_1"
+
+    assert len(api.requests) == 2
+    assert api.requests[1]["headers"]["Authorization"] == "Bearer test_token"
+
+
+class FakeClock:
+    """Clock for RateLimiter that only moves when sleep() is called."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_rate_limiter_token_bucket():
+    """Test that requests beyond the burst are queued at the rate."""
+    clock = FakeClock()
+    limiter = RateLimiter(rate=10, burst=2, clock=clock, sleep=clock.sleep)
+
+    assert [limiter.acquire() for _ in range(2)] == [0.0, 0.0]
+    assert limiter.acquire() == pytest.approx(0.1)
+    assert limiter.acquire() == pytest.approx(0.1)
+
+    clock.now += 1.0  # Idle, the bucket refills up to the burst
+    waits = [limiter.acquire() for _ in range(3)]
+
+    assert waits == [0.0, 0.0, pytest.approx(0.1)]
+
+    limiter.pause(2.0)  # 429 Retry-After holds every request
+
+    assert limiter.acquire() == pytest.approx(2.0)
+    assert limiter.to_dict() == {
+        "rate": 10,
+        "burst": 2,
+        "count_requests": 8,
+        "count_waits": 4,
+        "count_throttled": 1,
+        "seconds_waited": pytest.approx(2.3),
+        "max_wait": pytest.approx(2.0),
+    }
+
+
+def test_rate_limiter_shared_by_threads():
+    """Test that concurrent requests queue for tokens at the rate limit."""
+    waits = []  # The clock is frozen, so each request waits for its queued token
+    limiter = RateLimiter(rate=50, burst=1, clock=lambda: 0.0, sleep=waits.append)
+
+    with MockApi(scripted(OK)) as api:
+        transport = _transport([], rate_limiter=limiter)
+
+        def send(count):
+            for _ in range(count):
+                transport.get(f"{api.url}/plans")
+
+        threads = [threading.Thread(target=send, args=(10,)) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+    assert len(api.requests) == 40
+    assert sorted(waits) == pytest.approx([k / 50 for k in range(1, 40)])
+    assert limiter._tokens == pytest.approx(1 - 40)
+    assert limiter.to_dict() == {
+        "rate": 50,
+        "burst": 1,
+        "count_requests": 40,
+        "count_waits": 39,
+        "count_throttled": 0,
+        "seconds_waited": pytest.approx(sum(range(1, 40)) / 50),
+        "max_wait": pytest.approx(39 / 50),
+    }
+
+
+def test_rate_limiter_pauses_on_retry_after():
+    """Test that a 429 Retry-After holds requests through the rate limiter."""
+    throttled = (429, {"Retry-After": "0.3"}, {"errors": []}, 0)
+    clock = FakeClock()
+    limiter = RateLimiter(rate=100, clock=clock, sleep=clock.sleep)
+
+    with MockApi(scripted(throttled, OK)) as api:
+        sleeps = []
+        response = _transport(sleeps, rate_limiter=limiter).get(f"{api.url}/plans")
+
+    assert response.status_code == 200
+    assert sleeps == []  # The transport waits in the rate limiter instead
+    assert limiter.count_throttled == 1
+    assert limiter.seconds_waited == pytest.approx(0.3)
+
+
+def test_registries_share_rate_limiter(tmp_path):
+    """Test that the rate limit in reflekt_project.yml is shared per registry type."""
+    project = Project(use_defaults=False, path="./tests/fixtures/reflekt_project.yml")
+    project.dir = tmp_path
+    project.registry = {"segment": {"rate_limit": {"requests_per_second": 5}}}
+    registries = [SegmentRegistry(profile=Profile(project=project)) for _ in range(2)]
+    limiter = registries[0].transport.rate_limiter
+
+    assert limiter is registries[1].transport.rate_limiter
+    assert (limiter.rate, limiter.burst) == (5, 5)
+
+    project.registry = {}
+
+    assert SegmentRegistry(profile=Profile(project=project)).transport.rate_limiter is (
+        None
+    )